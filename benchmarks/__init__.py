@@ -0,0 +1,3 @@
+'''
+Benchmarks for the Rocket R 60V API.
+'''
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+'''
+Run all benchmarks, optionally store the results as JSON and compare them
+against the results of another commit.
+
+Run them with ``python -m benchmarks --help``.
+'''
+
+import argparse
+import json
+import sys
+
+from . import diff, machine, message
+from .utils import report
+
+MODULES = (
+    message,
+    machine,
+    diff,
+)
+
+
+def main():
+    '''
+    Run the benchmarks.
+
+    :return: The exit code
+    :rtype: int
+    '''
+    parser = argparse.ArgumentParser(description='Run the Rocket R 60V benchmarks.')
+
+    parser.add_argument(
+        '-o', '--output',
+        help='store the results in a JSON file',
+    )
+
+    parser.add_argument(
+        '-c', '--compare',
+        help='compare the results against a JSON file of a previous run',
+    )
+
+    parser.add_argument(
+        '-t', '--threshold',
+        type=float,
+        default=0.1,
+        help='the max. relative slowdown before failing (default: 0.1)',
+    )
+
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+
+    results = {}
+    for module in MODULES:
+        results.update(module.run())
+
+    report(results, baseline)
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=4, sort_keys=True)
+
+    if baseline:
+        regressions = [
+            name for name, ops in results.items()
+            if name in baseline and ops < baseline[name] * (1 - args.threshold)
+        ]
+        for name in regressions:
+            sys.stderr.write(f'Regression of {name} exceeds threshold of {args.threshold:.0%}\n')
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+'''
+Benchmarks for the Rocket memory diff.
+
+Run them with ``python -m benchmarks.diff``.
+'''
+
+import logging
+import random
+
+from rocket_r60v.diff import diff_images
+
+from .utils import measure, report
+
+logging.disable()
+
+IMAGE_SIZE = 0x10000
+
+RANDOM = random.Random(1774)
+
+OLD_IMAGE = bytes(RANDOM.getrandbits(8) for _ in range(IMAGE_SIZE))
+
+EQUAL_IMAGE = bytearray(OLD_IMAGE)
+
+SPARSE_IMAGE = bytearray(OLD_IMAGE)
+for _offset in RANDOM.sample(range(IMAGE_SIZE), 16):
+    SPARSE_IMAGE[_offset] ^= 0xFF
+
+DENSE_IMAGE = bytes(x ^ 0xFF for x in OLD_IMAGE)
+
+
+def diff_equal():
+    '''
+    Compare two equal images.
+    '''
+    return diff_images(OLD_IMAGE, EQUAL_IMAGE)
+
+
+def diff_sparse():
+    '''
+    Compare two images with a few changed bytes.
+    '''
+    return diff_images(OLD_IMAGE, SPARSE_IMAGE)
+
+
+def diff_dense():
+    '''
+    Compare two images in which every byte changed.
+    '''
+    return diff_images(OLD_IMAGE, DENSE_IMAGE)
+
+
+def run(number=20, repetitions=3):
+    '''
+    Run all benchmarks.
+
+    :param int number: The number of calls per repetition
+    :param int repetitions: The number of repetitions
+
+    :return: The operations per second of each benchmark
+    :rtype: dict
+    '''
+    return {
+        'diff.equal': measure(diff_equal, number * 10, repetitions),
+        'diff.sparse': measure(diff_sparse, number * 10, repetitions),
+        'diff.dense': measure(diff_dense, number, repetitions),
+    }
+
+
+if __name__ == '__main__':
+    report(run())
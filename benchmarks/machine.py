@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+'''
+Benchmarks for the Rocket machine, run against the local simulator.
+
+Run them with ``python -m benchmarks.machine``.
+'''
+
+import logging
+
+from rocket_r60v.machine import Machine
+from rocket_r60v.simulator import Simulator
+
+from .utils import measure, report
+
+logging.disable()
+
+
+def run(number=50, repetitions=3):
+    '''
+    Run all benchmarks.
+
+    :param int number: The number of calls per repetition
+    :param int repetitions: The number of repetitions
+
+    :return: The operations per second of each benchmark
+    :rtype: dict
+    '''
+    results = {
+        'machine.construction': measure(Machine, number * 10, repetitions),
+    }
+
+    with Simulator(port=0) as simulator:
+        simulator.write_display('           12.3"')
+
+        machine = Machine(address=simulator.address, port=simulator.port)
+        machine.connect()
+
+        def settings_loop():
+            for name in machine.settings:
+                getattr(machine, name)
+
+        results['machine.settings_loop']     = measure(settings_loop, number, repetitions)
+        results['machine.snapshot']          = measure(machine.snapshot, number, repetitions)
+        results['machine.current_brew_time'] = measure(
+            lambda: machine.current_brew_time, number * 10, repetitions
+        )
+
+        machine.disconnect()
+
+    return results
+
+
+if __name__ == '__main__':
+    report(run())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+'''
+Micro-benchmarks for the Rocket message codec & protocol.
+
+Run them with ``python -m benchmarks.message``.
+'''
+
+import logging
+
+from rocket_r60v.message import Message
+from rocket_r60v.protocol import Protocol
+
+from .utils import measure, report
+
+logging.disable()
+
+DISPLAY_RESPONSE = (
+    'rB0070040'
+    '4252455720424F494C2E203130352A4350524553535552452050524F462E2041'
+    '313A20202020362E30222020342E306248324F2054616E6B2052756E206F7574'
+    '91'
+)
+
+DISPLAY_RESPONSE_BYTES = DISPLAY_RESPONSE.encode()
+
+DISPLAY_REQUEST = Message(command='r', address=0xB007, length=0x40)
+
+PROFILE_DATA = [60, 0, 180, 0, 60, 0, 0, 0, 0, 0, 40, 90, 50, 0, 0]
+
+
+def read_request():
+    '''
+    Build & encode a read request.
+    '''
+    return Message(command='r', address=0xB000, length=1).encode()
+
+
+def cached_read_request():
+    '''
+    Get & encode a cached read request.
+    '''
+    return Message.read_request(0xB000, 1).encode()
+
+
+def write_request():
+    '''
+    Build & encode a write request.
+    '''
+    return Message(command='w', address=22, length=15, data=PROFILE_DATA).encode()
+
+
+def decode_data():
+    '''
+    Decode the data of a display response.
+    '''
+    return Message.decode_data(DISPLAY_RESPONSE)
+
+
+def validate_response():
+    '''
+    Validate a display response.
+    '''
+    return DISPLAY_REQUEST.validate_response(DISPLAY_RESPONSE)
+
+
+def round_trip():
+    '''
+    Build, encode, validate & decode a display read.
+    '''
+    message = Message(command='r', address=0xB007, length=0x40)
+    message.encode()
+    message.validate_response(DISPLAY_RESPONSE)
+    return Message.decode_data(DISPLAY_RESPONSE)
+
+
+PROTOCOL = Protocol()
+PROTOCOL.feed(b'*HELLO*')
+
+
+def protocol_round_trip():
+    '''
+    Send a display read & feed its response through the protocol, without
+    any socket involved.
+    '''
+    PROTOCOL.send(Message(command='r', address=0xB007, length=0x40))
+    return PROTOCOL.feed(DISPLAY_RESPONSE_BYTES)
+
+
+BENCHMARKS = (
+    read_request,
+    cached_read_request,
+    write_request,
+    decode_data,
+    validate_response,
+    round_trip,
+    protocol_round_trip,
+)
+
+
+def run(number=20000, repetitions=5):
+    '''
+    Run all benchmarks.
+
+    :param int number: The number of calls per repetition
+    :param int repetitions: The number of repetitions
+
+    :return: The operations per second of each benchmark
+    :rtype: dict
+    '''
+    return {
+        f'message.{benchmark.__name__}': measure(benchmark, number, repetitions)
+        for benchmark in BENCHMARKS
+    }
+
+
+if __name__ == '__main__':
+    report(run())
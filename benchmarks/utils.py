@@ -0,0 +1,36 @@
+'''
+Helpers for the benchmarks.
+'''
+
+from timeit import repeat
+
+
+def measure(function, number, repetitions):
+    '''
+    Measure the throughput of a function.
+
+    The best repetition is used, as slower repetitions are usually caused by
+    other processes and not by the code itself.
+
+    :param callable function: The function
+    :param int number: The number of calls per repetition
+    :param int repetitions: The number of repetitions
+
+    :return: The operations per second
+    :rtype: float
+    '''
+    return number / min(repeat(function, number=number, repeat=repetitions))
+
+
+def report(results, baseline=None):
+    '''
+    Print the results in a human readable format.
+
+    :param dict results: The operations per second of each benchmark
+    :param dict baseline: The operations per second of the baseline
+    '''
+    for name, ops in results.items():
+        line = f'{name:<40} {ops:>14,.1f} ops/s'
+        if baseline and name in baseline:
+            line += f' ({(ops / baseline[name] - 1) * 100:+.1f}%)'
+        print(line)
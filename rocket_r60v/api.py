@@ -8,9 +8,16 @@ __all__ = (
 
 import logging
 import socket
+import threading
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from time import monotonic, sleep
 
-from .exceptions import RocketConnectionError
+from .connection import Connection
+from .exceptions import RocketConnectionError, ConnectionClosedError, ValidationError
 from .message import Message
+from .timing import Deadline, backoff
+from .worker import PRIORITY_WRITE, PRIORITY_READ
 
 LOGGER = logging.getLogger(__name__)
 
@@ -18,22 +25,52 @@ LOGGER = logging.getLogger(__name__)
 class API:
     '''
     API class which can be used to connect and interact with the Rocket R60V.
+
+    When ``threaded`` is enabled, the API can safely be used by multiple
+    threads. All messages are then sent by the I/O worker of the connection
+    (see :py:class:`rocket_r60v.worker.IOWorker`), which sends writes before
+    reads and reads before background polling (see :py:meth:`priority`).
+
+    The response timeout adapts to the measured round-trip times of the
+    machine, while ``timeout`` is its upper bound. Timed out messages are
+    retried after a jittered exponential backoff, as long as the retry budget
+    of the machine isn't exhausted. A deadline can be set for whole calls
+    (see :py:meth:`deadline`).
+
+    When a ``health`` registry is used, connection errors & timeouts open the
+    circuit of the machine, so that all operations fail fast while the
+    machine is known to be down (see :py:class:`rocket_r60v.health.CircuitBreaker`).
     '''
-    buffer_size = 1024
-    retries     = 3
+    retries             = 3
+    retry_backoff       = 0.05
+    max_retry_backoff   = 1.0
+    max_pipeline_window = 8
+    pipeline_windows    = {}
 
-    def __init__(self, address='192.168.1.1', port=1774, timeout=3.0):
+    def __init__(self, address='192.168.1.1', port=1774, timeout=3.0,  # pylint: disable=too-many-arguments
+                 pipeline=False, pool=None, threaded=False, connect_timeout=None, health=None):
         '''
         Constructor.
 
         :param str address: The IP address of the machine
         :param int port: The port number of the machine
-        :param int buffer_size: The TCP buffer size
+        :param float timeout: The max. response timeout in seconds
+        :param bool pipeline: Pipeline multiple messages (see :py:meth:`send_messages`)
+        :param rocket_r60v.pool.ConnectionPool pool: The (shared) connection pool
+        :param bool threaded: Send all messages via the I/O worker of the connection
+        :param float connect_timeout: The connect timeout in seconds (defaults to ``timeout``)
+        :param rocket_r60v.health.HealthRegistry health: The (shared) health registry
         '''
-        self.address  = address
-        self.port     = port
-        self.timeout  = timeout
-        self.socket  = None
+        self.address         = address
+        self.port            = port
+        self.timeout         = timeout
+        self.connect_timeout = connect_timeout
+        self.pipeline        = pipeline
+        self.pool            = pool
+        self.threaded        = threaded
+        self.health          = health
+        self.local           = threading.local()
+        self.connection      = None
 
     def __del__(self):
         '''
@@ -41,76 +78,543 @@ class API:
         '''
         self.disconnect()
 
+    @property
+    def socket(self):
+        '''
+        The socket of the connection.
+
+        :return: The socket
+        :rtype: socket.socket or None
+        '''
+        return self.connection.socket if self.connection is not None else None
+
     def connect(self):
         '''
         Connect to the machine.
+
+        When a connection pool is used, the pooled connection is used (or
+        established if there's none yet).
+
+        :raises rocket.exceptions.RocketConnectionError: When the connection failed
+        :raises rocket.exceptions.CircuitOpenError: When the machine is known to be down
         '''
-        address = self.address
-        port    = self.port
-        timeout = self.timeout
+        deadline = getattr(self.local, 'deadline', None)
 
-        LOGGER.info('Connecting to %s:%d…', address, port)
+        with self.guard():
+            if self.pool is not None:
+                self.connection = self.pool.get_connection(self.address, self.port, self.timeout,
+                                                           self.connect_timeout, deadline)
+                return
+
+            self.connection = Connection(self.address, self.port, self.timeout, self.connect_timeout)
+            self.connection.connect(deadline)
+
+    def disconnect(self):
+        '''
+        Disconnect from the machine.
+
+        Pooled connections are kept open, as they might be used by others.
+        '''
+        if self.connection is not None and self.pool is None:
+            self.connection.worker.stop()
+            self.connection.disconnect()
+
+    @contextmanager
+    def local_context(self, **values):
+        '''
+        Context manager which overrides thread-local values (e.g. the
+        priority or the deadline) of the current thread.
+
+        :param values: The values
+        '''
+        previous = {x: getattr(self.local, x, None) for x in values}
+
+        for name, value in values.items():
+            setattr(self.local, name, value)
 
         try:
-            self.socket = socket.create_connection((address, port), timeout)
-        except (ConnectionRefusedError, socket.timeout) as ex:
-            error = 'Connection to %s:%d failed'
-            LOGGER.error(error, address, port)
-            raise RocketConnectionError(error % (address, port)) from ex
+            yield
+        finally:
+            for name, value in previous.items():
+                setattr(self.local, name, value)
 
-        data = self.read()
+    @contextmanager
+    def priority(self, priority):
+        '''
+        Context manager which overrides the priority of all messages sent by
+        the current thread (e.g. :py:data:`rocket_r60v.worker.PRIORITY_POLL`
+        for background polling).
 
-        if data != '*HELLO*':
-            error = 'Machine didn\'t say hello ("%s"), connection failed'
-            LOGGER.error(error, data)
-            raise RocketConnectionError(error % data)
+        :param int priority: The priority
+        '''
+        with self.local_context(priority=priority):
+            yield
 
-        LOGGER.info('Connected to %s:%d', address, port)
+    @contextmanager
+    def deadline(self, seconds):
+        '''
+        Context manager which sets a deadline for all messages sent by the
+        current thread (e.g. for a whole batch operation). The timeouts &
+        backoffs of the messages are limited to the deadline, and
+        :py:class:`rocket_r60v.exceptions.DeadlineExceededError` is raised
+        when it's exceeded.
 
-    def disconnect(self):
+        Nested deadlines can't extend the deadline, while ``None`` removes
+        the deadline (e.g. for a rollback).
+
+        .. code-block:: python
+
+            with machine.deadline(0.5):
+                machine.snapshot()
+
+        :param float seconds: The seconds until the deadline or ``None``
         '''
-        Disconnect from the machine.
+        current  = getattr(self.local, 'deadline', None)
+        deadline = None if seconds is None else Deadline(seconds)
+
+        if deadline is not None and current is not None and current.expires < deadline.expires:
+            deadline = current
+
+        with self.local_context(deadline=deadline):
+            yield
+
+    @contextmanager
+    def locked(self, lock):
+        '''
+        Context manager which holds a lock, whose acquisition is limited by
+        the deadline of the current thread.
+
+        :param lock: The lock (e.g. the lock of the connection)
+        :type lock: threading.Lock or threading.RLock
+
+        :raises rocket.exceptions.DeadlineExceededError: When the deadline is exceeded
+        '''
+        deadline = getattr(self.local, 'deadline', None)
+
+        if deadline is None:
+            lock.acquire()
+        else:
+            deadline.acquire(lock)
+
+        try:
+            yield
+        finally:
+            lock.release()
+
+    def get_priority(self, messages):
+        '''
+        Get the priority of messages, which is either the priority of the
+        current thread or derived from the commands of the messages.
+
+        :param list messages: The messages
+
+        :return: The priority
+        :rtype: int
+        '''
+        priority = getattr(self.local, 'priority', None)
+
+        if priority is not None:
+            return priority
+
+        if any(x.command == 'w' for x in messages):
+            return PRIORITY_WRITE
+
+        return PRIORITY_READ
+
+    def guard(self):
+        '''
+        Get the context manager which guards an operation by the circuit
+        breaker of the machine.
+
+        :return: The context manager
+        :rtype: contextlib.AbstractContextManager
+        '''
+        if self.health is None:
+            return nullcontext()
+
+        return self.health.get_breaker(self.address, self.port).guard()
+
+    def get_worker(self):
+        '''
+        Get the I/O worker to which messages must be submitted.
+
+        :return: The worker or ``None`` if the messages are sent directly
+        :rtype: rocket_r60v.worker.IOWorker or None
+        '''
+        if not self.threaded or self.connection is None:
+            return None
+
+        worker = self.connection.worker
+
+        return None if worker.is_current else worker
+
+    def submit(self, worker, messages, function, *args):
+        '''
+        Submit a function to the I/O worker and wait for its result.
+
+        The priority & deadline of the current thread are applied.
+
+        :param rocket_r60v.worker.IOWorker worker: The worker
+        :param list messages: The messages which are sent by the function
+        :param callable function: The function
+        :param args: The arguments of the function
+
+        :return: The result of the function
+        :rtype: mixed
+        '''
+        deadline = getattr(self.local, 'deadline', None)
+
+        def run():
+            with self.local_context(deadline=deadline):
+                return function(*args)
+
+        future = worker.submit(self.get_priority(messages), run)
+
+        return future.result() if deadline is None else deadline.result(future)
+
+    def get_timeout(self):
         '''
-        if self.socket is not None:
-            self.socket.close()
+        Get the response timeout, which is derived from the round-trip times
+        of the connection and limited by the deadline of the current thread.
+
+        :return: The timeout in seconds
+        :rtype: float
+
+        :raises rocket.exceptions.DeadlineExceededError: When the deadline is exceeded
+        '''
+        timeout  = self.connection.rtt.timeout
+        deadline = getattr(self.local, 'deadline', None)
+
+        return timeout if deadline is None else deadline.timeout(timeout)
+
+    def can_retry(self, attempt):
+        '''
+        Check if a failed message can be retried, which withdraws a token
+        from the retry budget of the connection.
+
+        :param int attempt: The number of the failed attempt
+
+        :return: The flag
+        :rtype: bool
+        '''
+        if attempt >= self.retries:
+            return False
+
+        if not self.connection.budget.withdraw():
+            LOGGER.warning('Retry budget of %s:%d is exhausted', self.address, self.port)
+            return False
+
+        return True
+
+    def wait_backoff(self, attempt):
+        '''
+        Wait the jittered exponential backoff before a retry, limited by the
+        deadline of the current thread.
+
+        :param int attempt: The number of the failed attempt
+
+        :raises rocket.exceptions.DeadlineExceededError: When the deadline is exceeded
+        '''
+        delay    = backoff(attempt, self.retry_backoff, self.max_retry_backoff)
+        deadline = getattr(self.local, 'deadline', None)
+
+        if deadline is not None:
+            delay = deadline.timeout(delay)
+
+        LOGGER.debug('Retrying in %.3fs…', delay)
+        sleep(delay)
 
     def read(self):
         '''
-        Read data from the socket.
+        Read a single frame from the connection.
+
+        .. seealso:
+
+            Method :py:meth:`rocket_r60v.connection.Connection.read`
+                The framing of the messages
 
         :return: The data
         :rtype: str
         '''
-        LOGGER.debug('Reading…')
-        data = self.socket.recv(self.buffer_size).decode()
-        LOGGER.debug('Received raw message is "%s"', data)
-        return data
+        return self.connection.read()
 
     def send_message(self, message, attempt=1):
         '''
         Send data (i.e. raw message) to the machine and wait for response.
 
+        Concurrent identical reads (i.e. same address & length) of multiple
+        threads sharing a connection are collapsed into a single read, whose
+        data is returned to all of them.
+
+        :param rocket_r60v.message.Message message: The message
+        :param int attempt: The attempt counter
+
+        :return: The received data
+        :rtype: list
+        '''
+        connection = self.connection
+
+        if attempt == 1 and message.command == 'r' and not (self.threaded and connection.worker.is_current):
+            deadline = getattr(self.local, 'deadline', None)
+            return connection.flights.call(message.envelope, self.exchange_message, message, deadline=deadline)
+
+        return self.exchange_message(message, attempt)
+
+    def exchange_message(self, message, attempt=1):
+        '''
+        Send a message to the machine and wait for response, with retries.
+
         :param rocket_r60v.message.Message message: The message
         :param int attempt: The attempt counter
 
         :return: The received data
         :rtype: list
+
+        :raises socket.timeout: When the response timed out & can't be retried
+        :raises rocket.exceptions.RocketConnectionError: When the connection was lost & can't be retried
+        :raises rocket.exceptions.DeadlineExceededError: When the deadline is exceeded
+        :raises rocket.exceptions.CircuitOpenError: When the machine is known to be down
+        '''
+        worker = self.get_worker()
+
+        if worker is not None:
+            return self.submit(worker, (message,), self.exchange_message, message, attempt)
+
+        with self.guard():
+            return self.retry_message(message, attempt)
+
+    def retry_message(self, message, attempt):
+        '''
+        Send a message to the machine until a response is received or it
+        can't be retried anymore.
+
+        :param rocket_r60v.message.Message message: The message
+        :param int attempt: The attempt counter
+
+        :return: The received data
+        :rtype: list
+        '''
+        connection = self.connection
+
+        while True:
+            timeout = self.get_timeout()
+
+            LOGGER.debug('Sending "%s", attempt %d (timeout %.3fs)…', message, attempt, timeout)
+
+            with self.locked(connection.lock):
+                try:
+                    connection.settimeout(timeout)
+
+                    started = monotonic()
+                    connection.send_message(message)
+                    data = self.receive_response(message)
+
+                    if attempt == 1:
+                        connection.rtt.add_sample(monotonic() - started)
+                    connection.budget.deposit()
+
+                    LOGGER.info('Received message data is "%s"', data)
+
+                    return data
+
+                except socket.timeout:
+                    connection.rtt.add_timeout()
+                    connection.protocol.clear()
+                    if not self.can_retry(attempt):
+                        raise
+                    LOGGER.warning('Timeout occured, retrying…')
+
+                except (ConnectionResetError, BrokenPipeError, ConnectionClosedError) as ex:
+                    connection.protocol.clear()
+                    if not self.can_retry(attempt):
+                        error = 'Connection to %s:%d lost'
+                        LOGGER.error(error, self.address, self.port)
+                        raise RocketConnectionError(error % (self.address, self.port)) from ex
+                    LOGGER.warning('Connection lost, reconnecting…')
+                    connection.reconnect(getattr(self.local, 'deadline', None))
+
+                except BaseException:
+                    connection.protocol.clear()
+                    raise
+
+            self.wait_backoff(attempt)
+            attempt += 1
+
+    def receive_response(self, message):
+        '''
+        Receive the response of a sent message.
+
+        :param rocket_r60v.message.Message message: The message
+
+        :return: The received data
+        :rtype: list
+
+        :raises rocket.exceptions.ValidationError: When the response belongs to another message
+        '''
+        event = self.connection.receive()
+
+        if event.message is not message:
+            error = 'Response "%s" doesn\'t belong to "%s"'
+            LOGGER.error(error, event.message, message)
+            raise ValidationError(error % (event.message, message))
+
+        return event.data
+
+    def send_messages(self, messages, window=None):
+        '''
+        Send multiple messages to the machine and wait for all responses.
+
+        When pipelining is enabled, up to ``window`` messages are sent
+        back-to-back without waiting for their responses. The responses are
+        then matched to the requests by their envelope (see
+        :py:class:`rocket_r60v.protocol.Protocol`). If the machine drops
+        pipelined messages (i.e. a timeout occurs), the connection is
+        re-established, the remaining messages are sent one by one and the
+        pipelining is disabled for the machine. When the connection is lost,
+        it's re-established and the remaining messages are sent one by one.
+
+        .. seealso:
+
+            Method :py:meth:`probe_pipeline_window`
+                The detection of the window size
+
+        :param list messages: The messages
+        :param int window: The max. number of messages in flight
+
+        :return: The received data of each message
+        :rtype: list
+
+        :raises rocket.exceptions.CircuitOpenError: When the machine is known to be down
         '''
-        LOGGER.debug('Sending "%s", attempt %d…', message, attempt)
+        worker = self.get_worker()
+
+        if worker is not None:
+            return self.submit(worker, messages, self.send_messages, messages, window)
+
+        if window is None:
+            window = self.get_pipeline_window()
+
+        if window <= 1:
+            return [self.send_message(message) for message in messages]
+
+        with self.guard(), self.locked(self.connection.lock):
+            return self.send_pipelined_messages(messages, window)
+
+    def send_pipelined_messages(self, messages, window):
+        '''
+        Send multiple messages pipelined to the machine.
+
+        .. seealso:
+
+            Method :py:meth:`send_messages`
+                The pipelining of messages
+
+        :param list messages: The messages
+        :param int window: The max. number of messages in flight
+
+        :return: The received data of each message
+        :rtype: list
+        '''
+        connection = self.connection
+        results    = [None] * len(messages)
+        pending    = deque()
+        index      = 0
+
+        connection.settimeout(self.get_timeout())
 
         try:
-            self.socket.send(message.encode())
-            response = self.read()
+            while index < len(messages) or pending:
+                while index < len(messages) and len(pending) < window:
+                    LOGGER.debug('Sending "%s" pipelined…', messages[index])
+                    connection.send_message(messages[index])
+                    pending.append(index)
+                    index += 1
+
+                event = connection.receive()
+
+                for pending_index in pending:
+                    if messages[pending_index] is event.message:
+                        break
+                else:
+                    error = 'Response of "%s" wasn\'t sent pipelined'
+                    LOGGER.error(error, event.message)
+                    raise ValidationError(error % event.message)
+
+                pending.remove(pending_index)
+
+                results[pending_index] = event.data
+                LOGGER.info('Received message data is "%s"', results[pending_index])
+
+        except (socket.timeout, ConnectionResetError, BrokenPipeError, ConnectionClosedError) as ex:
+            if isinstance(ex, socket.timeout):
+                LOGGER.warning('Timeout occured while pipelining, falling back to serial mode…')
+                self.pipeline_windows[(self.address, self.port)] = 1
+            else:
+                LOGGER.warning('Connection lost while pipelining, reconnecting…')
+
+            connection.reconnect(getattr(self.local, 'deadline', None))
+
+            for pending_index in (*pending, *range(index, len(messages))):
+                results[pending_index] = self.retry_message(messages[pending_index], 1)
+
+        except BaseException:
+            connection.protocol.clear()
+            raise
+
+        return results
+
+    def get_pipeline_window(self):
+        '''
+        Get the pipeline window size of the machine.
+
+        The window size is probed once per machine and then cached.
+
+        :return: The window size
+        :rtype: int
+        '''
+        if not self.pipeline:
+            return 1
+
+        key = (self.address, self.port)
+
+        if key not in self.pipeline_windows:
+            self.pipeline_windows[key] = self.probe_pipeline_window()
+
+        return self.pipeline_windows[key]
+
+    def probe_pipeline_window(self):
+        '''
+        Probe the max. number of pipelined messages the machine can handle.
+
+        Increasing numbers of (harmless) read messages are sent back-to-back,
+        until the machine fails to answer all of them or the max. window size
+        is reached. The max. timeout is used, as bursts are answered slower
+        than single messages.
+
+        :return: The window size
+        :rtype: int
+        '''
+        connection = self.connection
+        window     = 1
+
+        while window < self.max_pipeline_window:
+            size     = min(window * 2, self.max_pipeline_window)
+            messages = [Message.read_request(address, 1) for address in range(size)]
 
-            message.validate_response(response)
+            try:
+                with connection.lock:
+                    connection.settimeout(connection.timeout)
+                    for message in messages:
+                        connection.send_message(message)
+                    for message in messages:
+                        connection.receive()
+            except (socket.timeout, ValidationError):
+                LOGGER.info('Machine failed to answer %d pipelined messages', size)
+                connection.reconnect(getattr(self.local, 'deadline', None))
+                break
 
-            data = Message.decode_data(response)
-            LOGGER.info('Received message data is "%s"', data)
+            window = size
 
-            return data
+        LOGGER.info('Pipeline window of %s:%d is %d', self.address, self.port, window)
 
-        except socket.timeout:
-            if attempt >= self.retries:
-                raise
-            LOGGER.warning('Timeout occured, retrying…')
-            return self.send_message(message, attempt + 1)
+        return window
@@ -0,0 +1,264 @@
+'''
+Rocket asyncio API module.
+'''
+
+__all__ = (
+    'AsyncAPI',
+)
+
+import asyncio
+import logging
+from time import monotonic
+
+from .exceptions import RocketConnectionError, ValidationError
+from .protocol import Protocol
+from .singleflight import AsyncSingleFlight
+from .timing import RTTEstimator, RetryBudget, backoff
+
+LOGGER = logging.getLogger(__name__)
+
+
+class AsyncAPI:
+    '''
+    Asyncio API class which can be used to connect and interact with the
+    Rocket R60V.
+
+    It provides the same semantics as :py:class:`rocket_r60v.api.API`, but
+    uses ``asyncio`` streams instead of blocking sockets. Thus, a single
+    event loop can interact with many machines concurrently. Deadlines can
+    be set with :py:func:`asyncio.wait_for`.
+    '''
+    buffer_size       = 1024
+    retries           = 3
+    retry_backoff     = 0.05
+    max_retry_backoff = 1.0
+
+    def __init__(self, address='192.168.1.1', port=1774, timeout=3.0, connect_timeout=None):
+        '''
+        Constructor.
+
+        :param str address: The IP address of the machine
+        :param int port: The port number of the machine
+        :param float timeout: The max. response timeout in seconds
+        :param float connect_timeout: The connect timeout in seconds (defaults to ``timeout``)
+        '''
+        self.address         = address
+        self.port            = port
+        self.timeout         = timeout
+        self.connect_timeout = timeout if connect_timeout is None else connect_timeout
+        self.rtt             = RTTEstimator(timeout)
+        self.budget          = RetryBudget()
+        self.reader          = None
+        self.writer          = None
+        self.lock            = None
+        self.protocol        = Protocol()
+        self.flights         = AsyncSingleFlight()
+
+    async def connect(self):
+        '''
+        Connect to the machine.
+        '''
+        address = self.address
+        port    = self.port
+
+        LOGGER.info('Connecting to %s:%d…', address, port)
+
+        self.protocol.reset()
+        self.lock = asyncio.Lock()
+
+        try:
+            self.reader, self.writer = await asyncio.wait_for(
+                asyncio.open_connection(address, port),
+                self.connect_timeout
+            )
+        except (OSError, asyncio.TimeoutError) as ex:
+            error = 'Connection to %s:%d failed'
+            LOGGER.error(error, address, port)
+            raise RocketConnectionError(error % (address, port)) from ex
+
+        try:
+            await asyncio.wait_for(self.receive(), self.connect_timeout)
+        except asyncio.TimeoutError as ex:
+            await self.disconnect()
+            error = 'Machine didn\'t say hello, connection to %s:%d failed'
+            LOGGER.error(error, address, port)
+            raise RocketConnectionError(error % (address, port)) from ex
+        except RocketConnectionError:
+            await self.disconnect()
+            raise
+
+        LOGGER.info('Connected to %s:%d', address, port)
+
+    async def disconnect(self):
+        '''
+        Disconnect from the machine.
+        '''
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except OSError:
+                pass
+            self.reader = self.writer = None
+
+    async def __aenter__(self):
+        '''
+        Connect to the machine when entering the context.
+        '''
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *args):
+        '''
+        Disconnect from the machine when leaving the context.
+        '''
+        await self.disconnect()
+
+    async def recv(self):
+        '''
+        Receive data from the stream.
+
+        :return: The data
+        :rtype: bytes
+
+        :raises rocket.exceptions.RocketConnectionError: When the connection was closed
+        '''
+        data = await self.reader.read(self.buffer_size)
+
+        if not data:
+            error = 'Connection to %s:%d closed by machine'
+            LOGGER.error(error, self.address, self.port)
+            raise RocketConnectionError(error % (self.address, self.port))
+
+        return data
+
+    async def read(self):
+        '''
+        Read a single raw frame from the stream.
+
+        .. seealso:
+
+            Method :py:meth:`rocket_r60v.connection.Connection.read`
+                The framing of the blocking connection
+
+        :return: The data
+        :rtype: str
+
+        :raises rocket.exceptions.RocketConnectionError: When the connection was closed
+        '''
+        LOGGER.debug('Reading…')
+
+        frame = self.protocol.next_frame()
+
+        while frame is None:
+            self.protocol.receive_data(await self.recv())
+            frame = self.protocol.next_frame()
+
+        return frame
+
+    async def receive(self):
+        '''
+        Receive the next protocol event from the stream.
+
+        .. seealso:
+
+            Method :py:meth:`rocket_r60v.protocol.Protocol.next_event`
+                The handling of the frames
+
+        :return: The event
+        :rtype: rocket_r60v.protocol.Hello or rocket_r60v.protocol.Response
+
+        :raises rocket.exceptions.RocketConnectionError: When the connection was closed
+        :raises rocket.exceptions.ValidationError: When the response is invalid
+        '''
+        LOGGER.debug('Receiving…')
+
+        event = self.protocol.next_event()
+
+        while event is None:
+            self.protocol.receive_data(await self.recv())
+            event = self.protocol.next_event()
+
+        return event
+
+    async def send_message(self, message):
+        '''
+        Send data (i.e. raw message) to the machine and wait for response.
+
+        Only one message is in flight per connection, concurrent callers are
+        serialised. Concurrent identical reads (i.e. same address & length)
+        are collapsed into a single read, whose data is returned to all tasks.
+
+        :param rocket_r60v.message.Message message: The message
+
+        :return: The received data
+        :rtype: list
+
+        :raises asyncio.TimeoutError: When all attempts timed out
+        '''
+        if message.command == 'r':
+            return await self.flights.call(message.envelope, self.exchange_message, message)
+
+        return await self.exchange_message(message)
+
+    async def exchange_message(self, message):
+        '''
+        Send a message to the machine and wait for response, with retries.
+
+        :param rocket_r60v.message.Message message: The message
+
+        :return: The received data
+        :rtype: list
+
+        :raises asyncio.TimeoutError: When the response timed out & can't be retried
+
+        .. seealso:
+
+            Method :py:meth:`rocket_r60v.api.API.exchange_message`
+                The timeouts & retries of the blocking API
+        '''
+        attempt = 1
+
+        while True:
+            async with self.lock:
+                timeout = self.rtt.timeout
+
+                LOGGER.debug('Sending "%s", attempt %d (timeout %.3fs)…', message, attempt, timeout)
+
+                try:
+                    self.writer.write(self.protocol.send(message))
+                    await self.writer.drain()
+
+                    started = monotonic()
+                    event   = await asyncio.wait_for(self.receive(), timeout)
+
+                    if event.message is not message:
+                        error = 'Response "%s" doesn\'t belong to "%s"'
+                        LOGGER.error(error, event.message, message)
+                        raise ValidationError(error % (event.message, message))
+
+                except asyncio.TimeoutError:
+                    self.rtt.add_timeout()
+                    self.protocol.clear()
+                    if attempt >= self.retries or not self.budget.withdraw():
+                        raise
+                    LOGGER.warning('Timeout occured, retrying…')
+
+                except BaseException:
+                    # Abandon the message when cancelled (e.g. by asyncio.wait_for) or failed.
+                    self.protocol.clear()
+                    raise
+
+                else:
+                    data = event.data
+
+                    if attempt == 1:
+                        self.rtt.add_sample(monotonic() - started)
+                    self.budget.deposit()
+
+                    LOGGER.info('Received message data is "%s"', data)
+
+                    return data
+
+            await asyncio.sleep(backoff(attempt, self.retry_backoff, self.max_retry_backoff))
+            attempt += 1
@@ -0,0 +1,120 @@
+'''
+Rocket asyncio machine module.
+'''
+
+__all__ = (
+    'AsyncMachine',
+)
+
+import logging
+
+from .async_api import AsyncAPI
+from .machine import Machine
+from .memory_map import MEMORY_MAP
+from .planner import plan_reads
+from .registry import LazySettings
+
+LOGGER = logging.getLogger(__name__)
+
+
+class AsyncMachine(AsyncAPI):
+    '''
+    Asyncio API class which can be used to connect and interact with the
+    Rocket R60V.
+
+    The settings are accessed via :py:meth:`get` & :py:meth:`set` instead of
+    instance properties, as properties can't be awaited. The encoding,
+    decoding & validation is done by the regular settings classes.
+    '''
+    read_gap        = Machine.read_gap
+    read_max_length = Machine.read_max_length
+
+    def __init__(self, *args, **kwargs):
+        '''
+        Constructor.
+        '''
+        super().__init__(*args, **kwargs)
+        self.settings = LazySettings(self)
+
+    get_setting = Machine.get_setting
+
+    async def get(self, name):
+        '''
+        Get a setting value from the machine.
+
+        :param str name: The name of the setting
+
+        :return: The setting value
+        :rtype: mixed
+        '''
+        setting = self.get_setting(name)
+
+        if not setting.readable:
+            return setting.get()
+
+        LOGGER.debug('Getting value for %s from machine…', setting.__class__.__name__)
+        return setting.decode(await self.send_message(setting.build_message('r')))
+
+    async def set(self, name, value):
+        '''
+        Set a setting value on the machine.
+
+        :param str name: The name of the setting
+        :param value: The setting value
+
+        :return: The received data
+        :rtype: str
+
+        :raises rocket.exceptions.ValidationError: When response data isn't "OK"
+        '''
+        setting = self.get_setting(name)
+        data    = setting.encode(value)
+
+        LOGGER.debug('Setting value for %s on machine to "%s"…', setting.__class__.__name__, data)
+
+        response = await self.send_message(setting.build_message('w', data))
+        return setting.check_response(response)
+
+    async def read_many(self, names, max_gap=None):
+        '''
+        Read multiple settings from the machine at once.
+
+        .. seealso:
+
+            Method :py:meth:`rocket_r60v.machine.Machine.read_many`
+                The bulk read of the blocking machine
+
+        :param list names: The names of the settings
+        :param int max_gap: The max. number of unused bytes between two settings
+
+        :return: The setting values
+        :rtype: dict
+        '''
+        if max_gap is None:
+            max_gap = self.read_gap
+
+        selected = [(name, self.get_setting(name)) for name in names]
+        values   = {}
+
+        for read in plan_reads(selected, max_gap=max_gap, max_length=self.read_max_length):
+            values.update(read.decode(await self.send_message(read.build_message())))
+
+        for name, setting in selected:
+            if name not in values:
+                values[name] = setting.get()
+
+        return {name: values[name] for name, _ in selected}
+
+    async def snapshot(self, max_gap=None):
+        '''
+        Read all settings from the machine at once.
+
+        The settings are read (and returned) in the order of their memory
+        addresses.
+
+        :param int max_gap: The max. number of unused bytes between two settings
+
+        :return: The setting values
+        :rtype: dict
+        '''
+        return await self.read_many([x.name for x in MEMORY_MAP], max_gap=max_gap)
@@ -0,0 +1,327 @@
+'''
+Rocket telemetry buffer module.
+'''
+
+__all__ = (
+    'Bucket',
+    'SampleBuffer',
+)
+
+import logging
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections import namedtuple
+
+from .telemetry import Sample
+
+LOGGER = logging.getLogger(__name__)
+
+COLUMNS = Sample._fields[1:]
+
+HEADER  = struct.Struct('<4sBQQ')
+MAGIC   = b'R60V'
+VERSION = 1
+
+NAN = float('nan')
+
+
+def aggregate(values):
+    '''
+    Calculate the min, max & mean of float values, ignoring missing values.
+
+    :param values: The non-empty values (e.g. a memory view of a column)
+
+    :return: The ``(min, max, mean)`` tuple or ``None`` if there are no values
+    :rtype: tuple or None
+    '''
+    total = sum(values)
+
+    if total != total:
+        values = [x for x in values if x == x]
+        if not values:
+            return None
+        total = sum(values)
+
+    return (min(values), max(values), total / len(values))
+
+
+class Bucket(namedtuple('Bucket', ('timestamp', 'count') + COLUMNS)):
+    '''
+    A downsampled bucket of samples.
+
+    The timestamp is the start of the bucket in nanoseconds. Each column is a
+    ``(min, max, mean)`` tuple, or ``None`` if the bucket has no values.
+    '''
+    __slots__ = ()
+
+
+class SampleBuffer:
+    '''
+    A fixed-capacity ring buffer for telemetry samples.
+
+    The samples are stored column by column in typed arrays, i.e. the
+    timestamps as 64-bit integer nanoseconds and the values as 32-bit floats
+    (missing values are stored as NaN). Thus, a sample needs 20 bytes and a day
+    of samples at 1 Hz needs less than 2 MB. When the buffer is full, the
+    oldest samples are overwritten.
+
+    The buffer can be fed directly by the telemetry sampler:
+
+    .. code-block:: python
+
+        buffer = SampleBuffer(capacity=86400)
+        buffer.extend(TelemetrySampler(machine, rate=1).samples())
+    '''
+    __slots__ = ('capacity', 'start', 'count', 'columns')
+
+    def __init__(self, capacity=86400):
+        '''
+        Constructor.
+
+        :param int capacity: The max. number of samples
+        '''
+        if capacity < 1:
+            raise ValueError(f'Invalid capacity "{capacity}"')
+
+        self.capacity = capacity
+        self.start    = 0
+        self.count    = 0
+        self.columns  = {'timestamp': array('q', bytes(8 * capacity))}
+
+        for name in COLUMNS:
+            self.columns[name] = array('f', bytes(4 * capacity))
+
+    def __len__(self):
+        '''
+        The number of samples.
+
+        :return: The number of samples
+        :rtype: int
+        '''
+        return self.count
+
+    def __iter__(self):
+        '''
+        Iterate over the samples in chronological order.
+
+        :return: The samples
+        :rtype: generator
+        '''
+        columns = [self.ordered(name) for name in Sample._fields]
+
+        for timestamp, *values in zip(*columns):
+            yield Sample(timestamp / 1e9, *(None if x != x else x for x in values))
+
+    @property
+    def nbytes(self):
+        '''
+        The memory size of the stored columns.
+
+        :return: The size in bytes
+        :rtype: int
+        '''
+        return sum(x.itemsize * len(x) for x in self.columns.values())
+
+    def append(self, sample):
+        '''
+        Append a sample, overwriting the oldest sample when the buffer is full.
+
+        :param Sample sample: The sample
+        '''
+        index = (self.start + self.count) % self.capacity
+
+        if self.count == self.capacity:
+            self.start = (self.start + 1) % self.capacity
+        else:
+            self.count += 1
+
+        self.columns['timestamp'][index] = round(sample.timestamp * 1e9)
+
+        for name in COLUMNS:
+            value = getattr(sample, name)
+            self.columns[name][index] = NAN if value is None else value
+
+    def extend(self, samples):
+        '''
+        Append multiple samples.
+
+        :param samples: The samples
+        :type samples: iterable
+        '''
+        for sample in samples:
+            self.append(sample)
+
+    def clear(self):
+        '''
+        Remove all samples.
+        '''
+        self.start = 0
+        self.count = 0
+
+    def segments(self):
+        '''
+        The index ranges of the samples in chronological order.
+
+        :return: Up to two ``(start, stop)`` ranges
+        :rtype: list
+        '''
+        end = self.start + self.count
+
+        if end <= self.capacity:
+            return [(self.start, end)]
+
+        return [(self.start, self.capacity), (0, end - self.capacity)]
+
+    def views(self, name):
+        '''
+        Zero-copy views of a column in chronological order.
+
+        As the buffer wraps around, the column is split into up to two views.
+        The views are only valid until the next sample is appended.
+
+        :param str name: The column name (``timestamp`` or a sample field)
+
+        :return: The memory views
+        :rtype: tuple
+        '''
+        view = memoryview(self.columns[name])
+        return tuple(view[start:stop] for start, stop in self.segments())
+
+    def ordered(self, name):
+        '''
+        A copy of a column in chronological order.
+
+        :param str name: The column name (``timestamp`` or a sample field)
+
+        :return: The column
+        :rtype: array.array
+        '''
+        column = self.columns[name]
+        result = array(column.typecode)
+
+        for start, stop in self.segments():
+            result += column[start:stop]
+
+        return result
+
+    def downsample(self, interval):
+        '''
+        Downsample the samples into buckets of a fixed duration.
+
+        The bucket boundaries are looked up via binary search on the
+        timestamps and the aggregates are calculated by the builtin ``min``,
+        ``max`` & ``sum`` directly on zero-copy views of the columns. Only
+        buckets with missing values (NaN) are filtered value by value.
+
+        :param float interval: The bucket duration in seconds
+
+        :return: The non-empty buckets
+        :rtype: list
+
+        :raises ValueError: When the interval is shorter than a nanosecond
+        '''
+        step = round(interval * 1e9)
+
+        if step <= 0:
+            raise ValueError(f'Invalid interval "{interval}"')
+
+        timestamps = self.columns['timestamp']
+        columns    = {name: memoryview(self.columns[name]) for name in COLUMNS}
+        buckets    = []
+        pieces     = []
+        begin      = None
+
+        for start, last in self.segments():
+            while start < last:
+                if begin is None or timestamps[start] >= begin + step:
+                    if pieces:
+                        buckets.append(self._bucket(begin, pieces, columns))
+                    begin  = timestamps[start] - timestamps[start] % step
+                    pieces = []
+
+                stop = bisect_left(timestamps, begin + step, start, last)
+                pieces.append((start, stop))
+                start = stop
+
+        if pieces:
+            buckets.append(self._bucket(begin, pieces, columns))
+
+        return buckets
+
+    @staticmethod
+    def _bucket(begin, pieces, columns):
+        '''
+        Aggregate the samples of a bucket.
+
+        :param int begin: The timestamp of the bucket start
+        :param list pieces: The ``(start, stop)`` index ranges of the bucket,
+                            as a bucket might wrap around the buffer end
+        :param dict columns: The memory views of the columns
+
+        :return: The bucket
+        :rtype: Bucket
+        '''
+        if len(pieces) == 1:
+            ((start, stop),) = pieces
+            stats = {name: aggregate(view[start:stop]) for name, view in columns.items()}
+        else:
+            stats = {name: aggregate([x for start, stop in pieces for x in view[start:stop]])
+                     for name, view in columns.items()}
+
+        return Bucket(begin, sum(stop - start for start, stop in pieces), **stats)
+
+    def dump(self, file):
+        '''
+        Dump the samples in chronological order to a binary file.
+
+        :param file: The file opened in binary mode
+        '''
+        file.write(HEADER.pack(MAGIC, VERSION, self.capacity, self.count))
+
+        for name in Sample._fields:
+            column = self.ordered(name)
+            if sys.byteorder != 'little':
+                column.byteswap()
+            column.tofile(file)
+
+    @classmethod
+    def load(cls, file):
+        '''
+        Load samples from a binary file.
+
+        :param file: The file opened in binary mode
+
+        :return: The buffer
+        :rtype: SampleBuffer
+
+        :raises ValueError: When the file isn't a (complete) sample dump
+        '''
+        header = file.read(HEADER.size)
+
+        if len(header) != HEADER.size:
+            raise ValueError('Truncated sample dump header')
+
+        magic, version, capacity, count = HEADER.unpack(header)
+
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('Invalid sample dump')
+
+        if count > capacity:
+            raise ValueError(f'Invalid sample count "{count}" of capacity "{capacity}"')
+
+        buffer       = cls(capacity)
+        buffer.count = count
+
+        for name in Sample._fields:
+            column = array(buffer.columns[name].typecode)
+            try:
+                column.fromfile(file, count)
+            except EOFError as ex:
+                raise ValueError('Truncated sample dump') from ex
+            if sys.byteorder != 'little':
+                column.byteswap()
+            buffer.columns[name][0:count] = column
+
+        return buffer
@@ -0,0 +1,117 @@
+'''
+Rocket setting cache module.
+'''
+
+__all__ = (
+    'SettingCache',
+)
+
+import logging
+import threading
+from time import monotonic
+
+LOGGER = logging.getLogger(__name__)
+
+
+class SettingCache:
+    '''
+    A read-through cache for the raw data of settings.
+
+    The data is cached per memory address & length, each entry with its own
+    TTL (time to live). Writes invalidate all entries which overlap the
+    written memory range.
+    '''
+
+    def __init__(self, clock=monotonic):
+        '''
+        Constructor.
+
+        :param callable clock: The clock which returns the current time in seconds
+        '''
+        self.clock   = clock
+        self.entries = {}
+        self.hits    = 0
+        self.misses  = 0
+        self.lock    = threading.Lock()
+
+    def __len__(self):
+        '''
+        The number of cached entries.
+
+        :return: The number of entries
+        :rtype: int
+        '''
+        return len(self.entries)
+
+    def get(self, address, length):
+        '''
+        Get cached data.
+
+        :param int address: The memory address
+        :param int length: The data length
+
+        :return: The data or ``None`` if it's not cached or expired
+        :rtype: list or None
+        '''
+        with self.lock:
+            entry = self.entries.get((address, length))
+
+            if entry is not None:
+                data, expires = entry
+                if expires is None or expires > self.clock():
+                    self.hits += 1
+                    return data
+                del self.entries[(address, length)]
+
+            self.misses += 1
+            return None
+
+    def put(self, address, length, data, ttl):
+        '''
+        Put data into the cache.
+
+        :param int address: The memory address
+        :param int length: The data length
+        :param list data: The data
+        :param float ttl: The TTL in seconds, ``None`` for no expiry, ``0`` for no caching
+        '''
+        if ttl is not None and ttl <= 0:
+            return
+
+        with self.lock:
+            self.entries[(address, length)] = (data, None if ttl is None else self.clock() + ttl)
+
+    def invalidate(self, address, length):
+        '''
+        Invalidate all entries which overlap a memory range.
+
+        :param int address: The memory address
+        :param int length: The data length
+        '''
+        end = address + length
+
+        with self.lock:
+            for key in [x for x in self.entries if x[0] < end and address < x[0] + x[1]]:
+                LOGGER.debug('Invalidating cached data of %#06X (%d)', *key)
+                del self.entries[key]
+
+    def clear(self):
+        '''
+        Clear the whole cache.
+        '''
+        with self.lock:
+            self.entries.clear()
+
+    @property
+    def stats(self):
+        '''
+        The cache statistics.
+
+        :return: The hits, misses & number of entries
+        :rtype: dict
+        '''
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self.entries),
+        }
@@ -4,9 +4,47 @@ CLI module.
 
 import argparse
 import logging
-from time import sleep
+from time import sleep, strftime
 
+from .config import dump_config, export_config, load_config
+from .diff import MemoryWatcher, diff_files
+from .dump import MemoryDump
+from .memory_map import MEMORY_MAP
 from .message import Message
+from .registry import REGISTRY
+from .simulator import Simulator
+from .telemetry import FORMATS, TelemetrySampler, parse_rate
+
+
+def parse_int(value):
+    '''
+    Parse a decimal or prefixed (e.g. ``0xB000``) integer.
+
+    :param str value: The value
+
+    :return: The integer
+    :rtype: int
+    '''
+    return int(value, 0)
+
+
+def parse_range(value):
+    '''
+    Parse a memory range like ``0xB000:0xB040`` (the end is exclusive).
+
+    :param str value: The value
+
+    :return: The address & length
+    :rtype: tuple
+
+    :raises ValueError: When the range is invalid
+    '''
+    start, end = (parse_int(x) for x in value.split(':'))
+
+    if end <= start:
+        raise ValueError(f'Invalid range "{value}"')
+
+    return start, end - start
 
 
 class CLI:
@@ -64,6 +102,21 @@ class CLI:
             help='the filename of the logfile',
         )
 
+        self.parser.add_argument(
+            '-a', '--address',
+            dest='machine_address',
+            default=self.machine.address,
+            help=f'the IP address of the machine (default: {self.machine.address})',
+        )
+
+        self.parser.add_argument(
+            '-p', '--port',
+            dest='machine_port',
+            type=int,
+            default=self.machine.port,
+            help=f'the port number of the machine (default: {self.machine.port})',
+        )
+
     def init_debug_parsers(self):
         '''
         Initialise the debug parsers for manual reading & writing data.
@@ -78,6 +131,176 @@ class CLI:
             help='continously monitor brew time',
         )
 
+        monitor_parser = self.subparsers.add_parser(
+            'monitor',
+            help='continously sample boiler temperatures & brew time',
+        )
+
+        monitor_parser.add_argument(
+            '--rate',
+            type=parse_rate,
+            default=10.0,
+            help='the sample rate, e.g. "10hz" (default: 10hz)',
+        )
+
+        monitor_parser.add_argument(
+            '--format',
+            choices=FORMATS,
+            default='csv',
+            help='the output format (default: csv)',
+        )
+
+        monitor_parser.add_argument(
+            '--count',
+            type=int,
+            help='the number of samples (default: infinite)',
+        )
+
+        simulate_parser = self.subparsers.add_parser(
+            'simulate',
+            help='run a local machine simulator on the address & port (testing)',
+        )
+
+        simulate_parser.add_argument(
+            '--latency',
+            type=float,
+            default=0.0,
+            help='the response latency in seconds',
+        )
+
+        simulate_parser.add_argument(
+            '--jitter',
+            type=float,
+            default=0.0,
+            help='the max. random response jitter in seconds',
+        )
+
+        simulate_parser.add_argument(
+            '--short-reads',
+            action='store_true',
+            help='send responses in several small chunks',
+        )
+
+        simulate_parser.add_argument(
+            '--drop-rate',
+            type=float,
+            default=0.0,
+            help='the probability of dropped responses',
+        )
+
+        simulate_parser.add_argument(
+            '--corrupt-rate',
+            type=float,
+            default=0.0,
+            help='the probability of invalid checksums',
+        )
+
+        dump_parser = self.subparsers.add_parser(
+            'dump',
+            help='dump a memory range into a binary image (debugging)',
+        )
+
+        dump_parser.add_argument(
+            '--start',
+            type=parse_int,
+            default=0x0000,
+            help='the first memory address (default: 0x0000)',
+        )
+
+        dump_parser.add_argument(
+            '--end',
+            type=parse_int,
+            default=0xB0FF,
+            help='the last memory address (default: 0xB0FF)',
+        )
+
+        dump_parser.add_argument(
+            '--chunk',
+            type=int,
+            default=64,
+            help='the number of bytes per read (default: 64)',
+        )
+
+        dump_parser.add_argument(
+            '--restart',
+            action='store_true',
+            help='restart the dump instead of resuming it',
+        )
+
+        dump_parser.add_argument(
+            'output',
+            nargs='?',
+            default='memory.bin',
+            help='the path of the binary image (default: memory.bin)',
+        )
+
+        export_parser = self.subparsers.add_parser(
+            'export',
+            help='export the configuration of the machine',
+        )
+
+        export_parser.add_argument(
+            '--format',
+            choices=('toml', 'json'),
+            default='toml',
+            help='the output format (default: toml)',
+        )
+
+        apply_parser = self.subparsers.add_parser(
+            'apply',
+            help='apply a configuration file, only changed settings are written',
+        )
+
+        apply_parser.add_argument(
+            '-n', '--dry-run',
+            action='store_true',
+            help='only display the changed settings',
+        )
+
+        apply_parser.add_argument(
+            'config',
+            help='the path of the configuration file (.toml or .json)',
+        )
+
+        diff_parser = self.subparsers.add_parser(
+            'diff',
+            help='display the changed bytes of two memory dumps (debugging)',
+        )
+
+        diff_parser.add_argument(
+            'old',
+            help='the path of the old binary image',
+        )
+
+        diff_parser.add_argument(
+            'new',
+            help='the path of the new binary image',
+        )
+
+        watch_parser = self.subparsers.add_parser(
+            'watch',
+            help='continously display the changed bytes of a memory range (debugging)',
+        )
+
+        watch_parser.add_argument(
+            '--range',
+            type=parse_range,
+            default=(0xB000, 0x40),
+            help='the memory range, e.g. "0xB000:0xB040" (default: 0xB000:0xB040)',
+        )
+
+        watch_parser.add_argument(
+            '--rate',
+            type=parse_rate,
+            help='the poll rate, e.g. "10hz" (default: as fast as possible)',
+        )
+
+        watch_parser.add_argument(
+            '--count',
+            type=int,
+            help='the number of polls (default: infinite)',
+        )
+
         read_parser = self.subparsers.add_parser(
             'read',
             help='manually read memory data (debugging)',
@@ -101,6 +324,12 @@ class CLI:
                 help='the data length (unsigned 16-bit integer)',
             )
 
+            parser.add_argument(
+                '-d', '--decode',
+                action='store_true',
+                help='decode the data into the settings it covers',
+            )
+
         write_parser.add_argument(
             '-r', '--raw',
             action='store_true',
@@ -115,10 +344,13 @@ class CLI:
     def init_setting_parsers(self):
         '''
         Make the machine settings available to the parser.
+
+        The parsers are built from the setting infos of the registry, so that
+        no setting is instantiated.
         '''
-        for name, setting in self.machine.settings.items():
+        for name, info in REGISTRY.items():
 
-            doc = setting.__class__.__doc__.strip()
+            doc = info.cls.__doc__.strip()
             doc = doc[0].lower() + doc[1:-1]
 
             setting_parser = self.subparsers.add_parser(
@@ -126,10 +358,10 @@ class CLI:
                 help=doc,
             )
 
-            if hasattr(setting, 'set'):
+            if info.kind != 'read-only':
                 kwargs = {
                     'nargs': '?',
-                    'choices': setting.choices if hasattr(setting, 'choices') else None
+                    'choices': getattr(info.cls, 'choices', None)
                 }
                 setting_parser.add_argument('value', **kwargs)
 
@@ -140,12 +372,23 @@ class CLI:
         :return: The memory addresses
         :rtype: str
         '''
-        settings = sorted(self.machine.settings.items(), key=lambda x: x[1].address)
         addr = 'DEC HEX  LEN  SETTING\n'
-        for name, setting in settings:
-            addr += f'{setting.address:02d}  {setting.address:#04X} ({setting.length:02d}) {name}\n'
+        for info in MEMORY_MAP:
+            addr += f'{info.address:02d}  {info.address:#04X} ({info.length:02d}) {info.name}\n'
         return addr
 
+    def decode_memory(self, data):
+        '''
+        Decode raw memory data into the settings it covers.
+
+        :param list data: The data sequence, starting at the address argument
+
+        :return: The setting values
+        :rtype: str
+        '''
+        values = MEMORY_MAP.decode(self.args.address, data)
+        return '\n'.join(f'{name}: {value}' for name, value in values.items())
+
     def execute(self):
         '''
         Parse the CLI arguments and execute the actions.
@@ -162,15 +405,34 @@ class CLI:
         }
         logging.basicConfig(**logging_config)
 
+        self.machine.address = args.machine_address
+        self.machine.port    = args.machine_port
+
         if args.action == 'addresses':
             return self.display_addresses()
 
+        if args.action == 'simulate':
+            return self.simulate()
+
+        if args.action == 'diff':
+            return '\n'.join(str(x) for x in diff_files(args.old, args.new))
+
         self.machine.connect()
 
         if args.action in ('read', 'write'):
             return getattr(self, f'execute_{args.action}_action')()
         if args.action == 'monitor-brew-time':
             return self.monitor_brew_time()
+        if args.action == 'monitor':
+            return self.monitor()
+        if args.action == 'dump':
+            return self.dump()
+        if args.action == 'watch':
+            return self.watch()
+        if args.action == 'export':
+            return dump_config(export_config(self.machine), args.format)
+        if args.action == 'apply':
+            return self.apply_config()
 
         return self.execute_machine_action()
 
@@ -181,13 +443,13 @@ class CLI:
         :return: The response
         :rtype: str
         '''
-        message = Message(
-            command='r',
-            address=self.args.address,
-            length=self.args.length,
-        )
+        message = Message.read_request(self.args.address, self.args.length)
+        data    = self.machine.send_message(message)
 
-        return str(self.machine.send_message(message))
+        if self.args.decode:
+            return self.decode_memory(data)
+
+        return str(data)
 
     def execute_write_action(self):
         '''
@@ -204,7 +466,12 @@ class CLI:
             encode_data=(not self.args.raw)
         )
 
-        return str(self.machine.send_message(message))
+        response = str(self.machine.send_message(message))
+
+        if self.args.decode:
+            return f'{response}\n{self.decode_memory(list(bytes.fromhex(message.data)))}'
+
+        return response
 
     def execute_machine_action(self):
         '''
@@ -222,6 +489,28 @@ class CLI:
             return 'OK'
         return str(getattr(machine, action))
 
+    def simulate(self):
+        '''
+        Run a local machine simulator until it's interrupted.
+        '''
+        args = self.args
+
+        simulator = Simulator(
+            address=args.machine_address,
+            port=args.machine_port,
+            latency=args.latency,
+            jitter=args.jitter,
+            short_reads=args.short_reads,
+            drop_rate=args.drop_rate,
+            corrupt_rate=args.corrupt_rate,
+        )
+
+        try:
+            print(f'Starting simulator on {args.machine_address}:{args.machine_port}. Press Ctrl-C to cancel…')
+            simulator.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
     def monitor_brew_time(self):
         '''
         Continuously monitor the brew time.
@@ -236,3 +525,74 @@ class CLI:
                 print(time)
         except KeyboardInterrupt:
             pass
+
+    def dump(self):
+        '''
+        Dump a memory range into a binary image.
+
+        The chunks are pipelined, as long as the machine can handle it.
+
+        :return: The summary
+        :rtype: str
+        '''
+        args = self.args
+        dump = MemoryDump(args.output, start=args.start, end=args.end, chunk=args.chunk)
+
+        self.machine.pipeline = True
+
+        try:
+            count = dump.run(self.machine, resume=not args.restart)
+        except KeyboardInterrupt:
+            return 'Dump interrupted, run the same command again to resume it'
+
+        return (f'Read {count} chunks, the image ({dump.length} bytes) is stored in {dump.path} '
+                f'(index: {dump.index_path})')
+
+    def apply_config(self):
+        '''
+        Apply a configuration file.
+
+        :return: The changed settings
+        :rtype: str
+        '''
+        values = load_config(self.args.config)
+
+        if self.args.dry_run:
+            changed = list(self.machine.diff(values))
+        else:
+            changed = [name for write in self.machine.apply(values, changed_only=True) for name in write.settings]
+
+        return '\n'.join(f'{name}: {values[name]}' for name in changed) if changed else 'No changes'
+
+    def watch(self):
+        '''
+        Continuously display the changed bytes of a memory range.
+        '''
+        args            = self.args
+        address, length = args.range
+        watcher         = MemoryWatcher(self.machine, address, length, interval=1.0 / args.rate if args.rate else 0.0)
+
+        try:
+            print(f'Watching {address:#06X}:{address + length:#06X}. Press Ctrl-C to cancel…', flush=True)
+            for changes in watcher.changes(count=args.count):
+                timestamp = strftime('%H:%M:%S')
+                for change in changes:
+                    print(f'{timestamp} {change}', flush=True)
+        except KeyboardInterrupt:
+            pass
+
+    def monitor(self):
+        '''
+        Continuously sample the boiler temperatures & brew time.
+        '''
+        args             = self.args
+        header, function = FORMATS[args.format]
+        sampler          = TelemetrySampler(self.machine, rate=args.rate)
+
+        try:
+            if header:
+                print(header, flush=True)
+            for sample in sampler.samples(count=args.count):
+                print(function(sample), flush=True)
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,85 @@
+'''
+Rocket configuration file module.
+'''
+
+__all__ = (
+    'CONFIG_SETTINGS',
+    'export_config',
+    'dump_config',
+    'load_config',
+)
+
+import json
+import logging
+
+try:
+    import tomllib
+except ImportError:
+    tomllib = None
+
+from .exceptions import RocketError
+from .memory_map import MEMORY_MAP
+
+LOGGER = logging.getLogger(__name__)
+
+CONFIG_SETTINGS = tuple(x.name for x in MEMORY_MAP if x.kind == 'read-write')
+
+
+def export_config(machine):
+    '''
+    Read the configuration (i.e. all readable & writable settings) of a
+    machine with a bulk read.
+
+    :param rocket_r60v.machine.Machine machine: The (connected) machine
+
+    :return: The setting values
+    :rtype: dict
+    '''
+    return machine.read_many(CONFIG_SETTINGS)
+
+
+def dump_config(values, fmt='toml'):
+    '''
+    Format a configuration as TOML or JSON.
+
+    As the configuration only contains strings & integers, the TOML is written
+    without any additional library.
+
+    :param dict values: The setting values
+    :param str fmt: The format (``toml`` or ``json``)
+
+    :return: The configuration
+    :rtype: str
+    '''
+    if fmt == 'json':
+        return json.dumps(values, indent=2)
+
+    return '\n'.join(f'{name} = {json.dumps(value)}' for name, value in values.items())
+
+
+def load_config(path):
+    '''
+    Load a configuration from a TOML or JSON file.
+
+    :param str path: The path of the file (``.json`` for JSON, TOML otherwise)
+
+    :return: The setting values
+    :rtype: dict
+
+    :raises rocket_r60v.exceptions.RocketError: When the file can't be parsed
+    '''
+    try:
+        if path.endswith('.json'):
+            with open(path, encoding='utf-8') as file:
+                return json.load(file)
+
+        if tomllib is None:
+            raise RocketError('Reading TOML requires Python 3.11+, use a JSON file instead')
+
+        with open(path, 'rb') as file:
+            return tomllib.load(file)
+
+    except (OSError, ValueError) as ex:
+        error = 'Configuration "%s" can\'t be loaded: %s'
+        LOGGER.error(error, path, ex)
+        raise RocketError(error % (path, ex)) from ex
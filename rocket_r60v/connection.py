@@ -0,0 +1,264 @@
+'''
+Rocket connection module.
+'''
+
+__all__ = (
+    'Connection',
+)
+
+import logging
+import select
+import socket
+import threading
+from time import sleep
+
+from .exceptions import RocketConnectionError, ConnectionClosedError
+from .protocol import Protocol
+from .singleflight import SingleFlight
+from .timing import RTTEstimator, RetryBudget, backoff
+from .worker import IOWorker
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Connection:
+    '''
+    A TCP connection to the Rocket R60V. The handshake, the framing and the
+    validation of the messages are handled by its :py:attr:`protocol`.
+
+    A connection can be shared by multiple API instances, thus all message
+    exchanges must hold the connection's :py:attr:`lock`. Alternatively, the
+    message exchanges can be submitted to the connection's :py:attr:`worker`,
+    which executes them by priority in a single I/O thread.
+    '''
+    buffer_size           = 1024
+    reconnect_attempts    = 3
+    reconnect_backoff     = 0.5
+    max_reconnect_backoff = 8.0
+
+    def __init__(self, address, port, timeout, connect_timeout=None):
+        '''
+        Constructor.
+
+        The response timeout is derived from the measured round-trip times of
+        the connection (see :py:attr:`rtt`), ``timeout`` is its upper bound.
+        The retries of all API instances sharing the connection are limited
+        by the connection's retry :py:attr:`budget`.
+
+        :param str address: The IP address of the machine
+        :param int port: The port number of the machine
+        :param float timeout: The max. response timeout in seconds
+        :param float connect_timeout: The connect & handshake timeout in seconds (defaults to ``timeout``)
+        '''
+        self.address         = address
+        self.port            = port
+        self.timeout         = timeout
+        self.connect_timeout = timeout if connect_timeout is None else connect_timeout
+        self.rtt             = RTTEstimator(timeout)
+        self.budget          = RetryBudget()
+        self.socket          = None
+        self.protocol        = Protocol()
+        self.lock            = threading.RLock()
+        self.worker          = IOWorker(f'rocket-io-{address}:{port}')
+        self.flights         = SingleFlight()
+
+    def connect(self, deadline=None):
+        '''
+        Connect to the machine.
+
+        :param rocket_r60v.timing.Deadline deadline: The deadline which limits the connect & handshake timeout
+
+        :raises rocket.exceptions.RocketConnectionError: When the connection or the handshake failed
+        :raises rocket.exceptions.DeadlineExceededError: When the deadline is exceeded
+        '''
+        address = self.address
+        port    = self.port
+        timeout = self.connect_timeout if deadline is None else deadline.timeout(self.connect_timeout)
+
+        LOGGER.info('Connecting to %s:%d…', address, port)
+
+        self.protocol.reset()
+
+        try:
+            self.socket = self.open(timeout)
+        except OSError as ex:
+            error = 'Connection to %s:%d failed'
+            LOGGER.error(error, address, port)
+            raise RocketConnectionError(error % (address, port)) from ex
+
+        try:
+            self.receive()
+        except RocketConnectionError:
+            self.disconnect()
+            raise
+        except OSError as ex:
+            self.disconnect()
+            error = 'Handshake with %s:%d failed'
+            LOGGER.error(error, address, port)
+            raise RocketConnectionError(error % (address, port)) from ex
+
+        LOGGER.info('Connected to %s:%d', address, port)
+
+    def open(self, timeout):
+        '''
+        Open the socket of the connection.
+
+        :param float timeout: The connect & handshake timeout in seconds
+
+        :return: The socket
+        :rtype: socket.socket
+        '''
+        return socket.create_connection((self.address, self.port), timeout)
+
+    def disconnect(self):
+        '''
+        Disconnect from the machine.
+        '''
+        if self.socket is not None:
+            self.socket.close()
+            self.socket = None
+
+    def reconnect(self, deadline=None):
+        '''
+        Re-establish the connection to the machine.
+
+        The connection is retried with a jittered exponential backoff.
+
+        :param rocket_r60v.timing.Deadline deadline: The deadline which limits the timeouts & backoffs
+
+        :raises rocket.exceptions.RocketConnectionError: When all attempts failed
+        :raises rocket.exceptions.DeadlineExceededError: When the deadline is exceeded
+        '''
+        self.disconnect()
+
+        for attempt in range(1, self.reconnect_attempts + 1):
+            try:
+                return self.connect(deadline)
+            except RocketConnectionError:
+                if attempt >= self.reconnect_attempts:
+                    raise
+                delay = backoff(attempt, self.reconnect_backoff, self.max_reconnect_backoff)
+                if deadline is not None:
+                    delay = deadline.timeout(delay)
+                LOGGER.warning('Reconnect to %s:%d failed, retrying in %.1fs…',
+                               self.address, self.port, delay)
+                sleep(delay)
+
+        return None
+
+    def is_healthy(self):
+        '''
+        Check if the connection is still established.
+
+        A socket which is readable but doesn't return any data was closed by
+        the machine.
+
+        :return: The health state
+        :rtype: bool
+        '''
+        if self.socket is None:
+            return False
+
+        try:
+            readable, _, _ = select.select([self.socket], [], [], 0)
+            if readable and not self.socket.recv(1, socket.MSG_PEEK):
+                return False
+        except (OSError, ValueError, TypeError):
+            return False
+
+        return True
+
+    def settimeout(self, timeout):
+        '''
+        Set the timeout of the socket.
+
+        :param float timeout: The timeout in seconds
+        '''
+        self.socket.settimeout(timeout)
+
+    def send(self, data):
+        '''
+        Send data to the machine.
+
+        :param bytes data: The data
+        '''
+        self.socket.sendall(data)
+
+    def send_message(self, message):
+        '''
+        Send a request message to the machine.
+
+        :param rocket_r60v.message.Message message: The message
+        '''
+        self.send(self.protocol.send(message))
+
+    def recv(self):
+        '''
+        Receive data from the machine into the buffer of the protocol.
+
+        :raises rocket.exceptions.ConnectionClosedError: When the connection was closed
+        '''
+        buffer   = self.protocol.buffer
+        received = len(buffer)
+
+        self.protocol.receive_data(self.socket.recv(self.buffer_size))
+
+        if len(buffer) == received:
+            error = 'Connection to %s:%d closed by machine'
+            LOGGER.error(error, self.address, self.port)
+            raise ConnectionClosedError(error % (self.address, self.port))
+
+    def read(self):
+        '''
+        Read a single raw frame from the socket.
+
+        The data is received into a buffer until a complete frame is available.
+        The frame length is derived from the frame itself, thus short reads
+        are handled properly. Remaining bytes stay in the buffer and are used
+        for the next frame.
+
+        .. seealso:
+
+            Method :py:meth:`rocket_r60v.protocol.Protocol.next_frame`
+                The framing of the messages
+
+        :return: The data
+        :rtype: str
+
+        :raises rocket.exceptions.ConnectionClosedError: When the connection was closed
+        '''
+        LOGGER.debug('Reading…')
+
+        frame = self.protocol.next_frame()
+
+        while frame is None:
+            self.recv()
+            frame = self.protocol.next_frame()
+
+        return frame
+
+    def receive(self):
+        '''
+        Receive the next protocol event (i.e. the handshake or a validated
+        response to a sent message).
+
+        .. seealso:
+
+            Method :py:meth:`rocket_r60v.protocol.Protocol.next_event`
+                The handling of the frames
+
+        :return: The event
+        :rtype: rocket_r60v.protocol.Hello or rocket_r60v.protocol.Response
+
+        :raises rocket.exceptions.ConnectionClosedError: When the connection was closed
+        :raises rocket.exceptions.ValidationError: When the response is invalid
+        '''
+        LOGGER.debug('Receiving…')
+
+        event = self.protocol.next_event()
+
+        while event is None:
+            self.recv()
+            event = self.protocol.next_event()
+
+        return event
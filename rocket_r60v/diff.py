@@ -0,0 +1,204 @@
+'''
+Rocket memory diff module.
+'''
+
+__all__ = (
+    'Change',
+    'diff_images',
+    'diff_files',
+    'MemoryWatcher',
+)
+
+import logging
+import mmap
+from collections import namedtuple
+from time import monotonic, sleep
+
+from .dump import MemoryDump
+from .memory_map import MEMORY_MAP
+from .message import Message
+from .worker import PRIORITY_POLL
+
+LOGGER = logging.getLogger(__name__)
+
+BLOCK_SIZE = 4096
+CHUNK_SIZE = 64
+
+
+class Change(namedtuple('Change', ('address', 'old', 'new'))):
+    '''
+    A changed byte of a memory image.
+    '''
+    __slots__ = ()
+
+    @property
+    def names(self):
+        '''
+        The names of the known settings which cover the byte.
+
+        :return: The names
+        :rtype: list
+        '''
+        return [x.name for x in MEMORY_MAP.find(self.address)]
+
+    def __str__(self):
+        '''
+        Format the change (e.g. ``0xB000 105 -> 106 (current_brew_boiler_temperature)``).
+
+        :return: The change
+        :rtype: str
+        '''
+        names = ', '.join(self.names)
+        return f'{self.address:#06X} {self.old:>3} -> {self.new:>3}' + (f' ({names})' if names else '')
+
+
+def diff_images(old, new, address=0):
+    '''
+    Compare two memory images of the same length.
+
+    The images are compared as a whole first. When they differ, they're
+    compared block by block and then chunk by chunk (``memcmp`` under the
+    hood), and only the bytes of the chunks which differ are visited. Thus,
+    the costs grow linearly with the number of changes.
+
+    :param old: The old image
+    :type old: bytes, bytearray or memoryview
+    :param new: The new image
+    :type new: bytes, bytearray or memoryview
+    :param int address: The memory address of the images
+
+    :return: The changes
+    :rtype: list
+    '''
+    if old == new:
+        return []
+
+    length  = len(old)
+    changes = []
+
+    for block in range(0, length, BLOCK_SIZE):
+        if old[block:block + BLOCK_SIZE] == new[block:block + BLOCK_SIZE]:
+            continue
+
+        for chunk in range(block, min(block + BLOCK_SIZE, length), CHUNK_SIZE):
+            old_chunk = old[chunk:chunk + CHUNK_SIZE]
+            new_chunk = new[chunk:chunk + CHUNK_SIZE]
+
+            if old_chunk == new_chunk:
+                continue
+
+            for offset, (old_byte, new_byte) in enumerate(zip(old_chunk, new_chunk), chunk):
+                if old_byte != new_byte:
+                    changes.append(Change(address + offset, old_byte, new_byte))
+
+    return changes
+
+
+def diff_files(old_path, new_path):
+    '''
+    Compare two memory dumps on disk.
+
+    The files are memory mapped and compared block by block, only the blocks
+    which differ are compared byte-wise. When there's a dump index, the start
+    address of the dump is taken from it.
+
+    :param str old_path: The path of the old image
+    :param str new_path: The path of the new image
+
+    :return: The changes
+    :rtype: list
+    '''
+    address = MemoryDump.open(old_path).start
+    changes = []
+
+    with open(old_path, 'rb') as old_file, open(new_path, 'rb') as new_file:
+        with mmap.mmap(old_file.fileno(), 0, access=mmap.ACCESS_READ) as old, \
+                mmap.mmap(new_file.fileno(), 0, access=mmap.ACCESS_READ) as new:
+
+            length = min(len(old), len(new))
+
+            if len(old) != len(new):
+                LOGGER.warning('Images differ in size, comparing the first %d bytes', length)
+
+            for offset in range(0, length, BLOCK_SIZE):
+                stop = min(offset + BLOCK_SIZE, length)
+                changes += diff_images(old[offset:stop], new[offset:stop], address + offset)
+
+    return changes
+
+
+class MemoryWatcher:
+    '''
+    A watcher which polls a memory range and reports the changed bytes.
+
+    The range is read with a single message per poll.
+    '''
+
+    def __init__(self, machine, address, length,  # pylint: disable=too-many-arguments,redefined-outer-name
+                 interval=0.0, clock=monotonic, sleep=sleep):
+        '''
+        Constructor.
+
+        :param rocket_r60v.machine.Machine machine: The (connected) machine
+        :param int address: The memory address
+        :param int length: The data length
+        :param float interval: The min. interval between two polls in seconds
+        :param callable clock: The clock which returns the current time in seconds
+        :param callable sleep: The function which sleeps for a number of seconds
+        '''
+        self.machine  = machine
+        self.message  = Message.read_request(address, length)
+        self.address  = address
+        self.interval = interval
+        self.clock    = clock
+        self.sleep    = sleep
+        self.image    = None
+
+    def poll(self):
+        '''
+        Read the range and compare it with the previous image.
+
+        The first poll only stores the image and doesn't report any changes.
+        The range is read with background polling priority.
+
+        :return: The changes
+        :rtype: list
+        '''
+        with self.machine.priority(PRIORITY_POLL):
+            image = bytes(self.machine.send_message(self.message))
+
+        previous = self.image
+
+        self.image = image
+
+        if previous is None:
+            return []
+
+        return diff_images(previous, image, self.address)
+
+    def changes(self, count=None):
+        '''
+        Poll the range repeatedly and yield the changes of each poll.
+
+        The polls are scheduled at a fixed interval (without drift), or as fast
+        as possible when there's no interval.
+
+        :param int count: The number of polls, ``None`` for infinite polls
+
+        :return: The changes of each poll
+        :rtype: generator
+        '''
+        due  = self.clock()
+        poll = 0
+
+        while count is None or poll < count:
+            delay = due - self.clock()
+            if delay > 0:
+                self.sleep(delay)
+
+            due  = max(due + self.interval, self.clock()) if self.interval else due
+            poll += 1
+
+            changes = self.poll()
+            if changes:
+                yield changes
@@ -0,0 +1,249 @@
+'''
+Rocket memory dump module.
+'''
+
+__all__ = (
+    'MemoryDump',
+)
+
+import json
+import logging
+import os
+
+from .memory_map import MEMORY_MAP
+from .message import Message
+
+LOGGER = logging.getLogger(__name__)
+
+
+class MemoryDump:
+    '''
+    A (resumable) dump of a memory range of the machine.
+
+    The memory is stored as binary image, where each byte is stored at its
+    offset from the start address. The progress and the known settings in the
+    range are stored in a JSON index next to the image (i.e. ``<path>.json``).
+
+    The range is read in chunks, which are sent in batches over a single
+    connection (pipelined if the machine has pipelining enabled). The progress
+    is saved after each batch, so an interrupted dump can be resumed.
+    '''
+    batch_size = 32
+
+    def __init__(self, path, start=0x0000, end=0xB0FF, chunk=64):
+        '''
+        Constructor.
+
+        :param str path: The path of the binary image
+        :param int start: The first memory address
+        :param int end: The last memory address (inclusive)
+        :param int chunk: The number of bytes per read
+        '''
+        self.path  = path
+        self.start = start
+        self.end   = end
+        self.chunk = chunk
+        self.done  = []
+
+    @property
+    def index_path(self):
+        '''
+        The path of the index.
+
+        :return: The path
+        :rtype: str
+        '''
+        return f'{self.path}.json'
+
+    @property
+    def length(self):
+        '''
+        The length of the memory range.
+
+        :return: The length in bytes
+        :rtype: int
+        '''
+        return self.end - self.start + 1
+
+    @property
+    def complete(self):
+        '''
+        Flag if the whole range was read.
+
+        :return: The flag
+        :rtype: bool
+        '''
+        return self.done == [[self.start, self.end + 1]]
+
+    @property
+    def regions(self):
+        '''
+        The known settings in the memory range.
+
+        :return: The name, address & length of each setting
+        :rtype: list
+        '''
+        return [
+            {'name': x.name, 'address': x.address, 'length': x.length}
+            for x in MEMORY_MAP.find(self.start, self.length)
+        ]
+
+    @classmethod
+    def open(cls, path):
+        '''
+        Open an existing dump via its index.
+
+        :param str path: The path of the binary image
+
+        :return: The dump
+        :rtype: MemoryDump
+        '''
+        dump = cls(path)
+        dump.load_index()
+        return dump
+
+    def load_index(self):
+        '''
+        Load the index of the dump.
+
+        :return: ``True`` if the index was loaded
+        :rtype: bool
+        '''
+        try:
+            with open(self.index_path) as file:
+                index = json.load(file)
+        except FileNotFoundError:
+            return False
+
+        self.start = index['start']
+        self.end   = index['end']
+        self.chunk = index['chunk']
+        self.done  = index['done']
+
+        return True
+
+    def resumable(self):
+        '''
+        Check if there's a previous dump of the same range, and load its
+        progress.
+
+        :return: The flag
+        :rtype: bool
+        '''
+        if not os.path.exists(self.path):
+            return False
+
+        previous = MemoryDump(self.path)
+
+        if not previous.load_index() or (previous.start, previous.end) != (self.start, self.end):
+            return False
+
+        self.done = previous.done
+        return True
+
+    def save_index(self):
+        '''
+        Save the index of the dump.
+
+        The index is written to a temporary file first, so an interrupted
+        dump never leaves a broken index behind.
+        '''
+        index = {
+            'start': self.start,
+            'end': self.end,
+            'chunk': self.chunk,
+            'done': self.done,
+            'regions': self.regions,
+        }
+
+        with open(f'{self.index_path}.tmp', 'w') as file:
+            json.dump(index, file, indent=2)
+
+        os.replace(f'{self.index_path}.tmp', self.index_path)
+
+    def add_done(self, start, stop):
+        '''
+        Mark a memory range as read, merging it into the existing ranges.
+
+        :param int start: The first memory address
+        :param int stop: The memory address after the range
+        '''
+        ranges = sorted(self.done + [[start, stop]])
+        merged = [ranges[0]]
+
+        for range_start, range_stop in ranges[1:]:
+            if range_start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], range_stop)
+            else:
+                merged.append([range_start, range_stop])
+
+        self.done = merged
+
+    def missing(self):
+        '''
+        The chunks which weren't read yet.
+
+        :return: The address & length of each chunk
+        :rtype: list
+        '''
+        chunks = []
+
+        for address in range(self.start, self.end + 1, self.chunk):
+            length = min(self.chunk, self.end + 1 - address)
+            if not any(start <= address and address + length <= stop for start, stop in self.done):
+                chunks.append((address, length))
+
+        return chunks
+
+    def run(self, machine, resume=True):
+        '''
+        Read the memory range from the machine into the image.
+
+        :param rocket_r60v.machine.Machine machine: The (connected) machine
+        :param bool resume: Resume a previous dump with the same range
+
+        :return: The number of read chunks
+        :rtype: int
+        '''
+        if resume and self.resumable():
+            LOGGER.info('Resuming dump of %#06X-%#06X', self.start, self.end)
+        else:
+            self.done = []
+            with open(self.path, 'wb') as file:
+                file.truncate(self.length)
+
+        chunks = self.missing()
+
+        LOGGER.info('Reading %d chunks of %d bytes…', len(chunks), self.chunk)
+
+        with open(self.path, 'r+b') as file:
+            for i in range(0, len(chunks), self.batch_size):
+                batch    = chunks[i:i + self.batch_size]
+                messages = [Message.read_request(address, length) for address, length in batch]
+
+                for (address, length), data in zip(batch, machine.send_messages(messages)):
+                    file.seek(address - self.start)
+                    file.write(bytes(data))
+                    self.add_done(address, address + length)
+
+                file.flush()
+                self.save_index()
+
+        if not chunks:
+            self.save_index()
+
+        return len(chunks)
+
+    def read(self, address, length):
+        '''
+        Read data from the image.
+
+        :param int address: The memory address
+        :param int length: The data length
+
+        :return: The data
+        :rtype: bytes
+        '''
+        with open(self.path, 'rb') as file:
+            file.seek(address - self.start)
+            return file.read(length)
@@ -31,3 +31,33 @@ class SettingValueError(RocketError):
     '''
     Exception which is thrown when an invalid value is specified for a setting.
     '''
+
+
+class UnknownSettingError(RocketError):
+    '''
+    Exception which is thrown when an unknown setting is requested.
+    '''
+
+
+class ConnectionClosedError(RocketConnectionError):
+    '''
+    Exception which is thrown when the connection was closed by the machine.
+    '''
+
+
+class MemoryMapError(RocketError):
+    '''
+    Exception which is thrown when the memory map of the settings is invalid.
+    '''
+
+
+class DeadlineExceededError(RocketError, TimeoutError):
+    '''
+    Exception which is thrown when the deadline of a call is exceeded.
+    '''
+
+
+class CircuitOpenError(RocketConnectionError):
+    '''
+    Exception which is thrown when a machine is known to be down.
+    '''
@@ -0,0 +1,245 @@
+'''
+Rocket fleet module.
+'''
+
+__all__ = (
+    'Fleet',
+    'FleetResult',
+)
+
+import logging
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from .exceptions import RocketError, SettingValueError, UnknownSettingError
+from .health import HealthRegistry
+from .machine import Machine
+from .registry import REGISTRY
+
+LOGGER = logging.getLogger(__name__)
+
+PROFILES = ('profile_a', 'profile_b', 'profile_c')
+
+
+class FleetResult(namedtuple('FleetResult', ('values', 'errors'))):
+    '''
+    The result of a fleet operation.
+
+    The values & errors are dicts keyed by the machine address. Each machine
+    either has a value or an error, so a partial failure doesn't affect the
+    other machines.
+    '''
+    __slots__ = ()
+
+    @property
+    def ok(self):  # pylint: disable=invalid-name
+        '''
+        Flag if the operation succeeded on all machines.
+
+        :return: The flag
+        :rtype: bool
+        '''
+        return not self.errors
+
+
+class Fleet:
+    '''
+    A fleet of machines, which are controlled concurrently.
+
+    Each operation is fanned out to all machines in a thread pool with a
+    bounded number of workers. Machines which aren't connected yet (or
+    anymore) are connected first. Thus, a few offline machines only cost a
+    single timeout instead of blocking the whole fleet. After a few failed
+    operations, they're known to be down (see
+    :py:class:`rocket_r60v.health.HealthRegistry`) and their operations fail
+    immediately, until they're probed again.
+
+    An optional deadline limits the wall-clock time of an operation on each
+    machine (see :py:meth:`rocket_r60v.api.API.deadline`), so that a slow
+    machine can't stall the whole fleet with retries.
+
+    .. code-block:: python
+
+        fleet  = Fleet(['192.168.1.1', '192.168.2.1'], timeout=1.0)
+        result = fleet.read_all(['brew_boiler_temperature', 'total_coffee_count'])
+
+        for address, error in result.errors.items():
+            print(f'{address} failed: {error}')
+    '''
+    max_workers = 16
+    deadline    = None
+
+    def __init__(self, addresses, port=1774, timeout=3.0,  # pylint: disable=too-many-arguments
+                 timeouts=None, max_workers=None, health=None, deadline=None, **kwargs):
+        '''
+        Constructor.
+
+        :param list addresses: The IP addresses (optionally with ``:port``) of the machines
+        :param int port: The default port number of the machines
+        :param float timeout: The default timeout in seconds
+        :param dict timeouts: The timeouts in seconds per address
+        :param int max_workers: The max. number of concurrent operations
+        :param rocket_r60v.health.HealthRegistry health: The health registry of the machines
+        :param float deadline: The max. seconds of an operation per machine
+        :param kwargs: Additional arguments for the machines
+        '''
+        timeouts      = timeouts or {}
+        self.health   = HealthRegistry() if health is None else health
+        self.machines = {}
+
+        for address in addresses:
+            host, _, custom_port = address.partition(':')
+
+            self.machines[address] = Machine(
+                address=host,
+                port=int(custom_port) if custom_port else port,
+                timeout=timeouts.get(address, timeout),
+                health=self.health,
+                **kwargs
+            )
+
+        if max_workers is not None:
+            self.max_workers = max_workers
+
+        if deadline is not None:
+            self.deadline = deadline
+
+    def __len__(self):
+        '''
+        The number of machines.
+
+        :return: The number of machines
+        :rtype: int
+        '''
+        return len(self.machines)
+
+    def run(self, function):
+        '''
+        Run a function concurrently for all machines.
+
+        :param callable function: Called with a connected machine
+
+        :return: The result
+        :rtype: FleetResult
+        '''
+        def run_one(machine):
+            with machine.deadline(self.deadline):
+                if machine.socket is None:
+                    machine.connect()
+                return function(machine)
+
+        values = {}
+        errors = {}
+
+        if not self.machines:
+            return FleetResult(values, errors)
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(self.machines))) as executor:
+            futures = {address: executor.submit(run_one, machine) for address, machine in self.machines.items()}
+
+            for address, future in futures.items():
+                try:
+                    values[address] = future.result()
+                except (RocketError, OSError) as ex:
+                    LOGGER.warning('Operation on %s failed: %s', address, ex)
+                    self.machines[address].disconnect()
+                    errors[address] = ex
+
+        LOGGER.info('Operation succeeded on %d of %d machines', len(values), len(self.machines))
+
+        return FleetResult(values, errors)
+
+    def validate(self, name, value):
+        '''
+        Validate a setting value once, before it's sent to all machines.
+
+        :param str name: The name of the setting
+        :param value: The setting value
+
+        :raises rocket_r60v.exceptions.UnknownSettingError: When the setting doesn't exist
+        :raises rocket_r60v.exceptions.SettingValueError: When the setting is read-only or the value is invalid
+        '''
+        info = REGISTRY.get(name)
+
+        if info is None:
+            error = 'Unknown setting "%s"'
+            LOGGER.error(error, name)
+            raise UnknownSettingError(error % name)
+
+        if info.kind == 'read-only':
+            error = 'Setting "%s" is read-only'
+            LOGGER.error(error, name)
+            raise SettingValueError(error % name)
+
+        info.cls(None).encode(value)
+
+    def connect(self):
+        '''
+        Connect to all machines.
+
+        :return: The result
+        :rtype: FleetResult
+        '''
+        return self.run(lambda machine: True)
+
+    def disconnect(self):
+        '''
+        Disconnect from all machines.
+        '''
+        for machine in self.machines.values():
+            machine.disconnect()
+
+    def read_all(self, names):
+        '''
+        Read multiple settings from all machines.
+
+        :param list names: The names of the settings
+
+        :return: The result with the setting values of each machine
+        :rtype: FleetResult
+        '''
+        return self.run(lambda machine: machine.read_many(names))
+
+    def set_all(self, name, value):
+        '''
+        Set a setting value on all machines.
+
+        :param str name: The name of the setting
+        :param value: The setting value
+
+        :return: The result
+        :rtype: FleetResult
+
+        :raises rocket_r60v.exceptions.SettingValueError: When the value is invalid
+        '''
+        self.validate(name, value)
+        return self.run(lambda machine: machine.get_setting(name).set(value))
+
+    def apply_profile(self, name, value, activate=False):
+        '''
+        Apply a pressure profile on all machines.
+
+        :param str name: The name of the profile setting (e.g. ``profile_a``)
+        :param str value: The profile
+        :param bool activate: Make the profile the active profile
+
+        :return: The result
+        :rtype: FleetResult
+
+        :raises rocket_r60v.exceptions.UnknownSettingError: When the setting isn't a profile
+        :raises rocket_r60v.exceptions.SettingValueError: When the profile is invalid
+        '''
+        if name not in PROFILES:
+            error = 'Setting "%s" is not a pressure profile'
+            LOGGER.error(error, name)
+            raise UnknownSettingError(error % name)
+
+        self.validate(name, value)
+
+        def apply(machine):
+            machine.get_setting(name).set(value)
+            if activate:
+                machine.active_profile = name[-1].upper()
+            return True
+
+        return self.run(apply)
@@ -0,0 +1,231 @@
+'''
+Rocket health module.
+'''
+
+__all__ = (
+    'CLOSED',
+    'OPEN',
+    'HALF_OPEN',
+    'CircuitBreaker',
+    'HealthRegistry',
+)
+
+import logging
+import threading
+from contextlib import contextmanager
+from time import monotonic
+
+from .exceptions import CircuitOpenError, DeadlineExceededError, RocketConnectionError
+
+LOGGER = logging.getLogger(__name__)
+
+FAILURE_THRESHOLD = 3
+
+CLOSED    = 'closed'
+OPEN      = 'open'
+HALF_OPEN = 'half-open'
+
+
+class CircuitBreaker:  # pylint: disable=too-many-instance-attributes
+    '''
+    A circuit breaker of a machine, which fails operations fast while the
+    machine is known to be down.
+
+    - ``closed``: Operations are executed, failures are counted
+    - ``open``: Operations fail immediately with
+      :py:class:`rocket_r60v.exceptions.CircuitOpenError`, until the reset
+      timeout elapsed
+    - ``half-open``: A single operation is executed as probe, which either
+      closes or re-opens the circuit, while all others fail immediately
+
+    Only connection errors & timeouts are failures, as all other errors
+    prove that the machine is up. Exceeded deadlines are no failures either,
+    as they're imposed by the caller, except for the probe, which would leave
+    the circuit half-open otherwise. The circuit opens after several
+    consecutive failures, so that a single slow response of a busy machine
+    doesn't take it down.
+    '''
+    failure_errors = (RocketConnectionError, OSError)
+
+    def __init__(self, address, port, failure_threshold=FAILURE_THRESHOLD,  # pylint: disable=too-many-arguments
+                 reset_timeout=10.0, clock=monotonic):
+        '''
+        Constructor.
+
+        :param str address: The IP address of the machine
+        :param int port: The port number of the machine
+        :param int failure_threshold: The number of consecutive failures which open the circuit
+        :param float reset_timeout: The seconds until an open circuit is probed
+        :param callable clock: The clock which returns the current time in seconds
+        '''
+        self.address           = address
+        self.port              = port
+        self.failure_threshold = failure_threshold
+        self.reset_timeout     = reset_timeout
+        self.clock             = clock
+        self.state             = CLOSED
+        self.failures          = 0
+        self.opened            = None
+        self.lock              = threading.Lock()
+
+    def check(self):
+        '''
+        Check if an operation can be executed.
+
+        :return: ``True`` if the operation is the probe of a half-open circuit
+        :rtype: bool
+
+        :raises rocket_r60v.exceptions.CircuitOpenError: When the circuit is open
+        '''
+        if self.state == CLOSED:
+            return False
+
+        with self.lock:
+            if self.state == OPEN and self.clock() - self.opened >= self.reset_timeout:
+                LOGGER.info('Probing %s:%d…', self.address, self.port)
+                self.state = HALF_OPEN
+                return True
+
+            if self.state == CLOSED:
+                return False
+
+        error = 'Machine %s:%d is down (circuit %s)'
+        LOGGER.debug(error, self.address, self.port, self.state)
+        raise CircuitOpenError(error % (self.address, self.port, self.state))
+
+    def add_success(self):
+        '''
+        Record a successful operation, which closes the circuit.
+        '''
+        if self.state == CLOSED and not self.failures:
+            return
+
+        with self.lock:
+            if self.state != CLOSED:
+                LOGGER.info('Machine %s:%d is up again', self.address, self.port)
+            self.state    = CLOSED
+            self.failures = 0
+            self.opened   = None
+
+    def add_failure(self):
+        '''
+        Record a failed operation, which opens the circuit when the failure
+        threshold is reached or the probe failed.
+        '''
+        with self.lock:
+            self.failures += 1
+
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    LOGGER.warning('Machine %s:%d is down', self.address, self.port)
+                self.state  = OPEN
+                self.opened = self.clock()
+
+    @contextmanager
+    def guard(self):
+        '''
+        Context manager which checks the circuit before an operation and
+        records its outcome.
+
+        :raises rocket_r60v.exceptions.CircuitOpenError: When the circuit is open
+        '''
+        probe = self.check()
+
+        try:
+            yield
+        except (CircuitOpenError, DeadlineExceededError):
+            if probe:
+                self.add_failure()
+            raise
+        except self.failure_errors:
+            self.add_failure()
+            raise
+        except BaseException:
+            if probe:
+                self.add_success()
+            raise
+        else:
+            self.add_success()
+
+
+class HealthRegistry:
+    '''
+    A registry of the circuit breakers of the machines, keyed by their
+    address & port.
+
+    A registry can be shared by multiple :py:class:`rocket_r60v.machine.Machine`
+    instances (e.g. all machines of a :py:class:`rocket_r60v.fleet.Fleet`), so
+    that all operations on a machine which is known to be down fail fast.
+    '''
+
+    def __init__(self, failure_threshold=FAILURE_THRESHOLD, reset_timeout=10.0, clock=monotonic):
+        '''
+        Constructor.
+
+        :param int failure_threshold: The number of consecutive failures which open a circuit
+        :param float reset_timeout: The seconds until an open circuit is probed
+        :param callable clock: The clock which returns the current time in seconds
+        '''
+        self.failure_threshold = failure_threshold
+        self.reset_timeout     = reset_timeout
+        self.clock             = clock
+        self.breakers          = {}
+        self.lock              = threading.Lock()
+
+    def __len__(self):
+        '''
+        The number of known machines.
+
+        :return: The number of machines
+        :rtype: int
+        '''
+        return len(self.breakers)
+
+    def get_breaker(self, address, port):
+        '''
+        Get the circuit breaker of a machine.
+
+        :param str address: The IP address of the machine
+        :param int port: The port number of the machine
+
+        :return: The circuit breaker
+        :rtype: CircuitBreaker
+        '''
+        key     = (address, port)
+        breaker = self.breakers.get(key)
+
+        if breaker is None:
+            with self.lock:
+                breaker = self.breakers.get(key)
+                if breaker is None:
+                    breaker = self.breakers[key] = CircuitBreaker(
+                        address, port,
+                        failure_threshold=self.failure_threshold,
+                        reset_timeout=self.reset_timeout,
+                        clock=self.clock,
+                    )
+
+        return breaker
+
+    def is_down(self, address, port):
+        '''
+        Check if a machine is known to be down.
+
+        :param str address: The IP address of the machine
+        :param int port: The port number of the machine
+
+        :return: The flag
+        :rtype: bool
+        '''
+        breaker = self.breakers.get((address, port))
+        return breaker is not None and breaker.state != CLOSED
+
+    @property
+    def states(self):
+        '''
+        The circuit states of all known machines.
+
+        :return: The states keyed by the address & port
+        :rtype: dict
+        '''
+        return {key: breaker.state for key, breaker in self.breakers.items()}
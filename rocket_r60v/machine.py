@@ -7,60 +7,316 @@ __all__ = (
 )
 
 import logging
-from inspect import getmembers, isclass
-from re import sub
 
 from .api import API
-from . import settings
+from .cache import SettingCache
+from .exceptions import RocketError, SettingValueError, UnknownSettingError
+from .memory_map import MEMORY_MAP
+from .message import Message
+from .planner import plan_reads, plan_writes
+from .settings.base import WritableSetting
+from .registry import LazySettings, add_setting_properties
 
 LOGGER = logging.getLogger(__name__)
 
 
+@add_setting_properties
 class Machine(API):
     '''
     API class which can be used to connect and interact with the Rocket R60V.
+
+    The settings are available via instance properties, which are generated
+    once from the settings registry. The setting instances are created on
+    first access.
     '''
+    read_gap        = 16
+    read_max_length = 0x100
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, cache=False, **kwargs):
         '''
         Constructor.
+
+        :param cache: Cache the read settings (see :py:meth:`refresh`)
+        :type cache: bool or rocket_r60v.cache.SettingCache
         '''
-        self.settings = dict(self.init_settings())
+        self.settings = LazySettings(self)
+        self.cache    = SettingCache() if cache is True else (cache if cache is not False else None)
         super().__init__(*args, **kwargs)
 
-    def __getattr__(self, name):
+    def get_setting(self, name):
+        '''
+        Get a setting instance by its name.
+
+        :param str name: The name of the setting
+
+        :return: The setting
+        :rtype: rocket_r60v.settings.base.ReadOnlySetting
+
+        :raises rocket_r60v.exceptions.UnknownSettingError: When the setting doesn't exist
+        '''
+        try:
+            return self.settings[name]
+        except KeyError:
+            error = 'Unknown setting "%s"'
+            LOGGER.error(error, name)
+            raise UnknownSettingError(error % name)
+
+    def read_many(self, names, max_gap=None):
+        '''
+        Read multiple settings from the machine at once.
+
+        Instead of sending a message per setting, the settings are grouped
+        into as few ranged memory reads as possible. The received data is then
+        sliced and decoded by the settings themselves.
+
+        When the machine has a cache, only the settings which aren't cached
+        (anymore) are read from the machine.
+
+        :param list names: The names of the settings
+        :param int max_gap: The max. number of unused bytes between two settings
+
+        :return: The setting values
+        :rtype: dict
+
+        :raises rocket_r60v.exceptions.UnknownSettingError: When a setting doesn't exist
+        '''
+        if max_gap is None:
+            max_gap = self.read_gap
+
+        selected = [(name, self.get_setting(name)) for name in names]
+        values   = {}
+        missing  = []
+
+        for name, setting in selected:
+            data = None
+            if self.cache is not None and setting.readable:
+                data = self.cache.get(setting.address, setting.length)
+            if data is None:
+                missing.append((name, setting))
+            else:
+                values[name] = setting.decode(data)
+
+        reads    = plan_reads(missing, max_gap=max_gap, max_length=self.read_max_length)
+        messages = [read.build_message() for read in reads]
+
+        for read, data in zip(reads, self.send_messages(messages)):
+            for name, setting, value in read.split(data):
+                if self.cache is not None:
+                    self.cache.put(setting.address, setting.length, value, setting.cache_ttl)
+                values[name] = setting.decode(value)
+
+        for name, setting in selected:
+            if name not in values:
+                values[name] = setting.get()
+
+        return {name: values[name] for name, _ in selected}
+
+    def snapshot(self, max_gap=None):
         '''
-        Let the user access the machine's settings via instance properties.
+        Read all settings from the machine at once.
+
+        The settings are read (and returned) in the order of their memory
+        addresses.
+
+        .. seealso:
+
+            Method :py:meth:`read_many`
+                The bulk read of the settings
+
+        :param int max_gap: The max. number of unused bytes between two settings
+
+        :return: The setting values
+        :rtype: dict
         '''
-        if name == 'settings':
-            return {}
+        return self.read_many([x.name for x in MEMORY_MAP], max_gap=max_gap)
 
-        if name in self.settings:
-            LOGGER.debug('Reading "%s" via instance property', name)
-            return self.settings[name].get()
+    def encode_writes(self, values):
+        '''
+        Validate & encode multiple setting values.
+
+        :param dict values: The setting values by name
 
-        return super().__getattribute__(name)
+        :return: The name, setting & encoded data of each setting
+        :rtype: list
 
-    def __setattr__(self, name, value):
+        :raises rocket_r60v.exceptions.UnknownSettingError: When a setting doesn't exist
+        :raises rocket_r60v.exceptions.SettingValueError: When a value is invalid
         '''
-        Let the user set the machine's settings via instance properties.
+        writes = []
+
+        for name, value in values.items():
+            setting = self.get_setting(name)
+
+            if not hasattr(setting, 'set'):
+                error = 'Setting "%s" is read-only'
+                LOGGER.error(error, name)
+                raise SettingValueError(error % name)
+
+            data = bytes.fromhex(Message.encode_data(setting.encode(value)))
+
+            if len(data) != setting.length:
+                error = 'Value "%s" of setting "%s" has an invalid length'
+                LOGGER.error(error, value, name)
+                raise SettingValueError(error % (value, name))
+
+            writes.append((name, setting, data))
+
+        return writes
+
+    def read_memory(self, settings, max_gap=None):
+        '''
+        Read the raw memory of multiple settings at once.
+
+        :param list settings: The settings as ``(name, setting)`` pairs
+        :param int max_gap: The max. number of unused bytes between two settings
+
+        :return: The bytes by memory address
+        :rtype: dict
         '''
-        if name in self.settings:
-            LOGGER.debug('Setting "%s" via instance property to "%s"', name, value)
-            return self.settings[name].set(value)
-        return super().__setattr__(name, value)
+        if max_gap is None:
+            max_gap = self.read_gap
+
+        memory   = {}
+        reads    = plan_reads(settings, max_gap=max_gap, max_length=self.read_max_length)
+        messages = [read.build_message() for read in reads]
+
+        for read, data in zip(reads, self.send_messages(messages)):
+            memory.update(zip(range(read.address, read.address + read.length), data))
+
+        return memory
+
+    def apply(self, values, changed_only=False):
+        '''
+        Set multiple settings on the machine as a transaction.
+
+        All values are validated before anything is written. Then the current
+        values are read (with as few messages as possible), and the new values
+        are written with as few messages as possible, by merging the writes of
+        settings with contiguous addresses. If a write fails, the previous
+        values are restored before the error is raised.
+
+        Settings which can't be read (e.g. the date & time) can't be restored.
+
+        :param dict values: The setting values by name
+        :param bool changed_only: Only write the settings which differ from the current values
+
+        :return: The planned writes (i.e. one per write message)
+        :rtype: list
+
+        :raises rocket_r60v.exceptions.UnknownSettingError: When a setting doesn't exist
+        :raises rocket_r60v.exceptions.SettingValueError: When a value is invalid
+        '''
+        writes = self.encode_writes(values)
+        memory = self.read_memory([(name, setting) for name, setting, _ in writes])
+
+        if changed_only:
+            writes = [x for x in writes if self.is_changed(x, memory)]
+
+        ranges = plan_writes(writes, max_length=self.read_max_length)
+
+        LOGGER.info('Applying %d settings with %d messages…', len(writes), len(ranges))
+
+        try:
+            for response in self.send_messages([x.build_message() for x in ranges]):
+                WritableSetting.check_response(response)
+        except (RocketError, OSError):
+            LOGGER.error('Applying settings failed, rolling back…')
+            self.rollback(ranges, memory)
+            raise
+        finally:
+            if self.cache is not None:
+                for write in ranges:
+                    self.cache.invalidate(write.address, write.length)
+
+        return ranges
+
+    @staticmethod
+    def is_changed(write, memory):
+        '''
+        Check if an encoded setting value differs from the current memory.
+
+        Settings which can't be read are always considered as changed.
+
+        :param tuple write: The name, setting & encoded data of the setting
+        :param dict memory: The current bytes by memory address
+
+        :return: The flag
+        :rtype: bool
+        '''
+        _, setting, data = write
+        current          = [memory.get(x) for x in range(setting.address, setting.address + setting.length)]
+        return list(data) != current
+
+    def diff(self, values):
+        '''
+        Get the setting values which differ from the current values.
+
+        The values are validated & encoded first, then compared with the
+        current memory, which is read with as few messages as possible.
+
+        :param dict values: The setting values by name
+
+        :return: The changed setting values by name
+        :rtype: dict
+
+        :raises rocket_r60v.exceptions.UnknownSettingError: When a setting doesn't exist
+        :raises rocket_r60v.exceptions.SettingValueError: When a value is invalid
+        '''
+        writes = self.encode_writes(values)
+        memory = self.read_memory([(name, setting) for name, setting, _ in writes])
+        return {write[0]: values[write[0]] for write in writes if self.is_changed(write, memory)}
+
+    def rollback(self, ranges, memory):
+        '''
+        Restore the previous memory of planned writes (best effort).
+
+        The rollback isn't limited by the deadline of the failed writes.
+
+        :param list ranges: The planned writes
+        :param dict memory: The previous bytes by memory address
+        '''
+        with self.deadline(None):
+            for write in ranges:
+                addresses = range(write.address, write.address + write.length)
+
+                if not all(x in memory for x in addresses):
+                    LOGGER.warning('Can\'t restore %s, previous value is unknown', ', '.join(write.settings))
+                    continue
+
+                message = Message(command='w', address=write.address, length=write.length,
+                                  data=[memory[x] for x in addresses])
+
+                try:
+                    WritableSetting.check_response(self.send_message(message))
+                except (RocketError, OSError) as ex:
+                    LOGGER.error('Restoring %s failed: %s', ', '.join(write.settings), ex)
+
+    def refresh(self, names=None):
+        '''
+        Drop cached setting data, so that it's read from the machine again.
+
+        :param list names: The names of the settings, ``None`` for all settings
+
+        :raises rocket_r60v.exceptions.UnknownSettingError: When a setting doesn't exist
+        '''
+        if self.cache is None:
+            return
+
+        if names is None:
+            LOGGER.debug('Clearing setting cache')
+            self.cache.clear()
+            return
+
+        for name in names:
+            setting = self.get_setting(name)
+            self.cache.invalidate(setting.address, setting.length)
 
-    def init_settings(self):
+    @property
+    def cache_stats(self):
         '''
-        Initialise all properties / settings of the machine.
+        The cache statistics.
 
-        The settings will automatically be discovered by looking at all classes
-        in the settings package. The settings are then available via instance
-        properties of this class.
+        :return: The hits, misses & number of entries or ``None`` without cache
+        :rtype: dict or None
         '''
-        for name, member in getmembers(settings):
-            if not isclass(member):
-                continue
-            setting = member(self)
-            name    = sub('([a-z])([A-Z])', r'\1_\2', name).lower()
-            yield name, setting
+        return self.cache.stats if self.cache is not None else None
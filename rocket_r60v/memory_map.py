@@ -0,0 +1,129 @@
+'''
+Rocket memory map module.
+'''
+
+__all__ = (
+    'MemoryMap',
+    'MEMORY_MAP',
+)
+
+import logging
+from bisect import bisect_left
+
+from .exceptions import MemoryMapError, SettingValueError
+from .registry import REGISTRY
+
+LOGGER = logging.getLogger(__name__)
+
+
+class MemoryMap:
+    '''
+    A sorted interval index of the memory ranges of the settings.
+
+    The settings are sorted by their address, so the settings which cover a
+    memory range can be looked up via binary search instead of scanning all
+    settings.
+
+    Overlapping settings are only allowed when one setting explicitly is an
+    alias of the other (see ``alias_of``), i.e. a different view onto the same
+    memory (e.g. the current brew time is taken from the display).
+    '''
+
+    def __init__(self, infos):
+        '''
+        Constructor.
+
+        :param infos: The setting infos
+        :type infos: iterable
+
+        :raises rocket_r60v.exceptions.MemoryMapError: When settings overlap
+        '''
+        self.infos      = sorted(infos, key=lambda x: (x.address, x.length))
+        self.addresses  = [x.address for x in self.infos]
+        self.max_length = max((x.length for x in self.infos), default=0)
+
+        self.validate()
+
+    def __iter__(self):
+        '''
+        Iterate over the setting infos sorted by address.
+
+        :return: The setting infos
+        :rtype: iterator
+        '''
+        return iter(self.infos)
+
+    def __len__(self):
+        '''
+        The number of settings.
+
+        :return: The number of settings
+        :rtype: int
+        '''
+        return len(self.infos)
+
+    def validate(self):
+        '''
+        Validate that no settings overlap (except for aliases).
+
+        :raises rocket_r60v.exceptions.MemoryMapError: When settings overlap
+        '''
+        for info in self.infos:
+            for other in self.find(info.address, info.length):
+                if other is info or info.cls.alias_of is other.cls or other.cls.alias_of is info.cls:
+                    continue
+
+                error = 'Setting "%s" (%#06X, %d) overlaps with "%s" (%#06X, %d)'
+                args  = (info.name, info.address, info.length, other.name, other.address, other.length)
+                LOGGER.error(error, *args)
+                raise MemoryMapError(error % args)
+
+    def find(self, address, length=1):
+        '''
+        Find the settings which cover (a part of) a memory range.
+
+        :param int address: The memory address
+        :param int length: The length of the range
+
+        :return: The setting infos sorted by address
+        :rtype: list
+        '''
+        end   = address + length
+        start = bisect_left(self.addresses, address - self.max_length + 1)
+        stop  = bisect_left(self.addresses, end, start)
+
+        return [x for x in self.infos[start:stop] if x.address + x.length > address]
+
+    def decode(self, address, data):
+        '''
+        Decode a raw memory dump into the values of the settings it contains.
+
+        Only the readable settings which are completely contained in the dump
+        are decoded. Invalid values (e.g. unknown choices) are reported as raw
+        hex data (e.g. ``<invalid 05>``), as dumps might contain anything.
+
+        :param int address: The memory address of the dump
+        :param list data: The data sequence of the dump
+
+        :return: The setting values
+        :rtype: dict
+        '''
+        end    = address + len(data)
+        values = {}
+
+        for info in self.find(address, len(data)):
+            if info.kind == 'write-only' or info.address < address or info.address + info.length > end:
+                continue
+            offset = info.address - address
+            raw    = data[offset:offset + info.length]
+
+            try:
+                values[info.name] = info.cls(None).decode(raw)
+            except SettingValueError:
+                LOGGER.warning('Invalid value of setting "%s" in dump', info.name)
+                values[info.name] = f'<invalid {bytes(raw).hex().upper()}>'
+
+        return values
+
+
+MEMORY_MAP = MemoryMap(REGISTRY.values())
@@ -7,14 +7,14 @@ __all__ = (
 )
 
 import logging
-from functools import reduce
+from functools import lru_cache
 
 from .exceptions import ValidationError, MessageLengthError
 
 LOGGER = logging.getLogger()
 
 
-class Message:  # pylint: disable=too-many-instance-attributes
+class Message:
     '''
     A single message which meets the requirements of the Rocket message
     protocol.
@@ -22,6 +22,17 @@ class Message:  # pylint: disable=too-many-instance-attributes
     Please have a look at the REVERSE_ENGINEERING.rst document for more
     informations about the Rocket message protocol.
     '''
+    __slots__ = (
+        'command',
+        'address',
+        'length',
+        'data',
+        'envelope',
+        'message',
+        'checksum',
+        'raw_message',
+        'encoded',
+    )
 
     def __init__(self, command, address, length, data=None, encode_data=True):  # pylint: disable=too-many-arguments
         '''
@@ -50,6 +61,25 @@ class Message:  # pylint: disable=too-many-instance-attributes
         self.message     = self.build_message()
         self.checksum    = self.calculate_checksum(self.message)
         self.raw_message = self.build_raw_message()
+        self.encoded     = self.raw_message.encode()
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def read_request(cls, address, length):
+        '''
+        Get a read request message.
+
+        As read requests never change, they're cached per address & length.
+        Thus, polling the same address repeatedly doesn't build the same
+        message over and over again.
+
+        :param int address: The memory address
+        :param int length: The data length
+
+        :return: The message
+        :rtype: Message
+        '''
+        return cls(command='r', address=address, length=length)
 
     @classmethod
     def encode_data(cls, data):
@@ -71,7 +101,12 @@ class Message:  # pylint: disable=too-many-instance-attributes
         elif isinstance(data, int):
             data = [data]
 
-        return ''.join((f'{x:02X}' for x in data))
+        try:
+            return bytes(data).hex().upper()
+        except (ValueError, TypeError) as ex:
+            error = 'Invalid data "%s", expected 8-bit unsigned integers'
+            LOGGER.error(error, data)
+            raise ValidationError(error % data) from ex
 
     @classmethod
     def decode_data(cls, message):
@@ -84,24 +119,56 @@ class Message:  # pylint: disable=too-many-instance-attributes
         :return: The data list
         :rtype: list
         '''
-        length  = int(message[5:9], 16)
-        encoded = message[9:(9 + length * 2)]
-        decoded = []
+        if message[9:11] == 'OK':
+            return ['OK']
 
-        LOGGER.debug('Encoded data is "%s"', encoded)
+        length = int(message[5:9], 16)
 
-        if encoded[:2] == 'OK':
-            LOGGER.debug('Decoding skipped as "OK" was returned…')
-            return ['OK']
+        return list(bytes.fromhex(message[9:(9 + length * 2)]))
 
-        for i in range(0, length * 2, 2):
-            start = i
-            end   = start + 2
-            decoded.append(int(encoded[start:end], 16))
+    @classmethod
+    def frame_length(cls, buffer, request=False):
+        '''
+        Determine the expected length of the (first) frame in a buffer.
+
+        The machine either sends a ``*HELLO*`` frame after the connection is
+        established, an ``OK`` frame as response to a write (e.g.
+        ``w00010001OK93``), or a data frame as response to a read. The length
+        of a data frame is derived from the length field in its envelope.
+
+        Requests are framed differently, as read requests don't contain any
+        data, while write requests do.
 
-        LOGGER.debug('Decoded data is "%s"', decoded)
+        :param bytes buffer: The received bytes
+        :param bool request: The buffer contains requests instead of responses
+
+        :return: The frame length or ``None`` if more bytes are required
+        :rtype: int or None
+
+        :raises rocket.exceptions.ValidationError: When the frame is invalid
+        '''
+        if not buffer:
+            return None
 
-        return decoded
+        if buffer[0:1] == b'*' and not request:
+            end = buffer.find(b'*', 1)
+            return None if end == -1 else end + 1
+
+        if len(buffer) < (9 if request else 11):
+            return None
+
+        if request and buffer[0:1] == b'r':
+            return 11
+
+        if not request and buffer[9:11] == b'OK':
+            return 13
+
+        try:
+            return 11 + int(buffer[5:9], 16) * 2
+        except ValueError:
+            error = 'Invalid frame envelope "%s"'
+            LOGGER.error(error, buffer[0:9])
+            raise ValidationError(error % bytes(buffer[0:9]).decode(errors='replace'))
 
     @classmethod
     def calculate_checksum(cls, message):
@@ -117,10 +184,7 @@ class Message:  # pylint: disable=too-many-instance-attributes
         :return: The hexadecimal checksum
         :rtype: str
         '''
-        checksum = reduce(lambda x, y: x + y, message.encode()) % 256
-        checksum = f'{checksum:02X}'
-        LOGGER.debug('Calculated checksum is "%s"', checksum)
-        return checksum
+        return f'{sum(message.encode()) % 256:02X}'
 
     def build_envelope(self):
         '''
@@ -132,9 +196,7 @@ class Message:  # pylint: disable=too-many-instance-attributes
         :return: The envelope
         :rtype: str
         '''
-        envelope = f'{self.command}{self.address:04X}{self.length:04X}'
-        LOGGER.debug('Message envelope is "%s"', envelope)
-        return envelope
+        return f'{self.command}{self.address:04X}{self.length:04X}'
 
     def build_message(self):
         '''
@@ -151,9 +213,7 @@ class Message:  # pylint: disable=too-many-instance-attributes
         :return: The message without its checksum
         :rtype: str
         '''
-        message  = f'{self.envelope}{self.data}'
-        LOGGER.debug('Message is "%s"', message)
-        return message
+        return f'{self.envelope}{self.data}'
 
     def build_raw_message(self):
         '''
@@ -173,9 +233,7 @@ class Message:  # pylint: disable=too-many-instance-attributes
         :return: The message with its checksum
         :rtype: str
         '''
-        raw_message = f'{self.message}{self.checksum}'
-        LOGGER.debug('Raw message is "%s"', raw_message)
-        return raw_message
+        return f'{self.message}{self.checksum}'
 
     def validate_response(self, response_message):
         '''
@@ -201,8 +259,6 @@ class Message:  # pylint: disable=too-many-instance-attributes
             LOGGER.error(error, calculated_checksum, response_checksum)
             raise ValidationError(error % (calculated_checksum, response_checksum))
 
-        LOGGER.debug('Raw response message "%s" validated successfully', response_message)
-
     def encode(self):
         '''
         The encoded version of the message string.
@@ -210,7 +266,7 @@ class Message:  # pylint: disable=too-many-instance-attributes
         :return: The encoded string
         :rtype: bytes
         '''
-        return self.raw_message.encode()
+        return self.encoded
 
     def __str__(self):
         '''
@@ -0,0 +1,167 @@
+'''
+Rocket read planner module.
+'''
+
+__all__ = (
+    'ReadRange',
+    'WriteRange',
+    'plan_reads',
+    'plan_writes',
+)
+
+import logging
+from collections import namedtuple
+
+from .message import Message
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ReadRange(namedtuple('ReadRange', ('address', 'length', 'settings'))):
+    '''
+    A planned memory read which covers one or more settings.
+    '''
+    __slots__ = ()
+
+    def build_message(self):
+        '''
+        Build the read message for the range.
+
+        :return: The message
+        :rtype: rocket_r60v.message.Message
+        '''
+        return Message.read_request(self.address, self.length)
+
+    def split(self, data):
+        '''
+        Slice the data of each setting out of the received data.
+
+        :param list data: The received data sequence
+
+        :return: The name, setting & data sequence of each setting
+        :rtype: generator
+        '''
+        for name, setting in self.settings:
+            offset = setting.address - self.address
+            yield name, setting, data[offset:offset + setting.length]
+
+    def decode(self, data):
+        '''
+        Slice the data of each setting out of the received data and decode it.
+
+        :param list data: The received data sequence
+
+        :return: The setting values
+        :rtype: dict
+        '''
+        return {name: setting.decode(value) for name, setting, value in self.split(data)}
+
+
+class WriteRange(namedtuple('WriteRange', ('address', 'data', 'settings'))):
+    '''
+    A planned memory write which covers one or more contiguous settings.
+    '''
+    __slots__ = ()
+
+    @property
+    def length(self):
+        '''
+        The length of the write.
+
+        :return: The length
+        :rtype: int
+        '''
+        return len(self.data)
+
+    def build_message(self):
+        '''
+        Build the write message for the range.
+
+        :return: The message
+        :rtype: rocket_r60v.message.Message
+        '''
+        return Message(command='w', address=self.address, length=self.length, data=list(self.data))
+
+
+def plan_reads(settings, max_gap=16, max_length=0x100):
+    '''
+    Plan the minimal set of memory reads which cover all settings.
+
+    The settings are sorted by their address and then merged into ranges.
+    Settings which are no more than ``max_gap`` bytes apart from the current
+    range are merged into it, as long as the range doesn't exceed
+    ``max_length`` bytes. This means a few unused bytes might be read, but
+    a whole round trip to the machine is saved.
+
+    Settings which aren't readable (e.g. the date & time) are skipped.
+
+    :param settings: The settings as ``(name, setting)`` pairs
+    :type settings: iterable
+    :param int max_gap: The max. number of unused bytes between two settings
+    :param int max_length: The max. length of a single read
+
+    :return: The planned reads
+    :rtype: list
+    '''
+    readable = sorted(
+        ((name, setting) for name, setting in settings if setting.readable),
+        key=lambda x: (x[1].address, x[1].length)
+    )
+
+    ranges = []
+    start  = end = None
+    group  = []
+
+    for name, setting in readable:
+        setting_start = setting.address
+        setting_end   = setting.address + setting.length
+
+        if group and setting_start <= end + max_gap and max(end, setting_end) - start <= max_length:
+            end = max(end, setting_end)
+            group.append((name, setting))
+            continue
+
+        if group:
+            ranges.append(ReadRange(start, end - start, tuple(group)))
+
+        start = setting_start
+        end   = setting_end
+        group = [(name, setting)]
+
+    if group:
+        ranges.append(ReadRange(start, end - start, tuple(group)))
+
+    LOGGER.debug('Planned %d reads for %d settings', len(ranges), len(readable))
+
+    return ranges
+
+
+def plan_writes(writes, max_length=0x100):
+    '''
+    Plan the minimal set of memory writes which cover all settings.
+
+    The writes are sorted by their address and then merged into ranges, as
+    long as they're contiguous (i.e. no unrelated bytes are overwritten) and
+    the range doesn't exceed ``max_length`` bytes.
+
+    :param writes: The writes as ``(name, setting, data)`` tuples
+    :type writes: iterable
+    :param int max_length: The max. length of a single write
+
+    :return: The planned writes
+    :rtype: list
+    '''
+    ranges = []
+
+    for name, setting, data in sorted(writes, key=lambda x: x[1].address):
+        if ranges:
+            last = ranges[-1]
+            if setting.address == last.address + last.length and last.length + len(data) <= max_length:
+                ranges[-1] = WriteRange(last.address, last.data + bytes(data), last.settings + (name,))
+                continue
+
+        ranges.append(WriteRange(setting.address, bytes(data), (name,)))
+
+    LOGGER.debug('Planned %d writes for %d settings', len(ranges), sum(len(x.settings) for x in ranges))
+
+    return ranges
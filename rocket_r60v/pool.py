@@ -0,0 +1,109 @@
+'''
+Rocket connection pool module.
+'''
+
+__all__ = (
+    'ConnectionPool',
+)
+
+import logging
+import threading
+
+from .connection import Connection
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ConnectionPool:
+    '''
+    A pool of warm connections, keyed by the address & port of the machines.
+
+    A pool can be shared by multiple :py:class:`rocket_r60v.machine.Machine`
+    instances, which then share a single connection per machine instead of
+    connecting (and waiting for the ``*HELLO*``) over and over again.
+    '''
+
+    def __init__(self):
+        '''
+        Constructor.
+        '''
+        self.connections = {}
+        self.lock        = threading.Lock()
+
+    def __len__(self):
+        '''
+        The number of pooled connections.
+
+        :return: The number of connections
+        :rtype: int
+        '''
+        return len(self.connections)
+
+    def create_connection(self, address, port, timeout, connect_timeout=None):  # pylint: disable=no-self-use
+        '''
+        Create a new (not yet established) connection to a machine.
+
+        :param str address: The IP address of the machine
+        :param int port: The port number of the machine
+        :param float timeout: The max. response timeout in seconds
+        :param float connect_timeout: The connect timeout in seconds
+        :param rocket_r60v.timing.Deadline deadline: The deadline which limits the connect timeout
+
+        :return: The connection
+        :rtype: rocket_r60v.connection.Connection
+        '''
+        return Connection(address, port, timeout, connect_timeout)
+
+    def get_connection(self, address, port, timeout,  # pylint: disable=too-many-arguments
+                       connect_timeout=None, deadline=None):
+        '''
+        Get a healthy connection to a machine.
+
+        If there's no pooled connection yet, a new connection is established.
+        If the pooled connection is broken, it's re-established.
+
+        :param str address: The IP address of the machine
+        :param int port: The port number of the machine
+        :param float timeout: The max. response timeout in seconds
+        :param float connect_timeout: The connect timeout in seconds
+
+        :return: The connection
+        :rtype: rocket_r60v.connection.Connection
+        '''
+        key = (address, port)
+
+        with self.lock:
+            connection = self.connections.get(key)
+            if connection is None:
+                connection = self.connections[key] = self.create_connection(address, port, timeout, connect_timeout)
+
+        with connection.lock:
+            if connection.socket is None:
+                connection.connect(deadline)
+            elif not connection.is_healthy():
+                LOGGER.warning('Pooled connection to %s:%d is broken, reconnecting…', address, port)
+                connection.reconnect(deadline)
+
+        return connection
+
+    def close(self, address, port):
+        '''
+        Close the pooled connection to a machine.
+
+        :param str address: The IP address of the machine
+        :param int port: The port number of the machine
+        '''
+        with self.lock:
+            connection = self.connections.pop((address, port), None)
+
+        if connection is not None:
+            connection.worker.stop()
+            with connection.lock:
+                connection.disconnect()
+
+    def close_all(self):
+        '''
+        Close all pooled connections.
+        '''
+        for address, port in list(self.connections):
+            self.close(address, port)
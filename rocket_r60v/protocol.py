@@ -0,0 +1,307 @@
+'''
+Rocket protocol module.
+
+The protocol is implemented without any I/O ("sans-IO"). The transports
+(i.e. the blocking connection, the asyncio API & the simulator) only move
+bytes, while the protocol state machines handle the handshake, the framing,
+the matching of responses to requests and the validation of the responses.
+'''
+
+__all__ = (
+    'Hello',
+    'Response',
+    'Protocol',
+    'ServerProtocol',
+)
+
+import logging
+from collections import deque, namedtuple
+
+from .exceptions import RocketConnectionError, ValidationError
+from .message import Message
+
+LOGGER = logging.getLogger(__name__)
+
+HELLO = '*HELLO*'
+
+MAX_ABANDONED = 16
+
+
+class Hello(namedtuple('Hello', ())):
+    '''
+    The event of a completed handshake.
+    '''
+    __slots__ = ()
+
+
+class Response(namedtuple('Response', ('message', 'data'))):
+    '''
+    The event of a validated response to a request message.
+    '''
+    __slots__ = ()
+
+
+class Protocol:
+    '''
+    The client side of the Rocket message protocol.
+
+    Request messages are passed to :py:meth:`send`, which returns the bytes
+    to transmit. Received bytes are passed to :py:meth:`feed`, which returns
+    the events (i.e. :py:class:`Hello` & :py:class:`Response`) of all complete
+    frames.
+
+    Multiple requests can be in flight (pipelining). A response is matched to
+    the first pending request with the same envelope, or to the oldest
+    pending request otherwise (which then fails the validation).
+
+    The pending requests are abandoned when the caller gave up on them (e.g.
+    after a timeout). Late responses of abandoned requests are dropped, so
+    that they aren't mistaken for the responses of later requests.
+    '''
+    __slots__ = ('buffer', 'pending', 'abandoned', 'connected')
+
+    def __init__(self):
+        '''
+        Constructor.
+        '''
+        self.buffer    = bytearray()
+        self.pending   = deque()
+        self.abandoned = deque(maxlen=MAX_ABANDONED)
+        self.connected = False
+
+    def reset(self):
+        '''
+        Reset the protocol for a new connection.
+        '''
+        self.buffer.clear()
+        self.pending.clear()
+        self.abandoned.clear()
+        self.connected = False
+
+    def clear(self):
+        '''
+        Discard the received bytes and abandon the pending requests (e.g.
+        after a timeout), but keep the handshake state.
+        '''
+        self.buffer.clear()
+        self.abandoned.extend(self.pending)
+        self.pending.clear()
+
+    def send(self, message):
+        '''
+        Register a request message as pending.
+
+        :param rocket_r60v.message.Message message: The message
+
+        :return: The bytes to transmit
+        :rtype: bytes
+        '''
+        self.pending.append(message)
+        return message.encode()
+
+    def receive_data(self, data):
+        '''
+        Add received bytes to the buffer.
+
+        :param bytes data: The received bytes
+        '''
+        self.buffer.extend(data)
+
+    def next_frame(self):
+        '''
+        Take the next complete frame from the buffer.
+
+        .. seealso:
+
+            Method :py:meth:`rocket_r60v.message.Message.frame_length`
+                The framing of the messages
+
+        :return: The frame or ``None`` if more bytes are required
+        :rtype: str or None
+
+        :raises rocket.exceptions.ValidationError: When the frame is invalid
+        '''
+        buffer = self.buffer
+
+        try:
+            length = Message.frame_length(buffer)
+        except ValidationError:
+            self.clear()
+            raise
+
+        if length is None or len(buffer) < length:
+            return None
+
+        frame = buffer[0:length].decode()
+        del buffer[0:length]
+
+        LOGGER.debug('Received raw message is "%s"', frame)
+        return frame
+
+    def next_event(self):
+        '''
+        Take the event of the next complete frame from the buffer.
+
+        :return: The event or ``None`` if more bytes are required
+        :rtype: Hello, Response or None
+
+        :raises rocket.exceptions.RocketConnectionError: When the handshake failed
+        :raises rocket.exceptions.ValidationError: When the response is invalid
+        '''
+        frame = self.next_frame()
+
+        while frame is not None:
+            if not self.connected:
+                return self.handle_hello(frame)
+
+            event = self.handle_response(frame)
+
+            if event is not None:
+                return event
+
+            frame = self.next_frame()
+
+        return None
+
+    def feed(self, data=b''):
+        '''
+        Add received bytes to the buffer and take the events of all complete
+        frames.
+
+        :param bytes data: The received bytes
+
+        :return: The events
+        :rtype: list
+        '''
+        self.receive_data(data)
+
+        events = []
+        event  = self.next_event()
+
+        while event is not None:
+            events.append(event)
+            event = self.next_event()
+
+        return events
+
+    def handle_hello(self, frame):
+        '''
+        Handle the first frame of a connection, which must be ``*HELLO*``.
+
+        :param str frame: The frame
+
+        :return: The event
+        :rtype: Hello
+
+        :raises rocket.exceptions.RocketConnectionError: When the machine didn't say hello
+        '''
+        if frame != HELLO:
+            error = 'Machine didn\'t say hello ("%s"), connection failed'
+            LOGGER.error(error, frame)
+            raise RocketConnectionError(error % frame)
+
+        self.connected = True
+        return Hello()
+
+    def handle_response(self, frame):
+        '''
+        Match a response frame to its pending request and validate it.
+
+        :param str frame: The frame
+
+        :return: The event or ``None`` if it's a late response of an abandoned request
+        :rtype: Response or None
+
+        :raises rocket.exceptions.ValidationError: When the response is invalid
+        '''
+        pending  = self.pending
+        envelope = frame[0:9]
+
+        for message in pending:
+            if message.envelope == envelope:
+                break
+        else:
+            for message in self.abandoned:
+                if message.envelope == envelope:
+                    LOGGER.debug('Dropping late response "%s"', frame)
+                    self.abandoned.remove(message)
+                    return None
+
+            if not pending:
+                error = 'Unexpected response "%s"'
+                LOGGER.error(error, frame)
+                raise ValidationError(error % frame)
+
+            message = pending[0]
+
+        pending.remove(message)
+        message.validate_response(frame)
+
+        return Response(message, Message.decode_data(frame))
+
+
+class ServerProtocol:
+    '''
+    The machine side of the Rocket message protocol (e.g. for simulators).
+
+    Received bytes are passed to :py:meth:`feed`, which returns the complete
+    request frames. Invalid frames are discarded.
+    '''
+    __slots__ = ('buffer',)
+
+    def __init__(self):
+        '''
+        Constructor.
+        '''
+        self.buffer = bytearray()
+
+    @staticmethod
+    def hello():
+        '''
+        The bytes of the handshake.
+
+        :return: The bytes to transmit
+        :rtype: bytes
+        '''
+        return HELLO.encode()
+
+    @staticmethod
+    def send(response):
+        '''
+        Encode a response frame.
+
+        :param str response: The raw response message
+
+        :return: The bytes to transmit
+        :rtype: bytes
+        '''
+        return response.encode()
+
+    def feed(self, data=b''):
+        '''
+        Add received bytes to the buffer and take all complete requests.
+
+        :param bytes data: The received bytes
+
+        :return: The raw request messages
+        :rtype: list
+        '''
+        buffer   = self.buffer
+        requests = []
+
+        buffer.extend(data)
+
+        while True:
+            try:
+                length = Message.frame_length(buffer, request=True)
+            except ValidationError:
+                buffer.clear()
+                break
+
+            if length is None or len(buffer) < length:
+                break
+
+            requests.append(bytes(buffer[0:length]).decode())
+            del buffer[0:length]
+
+        return requests
@@ -0,0 +1,173 @@
+'''
+Rocket settings registry module.
+'''
+
+__all__ = (
+    'SettingInfo',
+    'REGISTRY',
+    'LazySettings',
+    'SettingProperty',
+    'add_setting_properties',
+)
+
+import logging
+from collections import namedtuple
+from collections.abc import Mapping
+from inspect import getmembers, isclass
+from re import sub
+
+from . import settings
+
+LOGGER = logging.getLogger(__name__)
+
+
+class SettingInfo(namedtuple('SettingInfo', ('name', 'cls', 'address', 'length', 'kind'))):
+    '''
+    The static information of a setting.
+
+    The kind is either ``read-only``, ``write-only`` or ``read-write``.
+    '''
+    __slots__ = ()
+
+
+def build_registry():
+    '''
+    Discover all settings by looking at all classes in the settings package.
+
+    The names of the settings are derived from the class names, e.g.
+    ``BrewBoilerTemperature`` becomes ``brew_boiler_temperature``.
+
+    :return: The setting infos by name
+    :rtype: dict
+    '''
+    registry = {}
+
+    for class_name, cls in getmembers(settings, isclass):
+        name = sub('([a-z])([A-Z])', r'\1_\2', class_name).lower()
+
+        if not hasattr(cls, 'set'):
+            kind = 'read-only'
+        elif not cls.readable:
+            kind = 'write-only'
+        else:
+            kind = 'read-write'
+
+        registry[name] = SettingInfo(name, cls, cls.address, cls.length, kind)
+
+    return registry
+
+
+REGISTRY = build_registry()
+
+
+class LazySettings(Mapping):
+    '''
+    The settings of a machine, which are instantiated on first access.
+    '''
+    __slots__ = ('machine', 'instances')
+
+    def __init__(self, machine):
+        '''
+        Constructor.
+
+        :param machine: The machine
+        '''
+        self.machine   = machine
+        self.instances = {}
+
+    def __getitem__(self, name):
+        '''
+        Get a setting instance, instantiating it if required.
+
+        :param str name: The name of the setting
+
+        :return: The setting
+        :rtype: rocket_r60v.settings.base.ReadOnlySetting
+
+        :raises KeyError: When the setting doesn't exist
+        '''
+        try:
+            return self.instances[name]
+        except KeyError:
+            setting = self.instances[name] = REGISTRY[name].cls(self.machine)
+            return setting
+
+    def __contains__(self, name):
+        '''
+        Check if a setting exists, without instantiating it.
+
+        :param str name: The name of the setting
+
+        :return: The flag
+        :rtype: bool
+        '''
+        return name in REGISTRY
+
+    def __iter__(self):
+        '''
+        Iterate over the setting names.
+
+        :return: The names
+        :rtype: iterator
+        '''
+        return iter(REGISTRY)
+
+    def __len__(self):
+        '''
+        The number of settings.
+
+        :return: The number of settings
+        :rtype: int
+        '''
+        return len(REGISTRY)
+
+
+class SettingProperty:
+    '''
+    A descriptor which lets the user access a setting of a machine via an
+    instance property.
+    '''
+
+    def __init__(self, info):
+        '''
+        Constructor.
+
+        :param SettingInfo info: The setting info
+        '''
+        self.name    = info.name
+        self.__doc__ = info.cls.__doc__
+
+    def __get__(self, instance, owner=None):
+        '''
+        Read the setting via instance property.
+        '''
+        if instance is None:
+            return self
+        LOGGER.debug('Reading "%s" via instance property', self.name)
+        return instance.settings[self.name].get()
+
+    def __set__(self, instance, value):
+        '''
+        Set the setting via instance property.
+        '''
+        LOGGER.debug('Setting "%s" via instance property to "%s"', self.name, value)
+        setting = instance.settings[self.name]
+
+        if not hasattr(setting, 'set'):
+            raise AttributeError(f'Setting "{self.name}" is read-only')
+
+        setting.set(value)
+
+
+def add_setting_properties(cls):
+    '''
+    Class decorator which adds a property for each setting to a class.
+
+    :param type cls: The class
+
+    :return: The class
+    :rtype: type
+    '''
+    for name, info in REGISTRY.items():
+        setattr(cls, name, SettingProperty(info))
+    return cls
@@ -21,8 +21,15 @@ class ReadOnlySetting:
     '''
     A read-only setting and the base setting from which all other settings
     should inherit.
+
+    A setting which is a different view onto the memory of another setting
+    must name that setting class as ``alias_of``, otherwise overlapping
+    memory ranges are rejected by :py:class:`rocket_r60v.memory_map.MemoryMap`.
     '''
-    length = 1
+    length    = 1
+    readable  = True
+    cache_ttl = 60.0
+    alias_of  = None
 
     @property
     def address(self):
@@ -42,43 +49,98 @@ class ReadOnlySetting:
         '''
         self.machine = machine
 
-    def send(self, command, data=None, unpack_response=True):
+    def build_message(self, command, data=None):
         '''
-        Send a message to the machine.
+        Build a message for the setting.
 
         :param str command: The command [r|w]
         :param data: The data sequence
         :rtype data: None or list
-        :param bool unpack_data: Unpack response data when only one element
 
-        :retrun: The response data
-        :rtype: str
+        :return: The message
+        :rtype: rocket_r60v.message.Message
         '''
-        message = Message(
+        if command == 'r':
+            return Message.read_request(self.address, self.length)
+
+        return Message(
             command=command,
             address=self.address,
             length=self.length,
             data=data,
         )
 
-        response = self.machine.send_message(message)
+    def send(self, command, data=None, unpack_response=True):
+        '''
+        Send a message to the machine.
+
+        :param str command: The command [r|w]
+        :param data: The data sequence
+        :rtype data: None or list
+        :param bool unpack_data: Unpack response data when only one element
+
+        :retrun: The response data
+        :rtype: str
+        '''
+        response = self.machine.send_message(self.build_message(command, data))
 
         if len(response) == 1 and unpack_response:
             return response[0]
 
         return response
 
-    def get(self, unpack_response=True):
+    def decode(self, data, unpack_response=True):
         '''
-        Get the setting value from the machine.
+        Decode the raw data sequence of the setting into its value.
 
+        This is used by :py:meth:`get`, but can also be used to decode data
+        which was read from the machine by other means (e.g. a bulk read).
+
+        :param list data: The data sequence
         :param bool unpack_data: Unpack response data when only one element
 
         :return: The setting value
         :rtype: mixed
         '''
+        if len(data) == 1 and unpack_response:
+            return data[0]
+
+        return data
+
+    def read(self):
+        '''
+        Read the raw data sequence of the setting.
+
+        When the machine has a cache, the cached data is returned as long as
+        it's not older than :py:attr:`cache_ttl` seconds.
+
+        :return: The data sequence
+        :rtype: list
+        '''
+        cache = getattr(self.machine, 'cache', None)
+
+        if cache is not None:
+            data = cache.get(self.address, self.length)
+            if data is not None:
+                LOGGER.debug('Using cached data for %s', self.__class__.__name__)
+                return data
+
         LOGGER.debug('Getting value for %s from machine…', self.__class__.__name__)
-        return self.send(command='r', unpack_response=unpack_response)
+        data = self.send(command='r', unpack_response=False)
+
+        if cache is not None:
+            cache.put(self.address, self.length, data, self.cache_ttl)
+
+        return data
+
+    def get(self, *args, **kwargs):
+        '''
+        Get the setting value from the machine.
+
+        :return: The setting value
+        :rtype: mixed
+        '''
+        return self.decode(self.read(), *args, **kwargs)
 
 
 class WritableSetting(ReadOnlySetting):  # pylint: disable=abstract-method
@@ -86,21 +148,33 @@ class WritableSetting(ReadOnlySetting):  # pylint: disable=abstract-method
     A writable setting from which all other writable settings should inherit.
     '''
 
-    def set(self, data):
+    def encode(self, value):
         '''
-        Set the setting value on the machine.
+        Encode (and validate) the setting value into a raw data sequence.
 
-        :param list data: The data sequence
+        This is used by :py:meth:`set`, but can also be used to validate and
+        encode values which are sent to the machine by other means.
 
-        :return: The received data
-        :rtype: str
+        :param value: The setting value
 
-        :raises rocket.exceptions.ValidationError: When response data isn't "OK"
+        :return: The data sequence
+        :rtype: list
         '''
+        return value
 
-        LOGGER.debug('Setting value for %s on machine to "%s"…', self.__class__.__name__, data)
+    @classmethod
+    def check_response(cls, response):
+        '''
+        Check the response data of a write.
 
-        data = self.send(command='w', data=data)
+        :param list response: The response data
+
+        :return: The response data
+        :rtype: str
+
+        :raises rocket.exceptions.ValidationError: When response data isn't "OK"
+        '''
+        data = response[0] if len(response) == 1 else response
 
         if data != 'OK':
             error = 'Expected response data was "OK", got "%s" instead'
@@ -109,6 +183,29 @@ class WritableSetting(ReadOnlySetting):  # pylint: disable=abstract-method
 
         return data
 
+    def set(self, value):
+        '''
+        Set the setting value on the machine.
+
+        :param value: The setting value
+
+        :return: The received data
+        :rtype: str
+
+        :raises rocket.exceptions.ValidationError: When response data isn't "OK"
+        '''
+        data = self.encode(value)
+
+        LOGGER.debug('Setting value for %s on machine to "%s"…', self.__class__.__name__, data)
+
+        cache = getattr(self.machine, 'cache', None)
+
+        try:
+            return self.check_response(self.send(command='w', data=data, unpack_response=False))
+        finally:
+            if cache is not None:
+                cache.invalidate(self.address, self.length)
+
 
 class ChoiceSetting(WritableSetting):
     '''
@@ -127,15 +224,17 @@ class ChoiceSetting(WritableSetting):
         '''
         raise NotImplementedError('Choices property not implemented')
 
-    def get(self, *args, **kwargs):  # pylint: disable=arguments-differ
+    def decode(self, data, *args, **kwargs):  # pylint: disable=arguments-differ
         '''
-        Get the choice setting value from the machine.
+        Decode the choice setting value.
+
+        :param list data: The data sequence
 
         :return: The setting choice
         :rtype: str
         '''
         try:
-            index  = super().get(*args, **kwargs)
+            index  = super().decode(data, *args, **kwargs)
             choice = self.choices[index]
             LOGGER.info('Choice of %s is "%s"', self.__class__.__name__, choice)
             return choice
@@ -144,12 +243,15 @@ class ChoiceSetting(WritableSetting):
             LOGGER.error(error, index)
             raise SettingValueError(error % index)
 
-    def set(self, choice, *args, **kwargs):  # pylint: disable=arguments-differ
+    def encode(self, choice):  # pylint: disable=arguments-differ
         '''
-        Set the setting value on the machine on a specific choice.
+        Encode a specific choice.
 
         :param str choice: The name of the choice
 
+        :return: The data sequence
+        :rtype: list
+
         :raises rocket.exceptions.SettingValueError: When an invalid choice is selected
         '''
         if choice not in self.choices:
@@ -161,7 +263,7 @@ class ChoiceSetting(WritableSetting):
         LOGGER.debug('Selected choice for %s of is "%s", equals to value "%s"…',
                      self.__class__.__name__, choice, index)
 
-        return super().set([index], *args, **kwargs)
+        return [index]
 
 
 class RangeSetting(WritableSetting):
@@ -203,23 +305,28 @@ class RangeSetting(WritableSetting):
 
         return value
 
-    def get(self, *args, **kwargs):  # pylint: disable=arguments-differ
+    def decode(self, data, *args, **kwargs):  # pylint: disable=arguments-differ
         '''
-        Get the setting value from the machine.
+        Decode the setting value.
+
+        :param list data: The data sequence
 
         :return: The value
         :rtype: str
 
         :raises rocket.exceptions.SettingValueError: When value is not in valid range
         '''
-        return self.validate_value(super().get(*args, **kwargs))
+        return self.validate_value(super().decode(data, *args, **kwargs))
 
-    def set(self, value, *args, **kwargs):  # pylint: disable=arguments-differ
+    def encode(self, value):
         '''
-        Set the setting value on the machine.
+        Encode the setting value.
+
+        :param str value: The setting value
 
-        :param str data: The setting value
+        :return: The data sequence
+        :rtype: list
 
         :raises rocket.exceptions.SettingValueError: When value is not in valid range
         '''
-        return super().set([self.validate_value(value)], *args, **kwargs)
+        return [self.validate_value(value)]
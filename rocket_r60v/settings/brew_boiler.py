@@ -23,4 +23,5 @@ class CurrentBrewBoilerTemperature(ReadOnlySetting):
     '''
     The current temperature of the brew boiler.
     '''
-    address = 0xB000
+    address   = 0xB000
+    cache_ttl = 0.5
@@ -13,4 +13,5 @@ class TotalCoffeeCount(ReadOnlySetting):
     '''
     The coffee cycles.
     '''
-    address = 0x4D
+    address   = 0x4D
+    cache_ttl = 5.0
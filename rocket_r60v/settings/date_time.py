@@ -20,8 +20,9 @@ class DateTime(WritableSetting):
     '''
     The date & time (clock) of the machine.
     '''
-    address = 0xA000
-    length  = 7
+    address  = 0xA000
+    length   = 7
+    readable = False
 
     def get(self, *args, **kwargs):  # pylint: disable=arguments-differ,unused-argument
         '''
@@ -32,11 +33,14 @@ class DateTime(WritableSetting):
         '''
         return f'The date & time can only be set and not read ("fire & forget" if you will so).'
 
-    def set(self, date_and_time, *args, **kwargs):  # pylint: disable=arguments-differ
+    def encode(self, date_and_time):  # pylint: disable=arguments-differ
         '''
-        Set the date & time.
+        Encode the date & time.
 
-        :param str time: The time
+        :param str date_and_time: The date & time
+
+        :return: The data sequence
+        :rtype: list
         '''
         try:
             if date_and_time == 'auto':
@@ -51,7 +55,7 @@ class DateTime(WritableSetting):
             hour     = time_struct.tm_hour
             minute   = time_struct.tm_min
 
-            return super().set([0, minute, hour, weekday, day, month, year], *args, **kwargs)
+            return [0, minute, hour, weekday, day, month, year]
 
         except (ValueError, TypeError) as ex:
             error = 'Value "%s" is not a valid date & time format (auto | dd.mm.yy HH:MM)'
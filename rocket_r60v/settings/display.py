@@ -7,32 +7,134 @@ __all__ = (
     'CurrentBrewTime',
 )
 
+import logging
+from collections import namedtuple
+
+from rocket_r60v.message import Message
 from .base import ReadOnlySetting
 
+LOGGER = logging.getLogger(__name__)
+
+ROW_LENGTH = 16
+
+
+class DisplayState(namedtuple('DisplayState', ('rows', 'brew_time', 'screen'))):
+    '''
+    The parsed display content.
+
+    The screen is either ``brewing`` (a brew time is shown), ``boilers``
+    (the boiler temperatures are shown), ``blank`` or ``unknown``.
+    '''
+    __slots__ = ()
+
 
 class Display(ReadOnlySetting):
     '''
     The display content.
     '''
-    address = 0xB007
-    length  = 64
+    address   = 0xB007
+    length    = 64
+    cache_ttl = 0.2
+
+    @staticmethod
+    def split_rows(data):
+        '''
+        Decode raw display data into its rows (16 characters each).
+
+        :param data: The data sequence
+        :type data: list or bytes
+
+        :return: The rows
+        :rtype: list
+        '''
+        text = bytes(data).decode('latin-1')
+        return [text[i:i + ROW_LENGTH] for i in range(0, len(text), ROW_LENGTH)]
+
+    @staticmethod
+    def parse_brew_time(row):
+        '''
+        Parse the brew time of a display row (e.g. ``12.5"``).
+
+        :param str row: The display row
+
+        :return: The brew time
+        :rtype: float or None
+        '''
+        if not row.endswith('"'):
+            return None
 
-    def get(self):  # pylint: disable=arguments-differ
+        try:
+            return float(row[:-1])
+        except ValueError:
+            return None
+
+    @classmethod
+    def parse_state(cls, rows):
+        '''
+        Parse the rows of the display into a structured state.
+
+        :param list rows: The display rows
+
+        :return: The display state
+        :rtype: DisplayState
+        '''
+        brew_time = cls.parse_brew_time(rows[0]) if rows else None
+
+        if brew_time is not None:
+            screen = 'brewing'
+        elif not ''.join(rows).strip():
+            screen = 'blank'
+        elif rows[0].startswith('BREW BOIL.'):
+            screen = 'boilers'
+        else:
+            screen = 'unknown'
+
+        return DisplayState(tuple(rows), brew_time, screen)
+
+    def decode(self, data, *args, **kwargs):  # pylint: disable=arguments-differ,unused-argument
         '''
-        Get the display content of the machine.
+        Decode the display content of the machine.
+
+        :param list data: The data sequence
 
         :return: The display content
         :rtype: str
         '''
-        response = super().get()
-        string = ''
+        return '\n'.join(self.split_rows(data))
+
+    def read_rows(self, start=0, stop=4):
+        '''
+        Read only a range of rows of the display.
+
+        :param int start: The index of the first row
+        :param int stop: The index after the last row
+
+        :return: The rows
+        :rtype: list
+        '''
+        address = Display.address + start * ROW_LENGTH
+        length  = (stop - start) * ROW_LENGTH
+        cache   = getattr(self.machine, 'cache', None)
+        data    = cache.get(address, length) if cache is not None else None
+
+        if data is None:
+            LOGGER.debug('Reading display rows %d-%d from machine…', start, stop - 1)
+            data = self.machine.send_message(Message.read_request(address, length))
+            if cache is not None:
+                cache.put(address, length, data, self.cache_ttl)
+
+        return self.split_rows(data)
+
+    def get_state(self, rows=4):
+        '''
+        Get the parsed display content from the machine.
 
-        for i in range(0, self.length):
-            if i > 0 and i % 16 == 0:
-                string += '\n'
-            string += chr(response[i])
+        :param int rows: The number of rows to read (starting at the first row)
 
-        return string
+        :return: The display state
+        :rtype: DisplayState
+        '''
+        return self.parse_state(self.read_rows(0, rows))
 
 
 class CurrentBrewTime(Display):
@@ -40,16 +142,17 @@ class CurrentBrewTime(Display):
     The current brew time, taken from the display.
     '''
 
-    length = 16
+    length    = 16
+    cache_ttl = 0.1
+    alias_of  = Display
 
-    def get(self):  # pylint: disable=arguments-differ
+    def decode(self, data, *args, **kwargs):  # pylint: disable=arguments-differ,unused-argument
         '''
-        Get the current brew time.
+        Decode the current brew time.
+
+        :param list data: The data sequence
 
         :return: The brew time
         :rtype: float or None
         '''
-        response = super().get()
-        if response.endswith('"'):
-            return float(response[0:-1])
-        return None
+        return self.parse_brew_time(bytes(data).decode('latin-1'))
@@ -13,7 +13,8 @@ class Language(ChoiceSetting):
     '''
     The language of the machine.
     '''
-    address = 0x01
+    address   = 0x01
+    cache_ttl = None
 
     choices = (
         'English',
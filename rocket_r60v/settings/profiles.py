@@ -38,7 +38,8 @@ class ProfileA(WritableSetting):
     '''
     address = 22
 
-    length = 15
+    length    = 15
+    cache_ttl = None
 
     timing_range   = (0, 60)
     pressure_range = (0, 10)
@@ -122,23 +123,28 @@ class ProfileA(WritableSetting):
             pressure = data[10 + i] / 10
             yield self.validate_step(timing, pressure)
 
-    def get(self, *args, **kwargs):  # pylint: disable=arguments-differ
+    def decode(self, data, *args, **kwargs):  # pylint: disable=arguments-differ
         '''
-        Get the pressure profile from the machine.
+        Decode the pressure profile.
+
+        :param list data: The data sequence
 
         :return: The pressure profile
         :rtype: str
         '''
-        data = super().get(*args, **kwargs)
+        data = super().decode(data, *args, **kwargs)
         data = [f'{x[0]}:{x[1]}' for x in self.build_steps_from_data(data)]
         return ' '.join(data)
 
-    def set(self, profile, *args, **kwargs):  # pylint: disable=arguments-differ
+    def encode(self, profile):  # pylint: disable=arguments-differ
         '''
-        Set the pressure profile on the machine.
+        Encode the pressure profile.
 
         :param str profile: The pressure profile
 
+        :return: The data sequence
+        :rtype: list
+
         :raises rocket.exceptions.SettingValueError: When an invalid choice is selected
         '''
         steps   = str(profile).strip().split(' ')
@@ -170,7 +176,7 @@ class ProfileA(WritableSetting):
                 timing_data.extend((0, 0))
                 pressure_data.append(0)
 
-        return super().set(timing_data + pressure_data, *args, **kwargs)
+        return timing_data + pressure_data
 
 
 class ProfileB(ProfileA):
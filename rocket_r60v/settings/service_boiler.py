@@ -36,4 +36,5 @@ class CurrentServiceBoilerTemperature(ReadOnlySetting):
     '''
     The current temperature of the service boiler.
     '''
-    address = 0xB001
+    address   = 0xB001
+    cache_ttl = 0.5
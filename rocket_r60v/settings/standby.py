@@ -13,7 +13,8 @@ class Standby(ChoiceSetting):
     '''
     The standby state of the machine.
     '''
-    address = 0x4A
+    address   = 0x4A
+    cache_ttl = 5.0
 
     choices = (
         'off',
@@ -13,7 +13,8 @@ class TemperatureUnit(ChoiceSetting):
     '''
     The temperature unit.
     '''
-    address = 0x00
+    address   = 0x00
+    cache_ttl = None
 
     choices = (
         'Celsius',
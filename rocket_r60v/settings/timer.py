@@ -23,24 +23,29 @@ class AutoOn(WritableSetting):
     address = 0x51
     length = 2
 
-    def get(self, *args, **kwargs):  # pylint: disable=arguments-differ
+    def decode(self, data, *args, **kwargs):  # pylint: disable=arguments-differ
         '''
-        Get the time value from the machine.
+        Decode the time value.
 
         The time is sent in 4 bytes. The first two bytes are the hour in hex,
         the second two bytes are the minute in hex.
 
+        :param list data: The data sequence
+
         :return: The time
         :rtype: str
         '''
-        hour, minute = super().get(*args, **kwargs)
+        hour, minute = super().decode(data, *args, **kwargs)
         return f'{hour:02d}:{minute:02d}'
 
-    def set(self, time, *args, **kwargs):  # pylint: disable=arguments-differ
+    def encode(self, time):  # pylint: disable=arguments-differ
         '''
-        Set the time on the machine.
+        Encode the time.
 
         :param str time: The time
+
+        :return: The data sequence
+        :rtype: list
         '''
         try:
             hour, minute = str(time).split(':')
@@ -48,7 +53,7 @@ class AutoOn(WritableSetting):
             minute       = int(minute)
             assert 0 <= hour <= 23
             assert 0 <= minute <= 59
-            return super().set([hour, minute], *args, **kwargs)
+            return [hour, minute]
 
         except (ValueError, AssertionError):
             error = 'Value "%s" is not a valid time (HH:MM)'
@@ -0,0 +1,194 @@
+'''
+Rocket shot detection module.
+'''
+
+__all__ = (
+    'ShotStart',
+    'Shot',
+    'ShotDetector',
+    'detect_shots',
+)
+
+import logging
+from collections import namedtuple
+
+LOGGER = logging.getLogger(__name__)
+
+CONTEXT = ('active_profile', 'total_coffee_count')
+
+
+class ShotStart(namedtuple('ShotStart', ('timestamp', 'active_profile'))):
+    '''
+    The event which is emitted when a shot starts.
+    '''
+    __slots__ = ()
+
+
+class Shot(namedtuple('Shot', (
+        'start',
+        'end',
+        'duration',
+        'peak_brew_boiler_temperature',
+        'mean_brew_boiler_temperature',
+        'active_profile',
+        'coffee_count',
+))):
+    '''
+    The summary of a shot, which is emitted when a shot ends.
+
+    The duration is taken from the brew time on the display, the
+    ``coffee_count`` is the delta of the total coffee count during the shot.
+    '''
+    __slots__ = ()
+
+
+class ShotDetector:  # pylint: disable=too-many-instance-attributes
+    '''
+    A streaming state machine which detects shots in telemetry samples.
+
+    A shot starts as soon as the display shows a brew time and it ends when
+    the brew time disappears again. The samples aren't stored, only running
+    aggregates of the current shot are kept. Thus, the detector needs constant
+    memory, no matter how many samples it consumes.
+
+    When a machine is passed, the active profile & total coffee count are read
+    at the start and at the end of each shot.
+
+    .. code-block:: python
+
+        detector = ShotDetector(machine)
+
+        for sample in TelemetrySampler(machine).samples():
+            for event in detector.update(sample):
+                print(event)
+    '''
+
+    def __init__(self, machine=None, grace=1):
+        '''
+        Constructor.
+
+        :param machine: The machine to read the shot context from
+        :param int grace: The number of samples without brew time which end a shot
+        '''
+        self.machine = machine
+        self.grace   = grace
+        self.shot    = None
+
+    @property
+    def brewing(self):
+        '''
+        Flag if a shot is in progress.
+
+        :return: The flag
+        :rtype: bool
+        '''
+        return self.shot is not None
+
+    def read_context(self):
+        '''
+        Read the active profile & total coffee count from the machine.
+
+        :return: The context values
+        :rtype: dict
+        '''
+        if self.machine is None:
+            return dict.fromkeys(CONTEXT)
+
+        return self.machine.read_many(CONTEXT)
+
+    def update(self, sample):
+        '''
+        Consume a sample.
+
+        :param rocket_r60v.telemetry.Sample sample: The sample
+
+        :return: The emitted events
+        :rtype: list
+        '''
+        shot = self.shot
+
+        if sample.brew_time is None:
+            if shot is None:
+                return []
+
+            shot['idle'] += 1
+            if shot['idle'] < self.grace:
+                return []
+
+            return [self.finish()]
+
+        temperature = sample.brew_boiler_temperature
+
+        if shot is None:
+            context   = self.read_context()
+            shot      = self.shot = {
+                'start': sample.timestamp,
+                'end': sample.timestamp,
+                'duration': sample.brew_time,
+                'peak': temperature,
+                'sum': 0.0,
+                'count': 0,
+                'idle': 0,
+                'context': context,
+            }
+            LOGGER.info('Shot started at %s', sample.timestamp)
+            events = [ShotStart(sample.timestamp, context['active_profile'])]
+        else:
+            events = []
+
+        shot['end']      = sample.timestamp
+        shot['duration'] = max(shot['duration'], sample.brew_time)
+        shot['idle']     = 0
+
+        if temperature is not None:
+            shot['peak']   = temperature if shot['peak'] is None else max(shot['peak'], temperature)
+            shot['sum']   += temperature
+            shot['count'] += 1
+
+        return events
+
+    def finish(self):
+        '''
+        Finish the current shot.
+
+        :return: The shot summary
+        :rtype: Shot
+        '''
+        shot      = self.shot
+        self.shot = None
+        start     = shot['context']
+        end       = self.read_context()
+        count     = None
+
+        if start['total_coffee_count'] is not None and end['total_coffee_count'] is not None:
+            count = end['total_coffee_count'] - start['total_coffee_count']
+
+        LOGGER.info('Shot ended after %.1fs', shot['duration'])
+
+        return Shot(
+            start=shot['start'],
+            end=shot['end'],
+            duration=shot['duration'],
+            peak_brew_boiler_temperature=shot['peak'],
+            mean_brew_boiler_temperature=shot['sum'] / shot['count'] if shot['count'] else None,
+            active_profile=start['active_profile'],
+            coffee_count=count,
+        )
+
+
+def detect_shots(samples, machine=None, grace=1):
+    '''
+    Detect the shots in a stream of samples.
+
+    :param samples: The samples
+    :type samples: iterable
+    :param machine: The machine to read the shot context from
+    :param int grace: The number of samples without brew time which end a shot
+
+    :return: The events
+    :rtype: generator
+    '''
+    detector = ShotDetector(machine, grace=grace)
+
+    for sample in samples:
+        yield from detector.update(sample)
@@ -0,0 +1,496 @@
+'''
+Rocket simulator module.
+'''
+
+__all__ = (
+    'Simulator',
+    'LoopbackConnection',
+    'LoopbackPool',
+)
+
+import logging
+import random
+import socket
+import socketserver
+import threading
+from collections import deque
+from time import monotonic, sleep
+
+from .connection import Connection
+from .message import Message
+from .pool import ConnectionPool
+from .protocol import ServerProtocol
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MEMORY = {
+    0x00: bytes([0]),
+    0x01: bytes([0]),
+    0x02: bytes([105]),
+    0x03: bytes([123]),
+    22: bytes.fromhex('3C00B4003C0000000000285A320000'),
+    38: bytes.fromhex('5000DC00000000000000285A000000'),
+    54: bytes.fromhex('C80064000000000000005A32000000'),
+    0x46: bytes([0]),
+    0x47: bytes([0]),
+    0x49: bytes([1]),
+    0x4A: bytes([0]),
+    0x4D: bytes([140]),
+    0x51: bytes([6, 0]),
+    0x53: bytes([23, 0]),
+    0xB000: bytes([105, 123]),
+}
+
+DEFAULT_DISPLAY = (
+    'BREW BOIL. 105*C',
+    'SERV BOIL. 123*C',
+    'PRESSURE PROF. A',
+    '                ',
+)
+
+DISPLAY_ADDRESS = 0xB007
+
+
+class SimulatorRequestHandler(socketserver.BaseRequestHandler):
+    '''
+    Request handler which serves a single client connection.
+    '''
+
+    def handle(self):
+        '''
+        Say hello and answer all requests of the client.
+        '''
+        simulator = self.server.simulator
+        protocol  = ServerProtocol()
+
+        LOGGER.info('Client %s:%d connected', *self.client_address[0:2])
+
+        self.request.sendall(protocol.hello())
+
+        while True:
+            try:
+                chunk = self.request.recv(1024)
+            except OSError:
+                break
+            if not chunk:
+                break
+
+            try:
+                for request in protocol.feed(chunk):
+                    response = simulator.handle_request(request)
+
+                    if response is not None:
+                        simulator.send_response(self.request, response)
+            except OSError:
+                break
+
+        LOGGER.info('Client %s:%d disconnected', *self.client_address[0:2])
+
+
+class LoopbackPeer:
+    '''
+    The simulator side of an in-memory socket, which receives the responses.
+    '''
+
+    def __init__(self, buffer):
+        '''
+        Constructor.
+
+        :param bytearray buffer: The receive buffer of the in-memory socket
+        '''
+        self.buffer = buffer
+
+    def sendall(self, data):
+        '''
+        Receive a response of the simulator.
+
+        :param bytes data: The data
+        '''
+        self.buffer.extend(data)
+
+
+class LoopbackSocket:
+    '''
+    An in-memory socket, which passes the requests directly to a simulator.
+
+    Dropped responses result in a timeout, like with a real socket.
+    '''
+
+    def __init__(self, simulator):
+        '''
+        Constructor.
+
+        :param Simulator simulator: The simulator
+        '''
+        self.simulator = simulator
+        self.protocol  = ServerProtocol()
+        self.buffer    = bytearray(self.protocol.hello())
+        self.peer      = LoopbackPeer(self.buffer)
+
+    def send(self, data):
+        '''
+        Pass the requests to the simulator.
+
+        :param bytes data: The data
+
+        :return: The number of sent bytes
+        :rtype: int
+        '''
+        simulator = self.simulator
+
+        for request in self.protocol.feed(data):
+            response = simulator.handle_request(request)
+
+            if response is not None:
+                simulator.send_response(self.peer, response)
+
+        return len(data)
+
+    def settimeout(self, timeout):
+        '''
+        Set the timeout of the socket, which is ignored as dropped responses
+        time out immediately.
+
+        :param float timeout: The timeout in seconds
+        '''
+
+    def sendall(self, data):
+        '''
+        Pass all requests to the simulator.
+
+        :param bytes data: The data
+        '''
+        self.send(data)
+
+    def recv(self, size):
+        '''
+        Take the received responses.
+
+        :param int size: The max. number of bytes
+
+        :return: The data
+        :rtype: bytes
+
+        :raises socket.timeout: When there's no response
+        '''
+        if not self.buffer:
+            raise socket.timeout('timed out')
+
+        data = bytes(self.buffer[0:size])
+        del self.buffer[0:size]
+        return data
+
+    def close(self):
+        '''
+        Close the socket.
+        '''
+        self.buffer.clear()
+
+
+class LoopbackConnection(Connection):
+    '''
+    A connection to a simulator, which doesn't use any TCP socket at all.
+
+    The simulator doesn't need to be started, as the protocol is handled
+    in-memory by the same code as the real connections.
+    '''
+
+    def __init__(self, simulator, *args, **kwargs):
+        '''
+        Constructor.
+
+        :param Simulator simulator: The simulator
+        '''
+        super().__init__(*args, **kwargs)
+        self.simulator = simulator
+
+    def open(self, timeout):
+        '''
+        Open an in-memory socket to the simulator.
+
+        :param float timeout: The connect timeout in seconds (ignored)
+
+        :return: The socket
+        :rtype: LoopbackSocket
+        '''
+        return LoopbackSocket(self.simulator)
+
+    def is_healthy(self):
+        '''
+        Check if the connection is still established.
+
+        :return: The health state
+        :rtype: bool
+        '''
+        return self.socket is not None
+
+
+class LoopbackPool(ConnectionPool):
+    '''
+    A connection pool which creates in-memory connections to a simulator.
+
+    .. code-block:: python
+
+        simulator = Simulator()
+        machine   = Machine(pool=LoopbackPool(simulator))
+    '''
+
+    def __init__(self, simulator):
+        '''
+        Constructor.
+
+        :param Simulator simulator: The simulator
+        '''
+        super().__init__()
+        self.simulator = simulator
+
+    def create_connection(self, address, port, timeout, connect_timeout=None):
+        '''
+        Create a new in-memory connection to the simulator.
+
+        :param str address: The IP address of the machine
+        :param int port: The port number of the machine
+        :param float timeout: The max. response timeout in seconds
+        :param float connect_timeout: The connect timeout in seconds
+
+        :return: The connection
+        :rtype: LoopbackConnection
+        '''
+        return LoopbackConnection(self.simulator, address, port, timeout, connect_timeout)
+
+
+class SimulatorServer(socketserver.ThreadingTCPServer):
+    '''
+    Threading TCP server of the simulator.
+    '''
+    allow_reuse_address = True
+    daemon_threads      = True
+
+
+class Simulator:  # pylint: disable=too-many-instance-attributes
+    '''
+    A simulated Rocket R60V, which serves the message protocol on a local
+    TCP port.
+
+    The simulator keeps a 64 KiB memory image, which is initialised with
+    plausible settings. Reads & writes are answered with proper envelopes and
+    checksums. Additionally, faults can be injected to test the error handling
+    of clients:
+
+    - ``latency``: Delay of each response in seconds
+    - ``jitter``: Random additional delay of each response in seconds
+    - ``short_reads``: Send responses in several small chunks
+    - ``drop_rate``: Probability of not answering a request at all
+    - ``corrupt_rate``: Probability of answering with an invalid checksum
+
+    The last received requests are kept in :py:attr:`requests` (up to
+    ``max_requests``), all requests are counted in :py:attr:`request_count`.
+
+    The simulator can be used as context manager, which starts and stops the
+    server in a background thread:
+
+    .. code-block:: python
+
+        with Simulator(port=0) as simulator:
+            machine = Machine(address=simulator.address, port=simulator.port)
+    '''
+    max_requests = 1000
+
+    def __init__(self, address='127.0.0.1', port=1774, latency=0.0, jitter=0.0,  # pylint: disable=too-many-arguments
+                 short_reads=False, drop_rate=0.0, corrupt_rate=0.0, script=None, seed=None):
+        '''
+        Constructor.
+
+        :param str address: The listen address
+        :param int port: The listen port (``0`` for a random port)
+        :param float latency: The response latency in seconds
+        :param float jitter: The max. random response jitter in seconds
+        :param bool short_reads: Send responses in several small chunks
+        :param float drop_rate: The probability of dropped responses
+        :param float corrupt_rate: The probability of invalid checksums
+        :param callable script: Called with the simulator & elapsed seconds before each read
+        :param int seed: The seed of the fault injection
+        '''
+        self.address       = address
+        self.port          = port
+        self.latency       = latency
+        self.jitter        = jitter
+        self.short_reads   = short_reads
+        self.drop_rate     = drop_rate
+        self.corrupt_rate  = corrupt_rate
+        self.script        = script
+        self.random        = random.Random(seed)
+        self.memory        = bytearray(0x10000)
+        self.lock          = threading.Lock()
+        self.requests      = deque(maxlen=self.max_requests)
+        self.request_count = 0
+        self.server        = None
+        self.thread        = None
+        self.started       = monotonic()
+
+        for address, data in DEFAULT_MEMORY.items():
+            self.write(address, data)
+
+        self.write_display(*DEFAULT_DISPLAY)
+
+    def __enter__(self):
+        '''
+        Start the simulator when entering the context.
+        '''
+        return self.start()
+
+    def __exit__(self, *args):
+        '''
+        Stop the simulator when leaving the context.
+        '''
+        self.stop()
+
+    def bind(self):
+        '''
+        Bind the server to its address & port.
+        '''
+        self.server           = SimulatorServer((self.address, self.port), SimulatorRequestHandler)
+        self.server.simulator = self
+        self.port             = self.server.server_address[1]
+        self.started          = monotonic()
+
+        LOGGER.info('Simulator listening on %s:%d', self.address, self.port)
+
+    def start(self):
+        '''
+        Start the simulator in a background thread.
+
+        :return: The simulator
+        :rtype: Simulator
+        '''
+        self.bind()
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.01,), daemon=True)
+        self.thread.start()
+        return self
+
+    def serve_forever(self):
+        '''
+        Run the simulator in the foreground until it's interrupted.
+        '''
+        self.bind()
+        try:
+            self.server.serve_forever()
+        finally:
+            self.server.server_close()
+
+    def stop(self):
+        '''
+        Stop the simulator.
+        '''
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def read(self, address, length):
+        '''
+        Read from the memory image.
+
+        :param int address: The memory address
+        :param int length: The data length
+
+        :return: The data
+        :rtype: bytes
+        '''
+        with self.lock:
+            return bytes(self.memory[address:address + length])
+
+    def write(self, address, data):
+        '''
+        Write to the memory image.
+
+        :param int address: The memory address
+        :param bytes data: The data
+        '''
+        with self.lock:
+            self.memory[address:address + len(data)] = data
+
+    def write_display(self, *rows):
+        '''
+        Write the rows (16 characters each) of the display.
+
+        :param str rows: The rows
+        '''
+        text = ''.join(f'{row:<16.16}' for row in rows)
+        self.write(DISPLAY_ADDRESS, f'{text:<64.64}'.encode('latin-1'))
+
+    def handle_request(self, request):
+        '''
+        Handle a single request.
+
+        :param str request: The raw request message
+
+        :return: The raw response message or ``None`` if it's dropped
+        :rtype: str or None
+        '''
+        LOGGER.debug('Received request "%s"', request)
+
+        self.requests.append(request)
+        self.request_count += 1
+
+        command  = request[0]
+        envelope = request[0:9]
+
+        try:
+            address = int(request[1:5], 16)
+            length  = int(request[5:9], 16)
+            data    = bytes.fromhex(request[9:-2])
+        except ValueError:
+            LOGGER.warning('Ignoring invalid request "%s"', request)
+            return None
+
+        if request[-2:] != Message.calculate_checksum(request[0:-2]) or command not in 'rw':
+            LOGGER.warning('Ignoring invalid request "%s"', request)
+            return None
+
+        if self.drop_rate and self.random.random() < self.drop_rate:
+            LOGGER.info('Dropping request "%s"', request)
+            return None
+
+        if command == 'w':
+            self.write(address, data)
+            message = f'{envelope}OK'
+        else:
+            if self.script is not None:
+                self.script(self, monotonic() - self.started)
+            message = f'{envelope}{self.read(address, length).hex().upper()}'
+
+        checksum = Message.calculate_checksum(message)
+
+        if self.corrupt_rate and self.random.random() < self.corrupt_rate:
+            LOGGER.info('Corrupting response of request "%s"', request)
+            checksum = f'{(int(checksum, 16) + 1) % 256:02X}'
+
+        return f'{message}{checksum}'
+
+    def send_response(self, sock, response):
+        '''
+        Send a response, with the configured latency & short reads.
+
+        :param socket.socket sock: The client socket
+        :param str response: The raw response message
+        '''
+        delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay:
+            sleep(delay)
+
+        data = response.encode()
+
+        if not self.short_reads:
+            sock.sendall(data)
+            return
+
+        while data:
+            size = self.random.randint(1, max(1, len(data) // 2))
+            sock.sendall(data[0:size])
+            data = data[size:]
+            sleep(0.001)
@@ -0,0 +1,151 @@
+'''
+Rocket single-flight module.
+'''
+
+__all__ = (
+    'SingleFlight',
+    'AsyncSingleFlight',
+)
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+
+LOGGER = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    '''
+    Collapses concurrent identical calls (e.g. reads of the same address &
+    length) of multiple threads into a single call.
+
+    The first caller of a key executes the call, all other callers of the
+    same key wait for it and get the same result (or exception).
+    '''
+
+    def __init__(self):
+        '''
+        Constructor.
+        '''
+        self.calls = {}
+        self.lock  = threading.Lock()
+
+    def __len__(self):
+        '''
+        The number of calls in flight.
+
+        :return: The number of calls
+        :rtype: int
+        '''
+        return len(self.calls)
+
+    def call(self, key, function, *args, deadline=None, **kwargs):
+        '''
+        Execute a call, unless an identical call is already in flight.
+
+        :param key: The key of the call
+        :param callable function: The function
+        :param args: The positional arguments of the function
+        :param rocket_r60v.timing.Deadline deadline: The deadline which limits the wait for a call in flight
+        :param kwargs: The keyword arguments of the function
+
+        :return: The result of the function
+        :rtype: mixed
+
+        :raises rocket.exceptions.DeadlineExceededError: When the deadline is exceeded
+        '''
+        with self.lock:
+            future = self.calls.get(key)
+            leader = future is None
+            if leader:
+                future = self.calls[key] = Future()
+
+        if not leader:
+            LOGGER.debug('Joining call "%s" in flight…', key)
+            return future.result() if deadline is None else deadline.result(future)
+
+        try:
+            result = function(*args, **kwargs)
+        except BaseException as ex:
+            future.set_exception(ex)
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            with self.lock:
+                del self.calls[key]
+
+        return result
+
+
+class AsyncSingleFlight:
+    '''
+    Collapses concurrent identical calls of multiple asyncio tasks into a
+    single call.
+
+    When the task of the call is cancelled, the call is re-issued by one of
+    the waiting tasks, so that they don't inherit the cancellation.
+
+    .. seealso:
+
+        Class :py:class:`SingleFlight`
+            The threaded single-flight
+    '''
+
+    def __init__(self):
+        '''
+        Constructor.
+        '''
+        self.calls = {}
+
+    def __len__(self):
+        '''
+        The number of calls in flight.
+
+        :return: The number of calls
+        :rtype: int
+        '''
+        return len(self.calls)
+
+    async def call(self, key, function, *args, **kwargs):
+        '''
+        Await a call, unless an identical call is already in flight.
+
+        :param key: The key of the call
+        :param callable function: The coroutine function
+        :param args: The positional arguments of the function
+        :param kwargs: The keyword arguments of the function
+
+        :return: The result of the function
+        :rtype: mixed
+        '''
+        future = self.calls.get(key)
+
+        while future is not None:
+            LOGGER.debug('Joining call "%s" in flight…', key)
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+            LOGGER.debug('Call "%s" in flight was cancelled, re-issuing…', key)
+            future = self.calls.get(key)
+
+        future = self.calls[key] = asyncio.get_running_loop().create_future()
+
+        try:
+            result = await function(*args, **kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as ex:
+            future.set_exception(ex)
+            future.exception()  # Mark the exception as retrieved, there might be no other callers.
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            del self.calls[key]
+
+        return result
@@ -0,0 +1,211 @@
+'''
+Rocket telemetry module.
+'''
+
+__all__ = (
+    'Sample',
+    'TelemetrySampler',
+    'parse_rate',
+    'FORMATS',
+)
+
+import asyncio
+import json
+import logging
+from collections import namedtuple
+from time import monotonic, sleep, time
+
+from .planner import plan_reads
+from .worker import PRIORITY_POLL
+
+LOGGER = logging.getLogger(__name__)
+
+SETTINGS = (
+    ('brew_boiler_temperature', 'current_brew_boiler_temperature'),
+    ('service_boiler_temperature', 'current_service_boiler_temperature'),
+    ('brew_time', 'current_brew_time'),
+)
+
+
+class Sample(namedtuple('Sample', ('timestamp',) + tuple(x[0] for x in SETTINGS))):
+    '''
+    A timestamped telemetry sample of the machine.
+    '''
+    __slots__ = ()
+
+    def to_csv(self):
+        '''
+        Format the sample as CSV row.
+
+        :return: The CSV row
+        :rtype: str
+        '''
+        return ','.join('' if x is None else str(x) for x in self)
+
+    def to_jsonl(self):
+        '''
+        Format the sample as JSON line.
+
+        :return: The JSON line
+        :rtype: str
+        '''
+        return json.dumps(self._asdict())
+
+
+FORMATS = {
+    'csv': (','.join(Sample._fields), Sample.to_csv),
+    'jsonl': (None, Sample.to_jsonl),
+}
+
+
+def parse_rate(rate):
+    '''
+    Parse a sample rate like ``10hz`` or ``2.5``.
+
+    :param str rate: The sample rate in Hz
+
+    :return: The sample rate in Hz
+    :rtype: float
+
+    :raises ValueError: When the rate is invalid
+    '''
+    value = str(rate).strip().lower()
+
+    if value.endswith('hz'):
+        value = value[:-2]
+
+    value = float(value)
+
+    if value <= 0:
+        raise ValueError(f'Invalid sample rate "{rate}"')
+
+    return value
+
+
+class TelemetrySampler:
+    '''
+    A sampler which polls the boiler temperatures and the brew time of the
+    machine at a fixed rate.
+
+    All values are read with a single coalesced memory read. The samples are
+    scheduled relative to the start of the sampler (and not by sleeping after
+    each sample), so the rate doesn't drift. When a sample is late, the next
+    one is read immediately. Samples which are missed completely are skipped.
+
+    The sampler works with :py:class:`rocket_r60v.machine.Machine` via
+    :py:meth:`samples` and with
+    :py:class:`rocket_r60v.async_machine.AsyncMachine` via
+    :py:meth:`async_samples`.
+    '''
+
+    def __init__(self, machine, rate=10.0, clock=monotonic, sleep=sleep):  # pylint: disable=redefined-outer-name
+        '''
+        Constructor.
+
+        :param machine: The (connected) machine
+        :param float rate: The sample rate in Hz
+        :param callable clock: The clock which returns the current time in seconds
+        :param callable sleep: The function which sleeps for a number of seconds
+        '''
+        self.machine  = machine
+        self.interval = 1.0 / rate
+        self.clock    = clock
+        self.sleep    = sleep
+        self.skipped  = 0
+
+        settings   = [(name, machine.get_setting(setting)) for name, setting in SETTINGS]
+        self.reads = plan_reads(settings, max_gap=machine.read_gap, max_length=machine.read_max_length)
+
+        LOGGER.debug('Sampling with %d read(s) every %.3fs', len(self.reads), self.interval)
+
+    def build_sample(self, responses):
+        '''
+        Build a sample out of the received data.
+
+        :param list responses: The received data of each read
+
+        :return: The sample
+        :rtype: Sample
+        '''
+        values = {}
+
+        for read, data in zip(self.reads, responses):
+            values.update(read.decode(data))
+
+        return Sample(timestamp=time(), **values)
+
+    def sample(self):
+        '''
+        Read a single sample from the machine.
+
+        The messages are sent with background polling priority, thus a
+        threaded machine sends the messages of other threads first.
+
+        :return: The sample
+        :rtype: Sample
+        '''
+        with self.machine.priority(PRIORITY_POLL):
+            return self.build_sample(self.machine.send_messages([x.build_message() for x in self.reads]))
+
+    async def async_sample(self):
+        '''
+        Read a single sample from the asyncio machine.
+
+        :return: The sample
+        :rtype: Sample
+        '''
+        return self.build_sample([await self.machine.send_message(x.build_message()) for x in self.reads])
+
+    def schedule(self):
+        '''
+        Calculate the delays until the next samples are due.
+
+        :return: The delay in seconds before each sample
+        :rtype: generator
+        '''
+        start = self.clock()
+        tick  = 0
+
+        while True:
+            yield max(0.0, start + tick * self.interval - self.clock())
+
+            tick += 1
+            now   = self.clock()
+            due   = start + tick * self.interval
+            skip  = int((now - due) / self.interval) if due < now else 0
+
+            if skip:
+                LOGGER.warning('Sampler is late by %.3fs, skipping %d sample(s)', now - due, skip)
+                self.skipped += skip
+                tick         += skip
+
+    def samples(self, count=None):
+        '''
+        Read samples at the configured rate.
+
+        :param int count: The number of samples, ``None`` for infinite samples
+
+        :return: The samples
+        :rtype: generator
+        '''
+        for i, delay in enumerate(self.schedule()):
+            if count is not None and i >= count:
+                return
+            if delay:
+                self.sleep(delay)
+            yield self.sample()
+
+    async def async_samples(self, count=None):
+        '''
+        Read samples at the configured rate from the asyncio machine.
+
+        :param int count: The number of samples, ``None`` for infinite samples
+
+        :return: The samples
+        :rtype: async generator
+        '''
+        for i, delay in enumerate(self.schedule()):
+            if count is not None and i >= count:
+                return
+            await asyncio.sleep(delay)
+            yield await self.async_sample()
@@ -2,6 +2,26 @@
 Unit tests for the Rocket module.
 '''
 
+from .api import *
+from .async_machine import *
+from .buffer import *
+from .cache import *
+from .config import *
+from .diff import *
+from .dump import *
+from .fleet import *
+from .health import *
 from .machine import *
+from .memory_map import *
 from .message import *
+from .planner import *
+from .pool import *
+from .protocol import *
+from .registry import *
+from .shots import *
+from .simulator import *
+from .singleflight import *
+from .telemetry import *
+from .timing import *
+from .worker import *
 from .settings import *
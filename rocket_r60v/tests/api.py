@@ -0,0 +1,253 @@
+#!/usr/bin/env python
+# pylint: disable=no-self-use,unused-argument
+'''
+Unit test cases for the Rocket API module.
+'''
+
+__all__ = (
+    'TestAPI',
+)
+
+import logging
+import socket
+from unittest import TestCase, main
+from unittest.mock import patch
+
+from rocket_r60v.api import API
+from rocket_r60v.connection import Connection
+from rocket_r60v.health import OPEN, HealthRegistry
+from rocket_r60v.message import Message
+from rocket_r60v.exceptions import CircuitOpenError, RocketConnectionError, ValidationError
+
+logging.disable()
+
+
+class FakeSocket:
+    '''
+    Fake socket which behaves like a machine that can handle ``window``
+    pipelined messages, and drops all of them if there are more. A broken
+    socket was reset by the machine after the handshake.
+    '''
+
+    def __init__(self, window, broken=False):
+        '''
+        Constructor.
+        '''
+        self.window   = window
+        self.broken   = broken
+        self.hello    = False
+        self.requests = []
+        self.answered = 0
+
+    def settimeout(self, timeout):
+        '''
+        Ignore the timeout.
+        '''
+
+    def sendall(self, data):
+        '''
+        Receive a request.
+        '''
+        if self.broken:
+            raise BrokenPipeError()
+        self.requests.append(data.decode())
+
+    def recv(self, *args):
+        '''
+        Answer all unanswered requests.
+        '''
+        if not self.hello:
+            self.hello = True
+            return b'*HELLO*'
+
+        requests      = self.requests[self.answered:]
+        self.answered = len(self.requests)
+
+        if len(requests) > self.window:
+            raise socket.timeout()
+
+        response = ''
+        for request in requests:
+            message   = f'{request[0:9]}{"00" * int(request[5:9], 16)}'
+            response += f'{message}{Message.calculate_checksum(message)}'
+
+        return response.encode()
+
+    def close(self):
+        '''
+        Close the socket.
+        '''
+
+
+class TestAPI(TestCase):
+    '''
+    Test rocket_r60v.api.API class and its methods.
+    '''
+
+    def setUp(self):
+        '''
+        Reset the cached pipeline windows.
+        '''
+        API.pipeline_windows.clear()
+
+    def _connect(self, mock_socket, *chunks):
+        '''
+        Connect the API and let the socket return the chunks afterwards.
+        '''
+        mock_socket.return_value.recv.side_effect = [b'*HELLO*', *chunks]
+        api = API()
+        api.connect()
+        return api
+
+    @patch('rocket_r60v.api.socket.create_connection')
+    def test_short_reads(self, mock_socket):
+        '''
+        Test if a frame which is split into several chunks is read completely.
+        '''
+        api = self._connect(mock_socket, b'r0001', b'000101', b'55')
+        self.assertEqual(api.read(), 'r000100010155')
+
+    @patch('rocket_r60v.api.socket.create_connection')
+    def test_split_hello(self, mock_socket):
+        '''
+        Test if a split ``*HELLO*`` frame is read completely.
+        '''
+        mock_socket.return_value.recv.side_effect = [b'*HEL', b'LO*']
+        API().connect()
+
+    @patch('rocket_r60v.api.socket.create_connection')
+    def test_multiple_frames(self, mock_socket):
+        '''
+        Test if multiple frames in a single chunk are read one by one.
+        '''
+        api = self._connect(mock_socket, b'w00010001OK93r000100010155')
+        self.assertEqual(api.read(), 'w00010001OK93')
+        self.assertEqual(api.read(), 'r000100010155')
+
+    @patch('rocket_r60v.api.socket.create_connection')
+    def test_large_frame(self, mock_socket):
+        '''
+        Test if a frame larger than the buffer size is read completely.
+        '''
+        message = f'rB0000200{"41" * 0x200}'
+        message = f'{message}{Message.calculate_checksum(message)}'
+        chunks  = [message[i:i + Connection.buffer_size].encode()
+                   for i in range(0, len(message), Connection.buffer_size)]
+
+        api = self._connect(mock_socket, *chunks)
+        self.assertEqual(api.send_message(Message('r', 0xB000, 0x200)), [0x41] * 0x200)
+
+    @patch('rocket_r60v.api.socket.create_connection')
+    def test_connection_closed(self, mock_socket):
+        '''
+        Test if ``RocketConnectionError`` is raised when the connection is closed.
+        '''
+        api = self._connect(mock_socket, b'r0001', b'')
+        with self.assertRaises(RocketConnectionError):
+            api.read()
+
+    @patch('rocket_r60v.api.socket.create_connection')
+    def test_invalid_frame(self, mock_socket):
+        '''
+        Test if ``ValidationError`` is raised and the buffer is reset on invalid frames.
+        '''
+        api = self._connect(mock_socket, b'rXXXXXXXXXXX', b'r000100010155')
+        with self.assertRaises(ValidationError):
+            api.read()
+        self.assertEqual(api.read(), 'r000100010155')
+
+    @patch('rocket_r60v.api.socket.create_connection')
+    def test_pipelined_messages(self, mock_socket):
+        '''
+        Test if messages are pipelined and responses are matched to requests.
+        '''
+        api      = self._connect(mock_socket, b'r000200016964r000100010357w00010001OK93')
+        messages = [Message('r', 1, 1), Message('r', 2, 1), Message('w', 1, 1, 3)]
+
+        self.assertEqual(api.send_messages(messages, window=3), [[3], [0x69], ['OK']])
+        self.assertEqual(mock_socket.return_value.sendall.call_count, 3)
+
+    @patch('rocket_r60v.api.socket.create_connection')
+    def test_pipeline_window_probe(self, mock_socket):
+        '''
+        Test if the pipeline window is probed and cached per machine.
+        '''
+        sockets = []
+        mock_socket.side_effect = lambda *args: sockets.append(FakeSocket(window=4)) or sockets[-1]
+
+        api = API(pipeline=True)
+        api.connect()
+
+        self.assertEqual(api.get_pipeline_window(), 4)
+        self.assertEqual(API.pipeline_windows, {('192.168.1.1', 1774): 4})
+        self.assertEqual(len(sockets), 2)
+
+        messages = [Message('r', address, 1) for address in range(10)]
+        self.assertEqual(api.send_messages(messages), [[0]] * 10)
+        self.assertEqual(len(sockets), 2)
+
+        self.assertEqual(API(pipeline=False).get_pipeline_window(), 1)
+
+    @patch('rocket_r60v.api.socket.create_connection')
+    def test_pipeline_fallback(self, mock_socket):
+        '''
+        Test if the API falls back to serial mode when pipelined messages are dropped.
+        '''
+        sockets = []
+        mock_socket.side_effect = lambda *args: sockets.append(FakeSocket(window=1)) or sockets[-1]
+
+        api = API()
+        api.connect()
+
+        messages = [Message('r', address, 1) for address in range(3)]
+        self.assertEqual(api.send_messages(messages, window=3), [[0]] * 3)
+        self.assertEqual(API.pipeline_windows, {('192.168.1.1', 1774): 1})
+        self.assertEqual(len(sockets), 2)
+        self.assertEqual(len(sockets[1].requests), 3)
+
+    @patch('rocket_r60v.api.socket.create_connection')
+    def test_pipeline_reconnect(self, mock_socket):
+        '''
+        Test if the API reconnects when the connection is lost while pipelining.
+        '''
+        sockets = []
+        mock_socket.side_effect = lambda *args: sockets.append(FakeSocket(window=4, broken=not sockets)) or sockets[-1]
+
+        api = API()
+        api.connect()
+
+        messages = [Message('r', address, 1) for address in range(3)]
+        self.assertEqual(api.send_messages(messages, window=3), [[0]] * 3)
+        self.assertEqual(len(sockets), 2)
+        self.assertEqual(len(sockets[1].requests), 3)
+
+        sockets[1].broken       = True
+        mock_socket.side_effect = lambda *args: sockets.append(FakeSocket(window=4, broken=True)) or sockets[-1]
+
+        with self.assertRaises(RocketConnectionError):
+            api.send_messages(messages, window=3)
+
+    @patch('rocket_r60v.api.socket.create_connection')
+    def test_pipeline_circuit(self, mock_socket):
+        '''
+        Test if pipelined messages are guarded by the circuit breaker.
+        '''
+        sockets = []
+        mock_socket.side_effect = lambda *args: sockets.append(FakeSocket(window=4, broken=True)) or sockets[-1]
+
+        api = API(health=HealthRegistry(failure_threshold=1))
+        api.connect()
+
+        messages = [Message('r', address, 1) for address in range(3)]
+        with self.assertRaises(RocketConnectionError):
+            api.send_messages(messages, window=3)
+        self.assertEqual(api.health.get_breaker(api.address, api.port).state, OPEN)
+
+        connects = len(sockets)
+        with self.assertRaises(CircuitOpenError):
+            api.send_messages(messages, window=3)
+        self.assertEqual(len(sockets), connects)
+
+
+if __name__ == '__main__':
+    main()
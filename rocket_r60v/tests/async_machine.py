@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# pylint: disable=no-self-use,unused-argument
+'''
+Unit test cases for the Rocket asyncio machine module.
+'''
+
+__all__ = (
+    'TestAsyncMachine',
+)
+
+import asyncio
+import logging
+from unittest import TestCase, main
+
+from rocket_r60v.async_machine import AsyncMachine
+from rocket_r60v.message import Message
+from rocket_r60v.exceptions import RocketConnectionError, SettingValueError, UnknownSettingError
+
+logging.disable()
+
+
+class TestAsyncMachine(TestCase):
+    '''
+    Test rocket_r60v.async_machine.AsyncMachine class and its methods.
+    '''
+
+    def _run(self, test, hello=b'*HELLO*', latency=0.0):
+        '''
+        Run a test coroutine against a local fake machine.
+
+        The fake machine answers all reads & writes on a memory image (after
+        the latency), and records all received requests.
+        '''
+        memory   = bytearray(0x10000)
+        requests = []
+
+        async def handle(reader, writer):
+            writer.write(hello)
+            while True:
+                request = (await reader.read(1024)).decode()
+                if not request:
+                    break
+                requests.append(request)
+                await asyncio.sleep(latency)
+                address = int(request[1:5], 16)
+                length  = int(request[5:9], 16)
+                if request[0] == 'w':
+                    memory[address:address + length] = bytes.fromhex(request[9:-2])
+                    response = f'{request[0:9]}OK'
+                else:
+                    response = f'{request[0:9]}{memory[address:address + length].hex().upper()}'
+                writer.write(f'{response}{Message.calculate_checksum(response)}'.encode())
+            writer.close()
+
+        async def run():
+            server  = await asyncio.start_server(handle, '127.0.0.1', 0)
+            port    = server.sockets[0].getsockname()[1]
+            machine = AsyncMachine(address='127.0.0.1', port=port, timeout=1.0)
+            try:
+                await test(machine, memory, requests)
+            finally:
+                await machine.disconnect()
+                server.close()
+                await server.wait_closed()
+
+        asyncio.run(run())
+
+    def test_missing_hello(self):
+        '''
+        Test if ``RocketConnectionError`` is raised when the machine doesn't
+        respond with ``*HELLO*``.
+        '''
+        async def test(machine, memory, requests):
+            with self.assertRaises(RocketConnectionError):
+                await machine.connect()
+
+        self._run(test, hello=b'*GOODBYE*')
+
+    def test_get(self):
+        '''
+        Test getting settings.
+        '''
+        async def test(machine, memory, requests):
+            memory[0x01] = 1
+            memory[0x02] = 105
+            await machine.connect()
+            self.assertEqual(await machine.get('language'), 'German')
+            self.assertEqual(await machine.get('brew_boiler_temperature'), 105)
+            self.assertEqual(requests, ['r00010001F4', 'r00020001F5'])
+
+        self._run(test)
+
+    def test_set(self):
+        '''
+        Test setting settings.
+        '''
+        async def test(machine, memory, requests):
+            await machine.connect()
+            self.assertEqual(await machine.set('language', 'Italian'), 'OK')
+            self.assertEqual(await machine.set('profile_a', '6:4 18:9 6:5'), 'OK')
+            self.assertEqual(memory[0x01], 3)
+            self.assertEqual(await machine.get('profile_a'), '6:4 18:9 6:5 0:0 0:0')
+
+            with self.assertRaises(SettingValueError):
+                await machine.set('language', 'Klingon')
+
+            with self.assertRaises(UnknownSettingError):
+                await machine.get('unknown')
+
+        self._run(test)
+
+    def test_concurrent_gets(self):
+        '''
+        Test concurrent access on a single connection, where identical reads
+        are collapsed into a single read.
+        '''
+        async def test(machine, memory, requests):
+            memory[0xB000] = 93
+            memory[0xB001] = 120
+            await machine.connect()
+            values = await asyncio.gather(*(
+                machine.get(name) for name in ('current_brew_boiler_temperature',
+                                               'current_service_boiler_temperature') * 5
+            ))
+            self.assertEqual(values, [93, 120] * 5)
+            self.assertEqual(len(requests), 2)
+
+        self._run(test)
+
+    def test_snapshot(self):
+        '''
+        Test reading all settings at once.
+        '''
+        async def test(machine, memory, requests):
+            memory[0x02] = 105
+            memory[0x03] = 123
+            await machine.connect()
+            snapshot = await machine.snapshot()
+            self.assertEqual(set(snapshot), set(machine.settings))
+            self.assertEqual(snapshot['service_boiler_temperature'], 123)
+            self.assertEqual(len(requests), 3)
+
+        self._run(test)
+
+    def test_cancel(self):
+        '''
+        Test if a cancelled read is abandoned, so that its late response is
+        dropped instead of being returned to the next read.
+        '''
+        async def test(machine, memory, requests):
+            memory[0x00] = 1
+            memory[0x01] = 2
+            await machine.connect()
+
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(machine.get('language'), 0.05)
+
+            self.assertFalse(machine.protocol.pending)
+            self.assertEqual(await machine.get('temperature_unit'), 'Fahrenheit')
+            self.assertEqual(len(requests), 2)
+
+        self._run(test, latency=0.2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+'''
+Unit test cases for the Rocket telemetry buffer module.
+'''
+
+__all__ = (
+    'TestSampleBuffer',
+)
+
+import logging
+from io import BytesIO
+from unittest import TestCase, main
+
+from rocket_r60v.buffer import HEADER, MAGIC, VERSION, SampleBuffer
+from rocket_r60v.telemetry import Sample
+
+logging.disable()
+
+
+class TestSampleBuffer(TestCase):
+    '''
+    Test rocket.buffer.SampleBuffer class and its methods.
+    '''
+
+    def _buffer(self, capacity=4, count=6):
+        '''
+        Create a buffer with samples every half second.
+        '''
+        buffer = SampleBuffer(capacity=capacity)
+        buffer.extend(Sample(i * 0.5, 100 + i, 120.5, None if i % 2 else float(i)) for i in range(count))
+        return buffer
+
+    def test_ring(self):
+        '''
+        Test if the oldest samples are overwritten.
+        '''
+        buffer = self._buffer()
+
+        self.assertEqual(len(buffer), 4)
+        self.assertEqual(buffer.nbytes, 4 * 20)
+        self.assertEqual(list(buffer), [
+            Sample(1.0, 102.0, 120.5, 2.0),
+            Sample(1.5, 103.0, 120.5, None),
+            Sample(2.0, 104.0, 120.5, 4.0),
+            Sample(2.5, 105.0, 120.5, None),
+        ])
+
+    def test_views(self):
+        '''
+        Test the zero-copy views of a wrapped buffer.
+        '''
+        buffer = self._buffer()
+        views  = buffer.views('brew_boiler_temperature')
+
+        self.assertEqual([x.tolist() for x in views], [[102.0, 103.0], [104.0, 105.0]])
+        self.assertIs(views[0].obj, buffer.columns['brew_boiler_temperature'])
+
+    def test_downsample(self):
+        '''
+        Test the min / max / mean per bucket.
+        '''
+        buckets = self._buffer(capacity=8).downsample(1.0)
+
+        self.assertEqual([(x.timestamp, x.count) for x in buckets], [(0, 2), (10 ** 9, 2), (2 * 10 ** 9, 2)])
+        self.assertEqual(buckets[1].brew_boiler_temperature, (102.0, 103.0, 102.5))
+        self.assertEqual(buckets[2].brew_time, (4.0, 4.0, 4.0))
+        self.assertEqual(self._buffer(count=1).downsample(1.0)[0].count, 1)
+        self.assertEqual(SampleBuffer().downsample(1.0), [])
+
+        with self.assertRaises(ValueError):
+            self._buffer().downsample(1e-10)
+
+    def test_downsample_wrapped(self):
+        '''
+        Test buckets which span the wrap-around of the buffer.
+        '''
+        buckets = self._buffer(capacity=5, count=7).downsample(1.0)
+
+        self.assertEqual([(x.timestamp, x.count) for x in buckets], [(10 ** 9, 2), (2 * 10 ** 9, 2), (3 * 10 ** 9, 1)])
+        self.assertEqual(buckets[1].brew_boiler_temperature, (104.0, 105.0, 104.5))
+        self.assertEqual(buckets[0].brew_time, (2.0, 2.0, 2.0))
+        self.assertIsNone(self._buffer(count=2).downsample(0.5)[1].brew_time)
+
+    def test_dump_load(self):
+        '''
+        Test if a dumped buffer can be loaded again.
+        '''
+        buffer = self._buffer()
+        file   = BytesIO()
+        buffer.dump(file)
+        file.seek(0)
+
+        loaded = SampleBuffer.load(file)
+
+        self.assertEqual(loaded.capacity, 4)
+        self.assertEqual(list(loaded), list(buffer))
+
+        with self.assertRaises(ValueError):
+            SampleBuffer.load(BytesIO(bytes(21)))
+
+        with self.assertRaises(ValueError):
+            SampleBuffer.load(BytesIO(file.getvalue()[0:10]))
+
+        with self.assertRaises(ValueError):
+            SampleBuffer.load(BytesIO(file.getvalue()[0:-1]))
+
+        with self.assertRaises(ValueError):
+            SampleBuffer.load(BytesIO(HEADER.pack(MAGIC, VERSION, 2, 4)))
+
+
+if __name__ == '__main__':
+    main()
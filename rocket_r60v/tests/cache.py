@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+'''
+Unit test cases for the Rocket setting cache module.
+'''
+
+__all__ = (
+    'TestSettingCache',
+)
+
+import logging
+from unittest import TestCase, main
+
+from rocket_r60v.cache import SettingCache
+
+logging.disable()
+
+
+class TestSettingCache(TestCase):
+    '''
+    Test rocket.cache.SettingCache class and its methods.
+    '''
+
+    def setUp(self):
+        '''
+        Create a cache with a fake clock.
+        '''
+        self.now   = 0.0
+        self.cache = SettingCache(clock=lambda: self.now)
+
+    def test_get_put(self):
+        '''
+        Test if data is cached per address & length.
+        '''
+        self.assertIsNone(self.cache.get(0x01, 1))
+        self.cache.put(0x01, 1, [3], ttl=None)
+        self.assertEqual(self.cache.get(0x01, 1), [3])
+        self.assertIsNone(self.cache.get(0x01, 2))
+        self.assertEqual(self.cache.stats, {'hits': 1, 'misses': 2, 'entries': 1})
+
+    def test_ttl(self):
+        '''
+        Test if entries expire after their TTL.
+        '''
+        self.cache.put(0xB000, 1, [105], ttl=0.5)
+        self.cache.put(0xB007, 64, [32] * 64, ttl=0)
+        self.now = 0.4
+        self.assertEqual(self.cache.get(0xB000, 1), [105])
+        self.assertIsNone(self.cache.get(0xB007, 64))
+        self.now = 0.5
+        self.assertIsNone(self.cache.get(0xB000, 1))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_invalidate(self):
+        '''
+        Test if all overlapping entries are invalidated.
+        '''
+        self.cache.put(0x00, 1, [0], ttl=None)
+        self.cache.put(0x01, 1, [3], ttl=None)
+        self.cache.put(0x16, 15, [0] * 15, ttl=None)
+        self.cache.invalidate(0x01, 0x16)
+        self.assertEqual(self.cache.get(0x00, 1), [0])
+        self.assertIsNone(self.cache.get(0x01, 1))
+        self.assertIsNone(self.cache.get(0x16, 15))
+
+    def test_clear(self):
+        '''
+        Test if the whole cache is cleared.
+        '''
+        self.cache.put(0x00, 1, [0], ttl=None)
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+
+
+if __name__ == '__main__':
+    main()
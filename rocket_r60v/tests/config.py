@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+'''
+Unit test cases for the Rocket configuration file module.
+'''
+
+__all__ = (
+    'TestConfig',
+)
+
+import logging
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+from rocket_r60v.config import CONFIG_SETTINGS, dump_config, export_config, load_config
+from rocket_r60v.exceptions import RocketError
+from rocket_r60v.machine import Machine
+from rocket_r60v.simulator import Simulator
+
+logging.disable()
+
+
+class TestConfig(TestCase):
+    '''
+    Test rocket.config module.
+    '''
+
+    def setUp(self):
+        '''
+        Start a simulator and connect a machine.
+        '''
+        self.simulator = Simulator(port=0).start()
+        self.addCleanup(self.simulator.stop)
+
+        self.machine = Machine(address=self.simulator.address, port=self.simulator.port, timeout=1.0)
+        self.machine.connect()
+        self.addCleanup(self.machine.disconnect)
+
+    def test_export(self):
+        '''
+        Test if all writable settings are exported with a bulk read.
+        '''
+        values = export_config(self.machine)
+
+        self.assertEqual(list(values), list(CONFIG_SETTINGS))
+        self.assertNotIn('date_time', values)
+        self.assertNotIn('display', values)
+        self.assertEqual(values['profile_a'], '6:4 18:9 6:5 0:0 0:0')
+        self.assertLessEqual(len(self.simulator.requests), 3)
+
+    def test_dump_load(self):
+        '''
+        Test if an exported configuration can be loaded again.
+        '''
+        values = export_config(self.machine)
+
+        with TemporaryDirectory() as directory:
+            for fmt in ('toml', 'json'):
+                path = os.path.join(directory, f'config.{fmt}')
+                with open(path, 'w', encoding='utf-8') as file:
+                    file.write(dump_config(values, fmt))
+                self.assertEqual(load_config(path), values)
+
+            with self.assertRaises(RocketError):
+                load_config(os.path.join(directory, 'missing.toml'))
+
+    def test_apply_changed_only(self):
+        '''
+        Test if only changed settings are written.
+        '''
+        values = export_config(self.machine)
+
+        self.assertEqual(self.machine.diff(values), {})
+        self.assertEqual(self.machine.apply(values, changed_only=True), [])
+
+        values['language']  = 'Italian'
+        values['profile_b'] = '1:2 3:4'
+
+        self.assertEqual(self.machine.diff(values), {'language': 'Italian', 'profile_b': '1:2 3:4'})
+
+        ranges = self.machine.apply(values, changed_only=True)
+
+        self.assertEqual([x.settings for x in ranges], [('language',), ('profile_b',)])
+        self.assertEqual(self.machine.diff(values), {})
+
+
+if __name__ == '__main__':
+    main()
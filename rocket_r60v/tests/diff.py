@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+'''
+Unit test cases for the Rocket memory diff module.
+'''
+
+__all__ = (
+    'TestDiff',
+)
+
+import logging
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+from rocket_r60v.diff import Change, MemoryWatcher, diff_files, diff_images
+from rocket_r60v.dump import MemoryDump
+from rocket_r60v.machine import Machine
+from rocket_r60v.simulator import Simulator
+
+logging.disable()
+
+
+class TestDiff(TestCase):
+    '''
+    Test rocket.diff module.
+    '''
+
+    def test_diff_images(self):
+        '''
+        Test if only the changed bytes are reported.
+        '''
+        old = bytes(range(32))
+        new = bytearray(old)
+        new[0]  = 255
+        new[17] = 0
+        new[31] = 1
+
+        self.assertEqual(diff_images(old, old), [])
+        self.assertEqual(diff_images(old, new, 0xB000), [
+            Change(0xB000, 0, 255),
+            Change(0xB011, 17, 0),
+            Change(0xB01F, 31, 1),
+        ])
+
+    def test_diff_images_dense(self):
+        '''
+        Test if dense changes across chunks & blocks are reported in order.
+        '''
+        old = bytes(x % 256 for x in range(10000))
+        new = bytes(255 - x for x in old)
+
+        changes = diff_images(old, new, 0x40)
+
+        self.assertEqual(len(changes), len(old))
+        self.assertEqual(changes[0], Change(0x40, 0, 255))
+        self.assertEqual(changes[-1], Change(0x40 + 9999, 9999 % 256, 255 - 9999 % 256))
+        self.assertEqual([x.address for x in changes], list(range(0x40, 0x40 + 10000)))
+
+        new = bytearray(old)
+        new[4095:4097] = b'\x01\x01'
+        new[9999]      = 0
+
+        self.assertEqual(diff_images(old, memoryview(new)), [
+            Change(4095, 255, 1),
+            Change(4096, 0, 1),
+            Change(9999, 15, 0),
+        ])
+
+    def test_change(self):
+        '''
+        Test the formatting of a change.
+        '''
+        self.assertEqual(str(Change(0xB000, 105, 106)), '0XB000 105 -> 106 (current_brew_boiler_temperature)')
+        self.assertEqual(str(Change(0x04, 0, 1)), '0X0004   0 ->   1')
+
+    def test_diff_files(self):
+        '''
+        Test the diff of two dumps.
+        '''
+        with Simulator(port=0) as simulator, TemporaryDirectory() as directory:
+            machine = Machine(address=simulator.address, port=simulator.port, timeout=1.0)
+            machine.connect()
+            self.addCleanup(machine.disconnect)
+
+            paths = [os.path.join(directory, x) for x in ('old.bin', 'new.bin')]
+
+            MemoryDump(paths[0], start=0x40, end=0x204F).run(machine)
+            simulator.write(0x47, bytes([2]))
+            simulator.write(0x2000, bytes([1]))
+            MemoryDump(paths[1], start=0x40, end=0x204F).run(machine)
+
+            self.assertEqual(diff_files(*paths), [Change(0x47, 0, 2), Change(0x2000, 0, 1)])
+
+    def test_watch(self):
+        '''
+        Test if the changes of a range are watched.
+        '''
+        def script(simulator, _elapsed):
+            simulator.write(0xB000, bytes([simulator.read(0xB000, 1)[0] + 1]))
+
+        with Simulator(port=0, script=script) as simulator:
+            machine = Machine(address=simulator.address, port=simulator.port, timeout=1.0)
+            machine.connect()
+            self.addCleanup(machine.disconnect)
+
+            watcher = MemoryWatcher(machine, 0xB000, 0x40)
+            changes = list(watcher.changes(count=3))
+
+            self.assertEqual(changes, [[Change(0xB000, 106, 107)], [Change(0xB000, 107, 108)]])
+            self.assertEqual(len(set(simulator.requests)), 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+'''
+Unit test cases for the Rocket memory dump module.
+'''
+
+__all__ = (
+    'TestMemoryDump',
+)
+
+import json
+import logging
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+from rocket_r60v.dump import MemoryDump
+from rocket_r60v.machine import Machine
+from rocket_r60v.simulator import Simulator
+
+logging.disable()
+
+
+class TestMemoryDump(TestCase):
+    '''
+    Test rocket.dump.MemoryDump class and its methods.
+    '''
+
+    def setUp(self):
+        '''
+        Start a simulator and create a temporary directory.
+        '''
+        self.simulator = Simulator(port=0).start()
+        self.addCleanup(self.simulator.stop)
+
+        self.machine = Machine(address=self.simulator.address, port=self.simulator.port, timeout=1.0)
+        self.machine.connect()
+        self.addCleanup(self.machine.disconnect)
+
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'memory.bin')
+
+    def test_dump(self):
+        '''
+        Test if a range is dumped in chunks.
+        '''
+        dump = MemoryDump(self.path, start=0x0000, end=0x005F, chunk=32)
+
+        self.assertEqual(dump.run(self.machine), 3)
+        self.assertTrue(dump.complete)
+        self.assertEqual(os.path.getsize(self.path), 0x60)
+        self.assertEqual(dump.read(0x02, 2), bytes([105, 123]))
+        self.assertEqual(self.simulator.requests[0], 'r00000020F4')
+
+        with open(dump.index_path) as file:
+            index = json.load(file)
+
+        self.assertEqual(index['done'], [[0x00, 0x60]])
+        self.assertEqual(index['regions'][1], {'name': 'language', 'address': 1, 'length': 1})
+
+    def test_resume(self):
+        '''
+        Test if an interrupted dump is resumed.
+        '''
+        dump = MemoryDump(self.path, start=0x0000, end=0x004F, chunk=16)
+        dump.run(self.machine)
+
+        dump.done = [[0x00, 0x20], [0x30, 0x50]]
+        dump.save_index()
+
+        resumed = MemoryDump(self.path, start=0x0000, end=0x004F, chunk=16)
+        self.assertEqual(resumed.missing(), [(0x00, 16), (0x10, 16), (0x20, 16), (0x30, 16), (0x40, 16)])
+        self.assertEqual(resumed.run(self.machine), 1)
+        self.assertEqual(self.simulator.requests[-1], 'r00200010F5')
+        self.assertTrue(MemoryDump.open(self.path).complete)
+
+        self.assertEqual(MemoryDump(self.path, start=0x0000, end=0x004F, chunk=16).run(self.machine, resume=False), 5)
+        self.assertEqual(MemoryDump(self.path, start=0x0000, end=0x001F, chunk=16).run(self.machine), 2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+'''
+Unit test cases for the Rocket fleet module.
+'''
+
+__all__ = (
+    'TestFleet',
+)
+
+import logging
+import socket
+from time import monotonic
+from unittest import TestCase, main
+
+from rocket_r60v.exceptions import CircuitOpenError, DeadlineExceededError, RocketConnectionError
+from rocket_r60v.exceptions import SettingValueError, UnknownSettingError
+from rocket_r60v.fleet import Fleet
+from rocket_r60v.health import HealthRegistry
+from rocket_r60v.simulator import Simulator
+
+logging.disable()
+
+
+class TestFleet(TestCase):
+    '''
+    Test rocket.fleet.Fleet class and its methods.
+    '''
+
+    def setUp(self):
+        '''
+        Start two simulators and reserve a port for an offline machine.
+        '''
+        self.simulators = [Simulator(port=0, latency=0.05).start() for _ in range(2)]
+
+        for simulator in self.simulators:
+            self.addCleanup(simulator.stop)
+
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            self.offline = sock.getsockname()[1]
+
+    def _fleet(self, offline=False, **kwargs):
+        '''
+        Create a fleet of the simulators.
+        '''
+        ports = [x.port for x in self.simulators] + ([self.offline] if offline else [])
+        fleet = Fleet([f'127.0.0.1:{x}' for x in ports], timeout=1.0, **kwargs)
+
+        self.addCleanup(fleet.disconnect)
+        return fleet
+
+    def test_read_all(self):
+        '''
+        Test if the settings are read concurrently.
+        '''
+        fleet = self._fleet()
+
+        start  = monotonic()
+        result = fleet.read_all(['brew_boiler_temperature', 'language'])
+
+        self.assertTrue(result.ok)
+        self.assertEqual(list(result.values.values()), [{'brew_boiler_temperature': 105, 'language': 'English'}] * 2)
+        self.assertLess(monotonic() - start, 0.2)
+
+    def test_partial_failure(self):
+        '''
+        Test if an offline machine is reported without affecting the others.
+        '''
+        result = self._fleet(offline=True).read_all(['language'])
+
+        self.assertFalse(result.ok)
+        self.assertEqual(len(result.values), 2)
+        self.assertIsInstance(result.errors[f'127.0.0.1:{self.offline}'], RocketConnectionError)
+
+    def test_offline_fast_fail(self):
+        '''
+        Test if an offline machine fails fast until it's probed again.
+        '''
+        now    = [0.0]
+        health = HealthRegistry(failure_threshold=1, reset_timeout=10.0, clock=lambda: now[0])
+        fleet  = self._fleet(offline=True, health=health)
+
+        self.assertNotIsInstance(fleet.read_all(['language']).errors[f'127.0.0.1:{self.offline}'], CircuitOpenError)
+        self.assertTrue(health.is_down('127.0.0.1', self.offline))
+
+        result = fleet.read_all(['language'])
+        self.assertEqual(len(result.values), 2)
+        self.assertIsInstance(result.errors[f'127.0.0.1:{self.offline}'], CircuitOpenError)
+
+        now[0] = 10.0
+        self.assertNotIsInstance(fleet.read_all(['language']).errors[f'127.0.0.1:{self.offline}'], CircuitOpenError)
+        self.assertIsInstance(fleet.read_all(['language']).errors[f'127.0.0.1:{self.offline}'], CircuitOpenError)
+
+    def test_set_all(self):
+        '''
+        Test if a setting is set on all machines.
+        '''
+        result = self._fleet(max_workers=1).set_all('language', 'German')
+
+        self.assertTrue(result.ok)
+        self.assertEqual([x.read(0x01, 1) for x in self.simulators], [bytes([1])] * 2)
+
+        with self.assertRaises(SettingValueError):
+            self._fleet().set_all('language', 'Klingon')
+
+        with self.assertRaises(SettingValueError):
+            self._fleet().set_all('current_brew_boiler_temperature', 100)
+
+        with self.assertRaises(UnknownSettingError):
+            Fleet([]).set_all('unknown', 100)
+
+    def test_deadline(self):
+        '''
+        Test if the deadline limits the operation on each machine.
+        '''
+        fleet  = self._fleet(deadline=0.02)
+        result = fleet.read_all(['language'])
+
+        self.assertEqual(len(result.errors), 2)
+        self.assertTrue(all(isinstance(x, DeadlineExceededError) for x in result.errors.values()))
+        self.assertTrue(self._fleet(deadline=1.0).read_all(['language']).ok)
+
+    def test_connect_deadline(self):
+        '''
+        Test if the deadline limits the connect to a machine which doesn't say hello.
+        '''
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            sock.listen()
+
+            address = f'127.0.0.1:{sock.getsockname()[1]}'
+            fleet   = Fleet([address], timeout=2.0, deadline=0.3)
+            self.addCleanup(fleet.disconnect)
+
+            start  = monotonic()
+            result = fleet.connect()
+
+            self.assertLess(monotonic() - start, 1.0)
+            self.assertIsInstance(result.errors[address], RocketConnectionError)
+            self.assertIsNone(fleet.machines[address].socket)
+
+    def test_apply_profile(self):
+        '''
+        Test if a profile is applied & activated on all machines.
+        '''
+        result = self._fleet().apply_profile('profile_b', '1:2 3:4', activate=True)
+
+        self.assertTrue(result.ok)
+
+        for simulator in self.simulators:
+            self.assertEqual(simulator.read(0x47, 1), bytes([1]))
+            self.assertEqual(simulator.read(38, 4), bytes([10, 0, 30, 0]))
+
+        with self.assertRaises(UnknownSettingError):
+            self._fleet().apply_profile('language', 'English')
+
+
+if __name__ == '__main__':
+    main()
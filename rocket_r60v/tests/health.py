@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# pylint: disable=no-self-use,unused-argument
+'''
+Unit test cases for the Rocket health module.
+'''
+
+__all__ = (
+    'TestCircuitBreaker',
+    'TestHealthRegistry',
+)
+
+import logging
+import socket
+from unittest import TestCase, main
+
+from rocket_r60v.health import CLOSED, OPEN, HALF_OPEN, CircuitBreaker, HealthRegistry
+from rocket_r60v.exceptions import CircuitOpenError, DeadlineExceededError, RocketConnectionError, ValidationError
+
+logging.disable()
+
+
+class TestCircuitBreaker(TestCase):
+    '''
+    Test rocket.health.CircuitBreaker class and its methods.
+    '''
+
+    def setUp(self):
+        '''
+        Create a circuit breaker with a fake clock.
+        '''
+        self.now     = 0.0
+        self.breaker = CircuitBreaker('127.0.0.1', 1774, failure_threshold=2, reset_timeout=5.0,
+                                      clock=lambda: self.now)
+
+    def _fail(self, error=RocketConnectionError):
+        '''
+        Run a failing operation.
+        '''
+        with self.assertRaises(error):
+            with self.breaker.guard():
+                raise error()
+
+    def test_open(self):
+        '''
+        Test if the circuit opens after the failure threshold.
+        '''
+        self._fail()
+        self._fail(DeadlineExceededError)
+        self.assertEqual((self.breaker.state, self.breaker.failures), (CLOSED, 1))
+
+        with self.breaker.guard():
+            pass
+        self.assertEqual(self.breaker.failures, 0)
+
+        self._fail(socket.timeout)
+        self._fail()
+        self.assertEqual(self.breaker.state, OPEN)
+
+        with self.assertRaises(CircuitOpenError):
+            with self.breaker.guard():
+                self.fail('Operation executed on open circuit')
+
+    def test_half_open(self):
+        '''
+        Test if a single probe is executed after the reset timeout.
+        '''
+        self._fail()
+        self._fail()
+
+        self.now = 5.0
+
+        with self.breaker.guard():
+            self.assertEqual(self.breaker.state, HALF_OPEN)
+            with self.assertRaises(CircuitOpenError):
+                self.breaker.check()
+
+        self.assertEqual(self.breaker.state, CLOSED)
+
+    def test_failed_probe(self):
+        '''
+        Test if a failed probe re-opens the circuit, while other errors close it.
+        '''
+        self._fail()
+        self._fail()
+
+        self.now = 5.0
+        self._fail()
+        self.assertEqual((self.breaker.state, self.breaker.opened), (OPEN, 5.0))
+
+        self.now = 10.0
+        self._fail(ValidationError)
+        self.assertEqual(self.breaker.state, CLOSED)
+
+    def test_probe_deadline(self):
+        '''
+        Test if a probe which exceeds the deadline re-opens the circuit.
+        '''
+        self._fail()
+        self._fail()
+
+        self.now = 5.0
+        self._fail(DeadlineExceededError)
+        self.assertEqual((self.breaker.state, self.breaker.opened), (OPEN, 5.0))
+
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.check()
+
+        self.now = 10.0
+        with self.breaker.guard():
+            pass
+        self.assertEqual(self.breaker.state, CLOSED)
+
+
+class TestHealthRegistry(TestCase):
+    '''
+    Test rocket.health.HealthRegistry class and its methods.
+    '''
+
+    def test_registry(self):
+        '''
+        Test if the breakers are shared per machine.
+        '''
+        registry = HealthRegistry(reset_timeout=1.0)
+        breaker  = registry.get_breaker('127.0.0.1', 1774)
+
+        self.assertEqual(breaker.failure_threshold, 3)
+
+        self.assertIs(registry.get_breaker('127.0.0.1', 1774), breaker)
+        self.assertIsNot(registry.get_breaker('127.0.0.1', 1775), breaker)
+        self.assertEqual(breaker.reset_timeout, 1.0)
+        self.assertFalse(registry.is_down('127.0.0.1', 1774))
+        self.assertFalse(registry.is_down('127.0.0.2', 1774))
+
+        breaker.add_failure()
+        breaker.add_failure()
+        self.assertFalse(registry.is_down('127.0.0.1', 1774))
+
+        breaker.add_failure()
+        self.assertTrue(registry.is_down('127.0.0.1', 1774))
+        self.assertEqual(registry.states, {('127.0.0.1', 1774): OPEN, ('127.0.0.1', 1775): CLOSED})
+        self.assertEqual(len(registry), 2)
+
+
+if __name__ == '__main__':
+    main()
@@ -13,7 +13,9 @@ from unittest import TestCase, main
 from unittest.mock import patch
 
 from rocket_r60v.machine import Machine
-from rocket_r60v.exceptions import RocketConnectionError
+from rocket_r60v.message import Message
+from rocket_r60v.exceptions import RocketConnectionError, SettingValueError, UnknownSettingError, ValidationError
+from rocket_r60v.simulator import Simulator
 
 logging.disable()
 
@@ -58,6 +60,136 @@ class TestMachine(TestCase):
         Machine().connect()
         mock_socket.assert_called_with(('192.168.1.1', 1774), 3.0)
 
+    @patch('rocket_r60v.api.socket.create_connection')
+    def test_read_many(self, mock_socket):
+        '''
+        Test if multiple settings are read with a single message.
+        '''
+        message  = 'r00010003016978'
+        checksum = Message.calculate_checksum(message)
+
+        mock_socket.return_value.recv.side_effect = [
+            b'*HELLO*',
+            f'{message}{checksum}'.encode(),
+        ]
+
+        machine = Machine()
+        machine.connect()
+
+        self.assertEqual(
+            machine.read_many(['service_boiler_temperature', 'language', 'date_time']),
+            {
+                'service_boiler_temperature': 120,
+                'language': 'German',
+                'date_time': machine.settings['date_time'].get(),
+            }
+        )
+
+        mock_socket.return_value.sendall.assert_called_once_with(b'r00010003F6')
+
+    def test_read_many_unknown_setting(self):
+        '''
+        Test if ``UnknownSettingError`` is raised for unknown settings.
+        '''
+        with self.assertRaises(UnknownSettingError):
+            Machine().read_many(['unknown'])
+
+    @patch('rocket_r60v.api.socket.create_connection')
+    def test_snapshot(self, mock_socket):
+        '''
+        Test if a snapshot of all settings needs only a few messages.
+        '''
+        memory = {0x02: 105, 0x03: 123}
+
+        def recv(*args):
+            request = mock_socket.return_value.sendall.call_args[0][0].decode()
+            address = int(request[1:5], 16)
+            length  = int(request[5:9], 16)
+            data    = ''.join(f'{memory.get(x, 0):02X}' for x in range(address, address + length))
+            message = f'{request[0:9]}{data}'
+            return f'{message}{Message.calculate_checksum(message)}'.encode()
+
+        mock_socket.return_value.recv.side_effect = [b'*HELLO*']
+
+        machine = Machine()
+        machine.connect()
+
+        mock_socket.return_value.recv.side_effect = recv
+
+        snapshot = machine.snapshot()
+
+        self.assertEqual(set(snapshot), set(machine.settings))
+        self.assertEqual(snapshot['language'], 'English')
+        self.assertEqual(snapshot['brew_boiler_temperature'], 105)
+        self.assertEqual(snapshot['profile_a'], '0:0 0:0 0:0 0:0 0:0')
+        self.assertEqual(mock_socket.return_value.sendall.call_count, 3)
+
+    def test_apply(self):
+        '''
+        Test if multiple settings are applied with merged writes.
+        '''
+        with Simulator(port=0) as simulator:
+            machine = Machine(address=simulator.address, port=simulator.port, timeout=1.0)
+            machine.connect()
+
+            ranges = machine.apply({
+                'service_boiler_temperature': 120,
+                'language': 'German',
+                'brew_boiler_temperature': 100,
+                'standby': 'on',
+            })
+
+            self.assertEqual(len(ranges), 2)
+            self.assertEqual(simulator.read(0x01, 3), bytes([1, 100, 120]))
+            self.assertEqual(simulator.read(0x4A, 1), bytes([1]))
+            self.assertEqual([x[0] for x in simulator.requests], ['r', 'r', 'w', 'w'])
+
+            machine.disconnect()
+
+    def test_apply_validation(self):
+        '''
+        Test if all values are validated before anything is sent.
+        '''
+        with Simulator(port=0) as simulator:
+            machine = Machine(address=simulator.address, port=simulator.port, timeout=1.0)
+            machine.connect()
+
+            for values in ({'language': 'German', 'brew_boiler_temperature': 200},
+                           {'current_brew_time': 25},
+                           {'unknown': 1}):
+                with self.assertRaises((SettingValueError, UnknownSettingError)):
+                    machine.apply(values)
+
+            self.assertEqual(list(simulator.requests), [])
+
+            machine.disconnect()
+
+    def test_apply_rollback(self):
+        '''
+        Test if the previous values are restored when a write fails.
+        '''
+        with Simulator(port=0) as simulator:
+            machine = Machine(address=simulator.address, port=simulator.port, timeout=1.0)
+            machine.connect()
+
+            send_messages = machine.send_messages
+
+            def fail(messages):
+                if messages[0].command == 'w':
+                    machine.send_message(messages[0])
+                    raise ValidationError('Write failed')
+                return send_messages(messages)
+
+            with patch.object(machine, 'send_messages', side_effect=fail):
+                with self.assertRaises(ValidationError):
+                    machine.apply({'language': 'German', 'active_profile': 'C', 'date_time': 'auto'})
+
+            self.assertEqual(simulator.read(0x01, 1), bytes([0]))
+            self.assertEqual(simulator.read(0x47, 1), bytes([0]))
+            self.assertEqual([x[0:5] for x in list(simulator.requests)[2:]], ['w0001', 'w0001', 'w0047'])
+
+            machine.disconnect()
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+'''
+Unit test cases for the Rocket memory map module.
+'''
+
+__all__ = (
+    'TestMemoryMap',
+)
+
+import logging
+from unittest import TestCase, main
+
+from rocket_r60v.exceptions import MemoryMapError
+from rocket_r60v.memory_map import MEMORY_MAP, MemoryMap
+from rocket_r60v.registry import REGISTRY, SettingInfo
+
+logging.disable()
+
+
+class TestMemoryMap(TestCase):
+    '''
+    Test rocket.memory_map.MemoryMap class and its methods.
+    '''
+
+    def _names(self, address, length=1):
+        '''
+        Get the names of the settings which cover a memory range.
+        '''
+        return [x.name for x in MEMORY_MAP.find(address, length)]
+
+    def test_order(self):
+        '''
+        Test if the settings are sorted by their address.
+        '''
+        self.assertEqual(len(MEMORY_MAP), len(REGISTRY))
+        self.assertEqual([x.name for x in MEMORY_MAP][0:3], ['temperature_unit', 'language', 'brew_boiler_temperature'])
+
+    def test_find(self):
+        '''
+        Test the lookup of the settings which cover a memory range.
+        '''
+        self.assertEqual(self._names(0x01), ['language'])
+        self.assertEqual(self._names(0x00, 3), ['temperature_unit', 'language', 'brew_boiler_temperature'])
+        self.assertEqual(self._names(0x24, 4), ['profile_a', 'profile_b'])
+        self.assertEqual(self._names(0xB020), ['display'])
+        self.assertEqual(self._names(0xB010), ['current_brew_time', 'display'])
+        self.assertEqual(self._names(0x04, 0x12), [])
+
+    def test_overlap(self):
+        '''
+        Test if overlapping settings are detected.
+        '''
+        infos = [REGISTRY['language'], SettingInfo('other', REGISTRY['standby'].cls, 0x01, 2, 'read-write')]
+
+        with self.assertRaises(MemoryMapError):
+            MemoryMap(infos)
+
+        class DisplayRow(REGISTRY['display'].cls):  # pylint: disable=too-few-public-methods
+            '''
+            An overlapping subclass which isn't an alias.
+            '''
+            address = 0xB017
+            length  = 16
+
+        infos = [REGISTRY['display'], SettingInfo('display_row', DisplayRow, 0xB017, 16, 'read-only')]
+
+        with self.assertRaises(MemoryMapError):
+            MemoryMap(infos)
+
+        infos = [REGISTRY['display'], REGISTRY['current_brew_time']]
+        self.assertEqual(len(MemoryMap(infos)), 2)
+
+    def test_decode(self):
+        '''
+        Test if a raw dump is decoded into the settings it contains.
+        '''
+        self.assertEqual(MEMORY_MAP.decode(0x00, [1, 2, 105]), {
+            'temperature_unit': 'Fahrenheit',
+            'language': 'French',
+            'brew_boiler_temperature': 105,
+        })
+        self.assertEqual(MEMORY_MAP.decode(0x53, [1]), {})
+        self.assertEqual(MEMORY_MAP.decode(0x00, [5, 2, 105]), {
+            'temperature_unit': '<invalid 05>',
+            'language': 'French',
+            'brew_boiler_temperature': 105,
+        })
+
+
+if __name__ == '__main__':
+    main()
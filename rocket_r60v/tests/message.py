@@ -12,7 +12,7 @@ import logging
 from unittest import TestCase, main
 
 from rocket_r60v.message import Message
-from rocket_r60v.exceptions import MessageLengthError
+from rocket_r60v.exceptions import MessageLengthError, ValidationError
 
 logging.disable()
 
@@ -168,6 +168,48 @@ class TestMessage(TestCase):
                 data=[10, 20, 30, 40, 50]
             )
 
+    def test_cached_read_request(self):
+        '''
+        Test if read requests are cached.
+        '''
+        message = Message.read_request(0xB000, 1)
+        self.assertIs(message, Message.read_request(0xB000, 1))
+        self.assertEqual(message.encode(), b'rB000000105')
+
+    def test_write_invalid_data(self):
+        '''
+        Write data which isn't a sequence of 8-bit unsigned integers.
+        '''
+        with self.assertRaises(ValidationError):
+            Message(command='w', address=60, length=1, data=[256])
+
+        with self.assertRaises(ValidationError):
+            Message(command='w', address=60, length=1, data=[-1])
+
+    def test_decode_data(self):
+        '''
+        Test the decoding of response data.
+        '''
+        self.assertEqual(Message.decode_data('r003C00040A141E28C7'), [10, 20, 30, 40])
+        self.assertEqual(Message.decode_data('w00010001OK93'), ['OK'])
+
+    def test_frame_length(self):
+        '''
+        Test the frame length detection.
+        '''
+        self.assertIsNone(Message.frame_length(b''))
+        self.assertIsNone(Message.frame_length(b'*HELL'))
+        self.assertEqual(Message.frame_length(b'*HELLO*'), 7)
+        self.assertIsNone(Message.frame_length(b'r00010001'))
+        self.assertEqual(Message.frame_length(b'w00010001OK'), 13)
+        self.assertEqual(Message.frame_length(b'r0001000101'), 13)
+        self.assertEqual(Message.frame_length(b'rB0070040'), None)
+        self.assertEqual(Message.frame_length(b'rB00700404'), None)
+        self.assertEqual(Message.frame_length(b'rB007004042'), 139)
+
+        with self.assertRaises(ValidationError):
+            Message.frame_length(b'rXXXXXXXXXX')
+
 
 if __name__ == '__main__':
     main()
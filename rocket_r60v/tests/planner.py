@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# pylint: disable=no-self-use,unused-argument
+'''
+Unit test cases for the Rocket read planner module.
+'''
+
+__all__ = (
+    'TestPlanner',
+)
+
+import logging
+from unittest import TestCase, main
+
+from rocket_r60v.planner import plan_reads, plan_writes
+from rocket_r60v.settings import Language, BrewBoilerTemperature, ServiceBoilerTemperature, \
+    ProfileA, ActiveProfile, DateTime, Display, CurrentBrewTime
+
+logging.disable()
+
+
+class TestPlanner(TestCase):
+    '''
+    Test rocket_r60v.planner.plan_reads & plan_writes functions.
+    '''
+
+    def _plan(self, *classes, **kwargs):
+        '''
+        Plan the reads for the setting classes.
+        '''
+        settings = [(cls.__name__, cls(None)) for cls in classes]
+        return [(x.address, x.length, tuple(y[0] for y in x.settings))
+                for x in plan_reads(settings, **kwargs)]
+
+    def test_adjacent_settings(self):
+        '''
+        Make sure adjacent settings are merged into one read.
+        '''
+        self.assertEqual(
+            self._plan(ServiceBoilerTemperature, Language, BrewBoilerTemperature),
+            [(0x01, 3, ('Language', 'BrewBoilerTemperature', 'ServiceBoilerTemperature'))]
+        )
+
+    def test_gap_tolerance(self):
+        '''
+        Make sure the gap tolerance is respected.
+        '''
+        self.assertEqual(
+            self._plan(ProfileA, ActiveProfile, max_gap=34),
+            [(22, 50, ('ProfileA', 'ActiveProfile'))]
+        )
+
+        self.assertEqual(
+            self._plan(ProfileA, ActiveProfile, max_gap=33),
+            [(22, 15, ('ProfileA',)), (0x47, 1, ('ActiveProfile',))]
+        )
+
+    def test_max_length(self):
+        '''
+        Make sure a read doesn't exceed the max. length.
+        '''
+        self.assertEqual(
+            self._plan(Language, BrewBoilerTemperature, max_length=1),
+            [(0x01, 1, ('Language',)), (0x02, 1, ('BrewBoilerTemperature',))]
+        )
+
+    def test_overlapping_settings(self):
+        '''
+        Make sure overlapping settings are covered by one read.
+        '''
+        self.assertEqual(
+            self._plan(Display, CurrentBrewTime),
+            [(0xB007, 64, ('CurrentBrewTime', 'Display'))]
+        )
+
+    def test_unreadable_settings(self):
+        '''
+        Make sure unreadable settings are skipped.
+        '''
+        self.assertEqual(self._plan(DateTime), [])
+
+    def test_contiguous_writes(self):
+        '''
+        Make sure only contiguous writes are merged.
+        '''
+        writes = [
+            ('ServiceBoilerTemperature', ServiceBoilerTemperature(None), [120]),
+            ('ActiveProfile', ActiveProfile(None), [1]),
+            ('Language', Language(None), [1]),
+            ('BrewBoilerTemperature', BrewBoilerTemperature(None), [100]),
+        ]
+
+        ranges = plan_writes(writes)
+
+        self.assertEqual(
+            [(x.address, x.data, x.settings) for x in ranges],
+            [
+                (0x01, bytes([1, 100, 120]), ('Language', 'BrewBoilerTemperature', 'ServiceBoilerTemperature')),
+                (0x47, bytes([1]), ('ActiveProfile',)),
+            ]
+        )
+        self.assertEqual(ranges[0].build_message().encoded, b'w0001000301647835')
+        self.assertEqual(len(plan_writes(writes, max_length=2)), 3)
+
+
+if __name__ == '__main__':
+    main()
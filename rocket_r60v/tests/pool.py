@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# pylint: disable=no-self-use,unused-argument
+'''
+Unit test cases for the Rocket connection pool module.
+'''
+
+__all__ = (
+    'TestConnectionPool',
+)
+
+import logging
+import select
+import socket
+import socketserver
+import threading
+from unittest import TestCase, main
+
+from rocket_r60v.machine import Machine
+from rocket_r60v.message import Message
+from rocket_r60v.pool import ConnectionPool
+
+logging.disable()
+
+
+class FakeMachineHandler(socketserver.BaseRequestHandler):
+    '''
+    Request handler of a fake machine, which answers all reads with zeros.
+    '''
+
+    def handle(self):
+        '''
+        Handle a connection.
+        '''
+        self.server.connections += 1
+        self.request.sendall(b'*HELLO*')
+        while True:
+            request = self.request.recv(1024).decode()
+            if not request:
+                break
+            message = f'{request[0:9]}{"00" * int(request[5:9], 16)}'
+            self.request.sendall(f'{message}{Message.calculate_checksum(message)}'.encode())
+            if self.server.drop:
+                self.server.drop = False
+                self.request.shutdown(socket.SHUT_RDWR)
+                break
+
+
+class TestConnectionPool(TestCase):
+    '''
+    Test rocket_r60v.pool.ConnectionPool class and its methods.
+    '''
+
+    def setUp(self):
+        '''
+        Start a fake machine.
+        '''
+        self.server = socketserver.ThreadingTCPServer(('127.0.0.1', 0), FakeMachineHandler)
+        self.server.daemon_threads = True
+        self.server.connections    = 0
+        self.server.drop           = False
+        self.port = self.server.server_address[1]
+        threading.Thread(target=self.server.serve_forever, args=(0.01,), daemon=True).start()
+
+        self.pool = ConnectionPool()
+
+    def tearDown(self):
+        '''
+        Stop the fake machine.
+        '''
+        self.pool.close_all()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _machine(self):
+        '''
+        Create a connected machine which uses the pool.
+        '''
+        machine = Machine(address='127.0.0.1', port=self.port, timeout=1.0, pool=self.pool)
+        machine.connect()
+        return machine
+
+    def test_shared_connection(self):
+        '''
+        Test if machines share a pooled connection.
+        '''
+        machines = [self._machine() for _ in range(3)]
+
+        for machine in machines:
+            self.assertEqual(machine.language, 'English')
+            machine.disconnect()
+
+        self.assertEqual(len(self.pool), 1)
+        self.assertEqual(self.server.connections, 1)
+        self.assertIs(machines[0].connection, machines[2].connection)
+
+    def test_concurrent_access(self):
+        '''
+        Test if machines can use a pooled connection from several threads.
+        '''
+        results = []
+
+        def worker():
+            machine = self._machine()
+            for _ in range(20):
+                results.append(machine.temperature_unit)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, ['Celsius'] * 80)
+        self.assertEqual(self.server.connections, 1)
+
+    def test_reconnect(self):
+        '''
+        Test if a broken connection is re-established transparently.
+        '''
+        machine = self._machine()
+        self.server.drop = True
+        self.assertEqual(machine.language, 'English')
+        self.assertEqual(machine.language, 'English')
+        self.assertEqual(self.server.connections, 2)
+
+    def test_health_check(self):
+        '''
+        Test if a broken pooled connection is re-established on checkout.
+        '''
+        machine = self._machine()
+        self.server.drop = True
+        self.assertEqual(machine.language, 'English')
+        select.select([machine.socket], [], [], 1.0)
+        self._machine()
+        self.assertEqual(self.server.connections, 2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+# pylint: disable=no-self-use,unused-argument
+'''
+Unit test cases for the Rocket protocol module.
+'''
+
+__all__ = (
+    'TestProtocol',
+    'TestServerProtocol',
+)
+
+import logging
+from unittest import TestCase, main
+
+from rocket_r60v.protocol import Hello, Response, Protocol, ServerProtocol
+from rocket_r60v.message import Message
+from rocket_r60v.exceptions import RocketConnectionError, ValidationError
+
+logging.disable()
+
+
+class TestProtocol(TestCase):
+    '''
+    Test rocket.protocol.Protocol class and its methods.
+    '''
+
+    def _connected(self):
+        '''
+        Create a protocol which completed the handshake.
+        '''
+        protocol = Protocol()
+        self.assertEqual(protocol.feed(b'*HELLO*'), [Hello()])
+        self.assertTrue(protocol.connected)
+        return protocol
+
+    def test_hello(self):
+        '''
+        Test if a split handshake is handled.
+        '''
+        protocol = Protocol()
+        self.assertEqual(protocol.feed(b'*HEL'), [])
+        self.assertFalse(protocol.connected)
+        self.assertEqual(protocol.feed(b'LO*'), [Hello()])
+        self.assertTrue(protocol.connected)
+
+    def test_no_hello(self):
+        '''
+        Test if an exception is raised when the machine doesn't say hello.
+        '''
+        with self.assertRaises(RocketConnectionError):
+            Protocol().feed(b'*BYE*')
+
+    def test_send(self):
+        '''
+        Test if sent messages are encoded and pending.
+        '''
+        protocol = self._connected()
+        message  = Message(command='r', address=1, length=1)
+
+        self.assertEqual(protocol.send(message), b'r00010001F4')
+        self.assertEqual(list(protocol.pending), [message])
+
+    def test_response(self):
+        '''
+        Test if responses are validated and decoded.
+        '''
+        protocol = self._connected()
+        read     = Message(command='r', address=1, length=1)
+        write    = Message(command='w', address=1, length=1, data=[1])
+
+        protocol.send(read)
+        protocol.send(write)
+
+        self.assertEqual(protocol.feed(b'r00010001'), [])
+        self.assertEqual(protocol.feed(b'0155w00010001OK93'), [
+            Response(read, [1]),
+            Response(write, ['OK']),
+        ])
+        self.assertFalse(protocol.pending)
+
+    def test_envelope_matching(self):
+        '''
+        Test if pipelined responses are matched by their envelope.
+        '''
+        protocol = self._connected()
+        first    = Message(command='r', address=1, length=1)
+        second   = Message(command='r', address=2, length=1)
+
+        protocol.send(first)
+        protocol.send(second)
+
+        events = protocol.feed(Message(command='r', address=2, length=1, data=[5]).encode())
+
+        self.assertEqual(events, [Response(second, [5])])
+        self.assertEqual(list(protocol.pending), [first])
+
+    def test_abandoned(self):
+        '''
+        Test if the late responses of abandoned requests are dropped.
+        '''
+        protocol = self._connected()
+        stale    = Message(command='r', address=1, length=1)
+        message  = Message(command='r', address=2, length=1)
+
+        protocol.send(stale)
+        protocol.clear()
+        protocol.send(message)
+
+        response = Message(command='r', address=2, length=1, data=[5])
+        events   = protocol.feed(stale.encode()[0:9] + b'0155' + response.encode())
+
+        self.assertEqual([x.message for x in events], [message])
+        self.assertFalse(protocol.pending)
+        self.assertFalse(protocol.abandoned)
+
+    def test_invalid_response(self):
+        '''
+        Test if an exception is raised for invalid or unexpected responses.
+        '''
+        protocol = self._connected()
+
+        with self.assertRaises(ValidationError):
+            protocol.feed(b'r000100010155')
+
+        protocol.send(Message(command='r', address=1, length=1))
+
+        with self.assertRaises(ValidationError):
+            protocol.feed(b'r000100010156')
+
+        with self.assertRaises(ValidationError):
+            protocol.feed(b'rXXXXXXXXXX')
+        self.assertFalse(protocol.buffer)
+
+
+class TestServerProtocol(TestCase):
+    '''
+    Test rocket.protocol.ServerProtocol class and its methods.
+    '''
+
+    def test_feed(self):
+        '''
+        Test if split requests are framed.
+        '''
+        protocol = ServerProtocol()
+
+        self.assertEqual(protocol.feed(b'r00010001'), [])
+        self.assertEqual(protocol.feed(b'F4w0001000101'), ['r00010001F4'])
+        self.assertEqual(protocol.feed(b'5A'), ['w00010001015A'])
+
+    def test_invalid_request(self):
+        '''
+        Test if invalid requests are discarded.
+        '''
+        protocol = ServerProtocol()
+
+        self.assertEqual(protocol.feed(b'wXXXXXXXXXX'), [])
+        self.assertEqual(protocol.feed(b'r00010001F4'), ['r00010001F4'])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+'''
+Unit test cases for the Rocket settings registry module.
+'''
+
+__all__ = (
+    'TestRegistry',
+)
+
+import logging
+from unittest import TestCase, main
+
+from rocket_r60v.machine import Machine
+from rocket_r60v.registry import REGISTRY, SettingProperty
+from rocket_r60v.settings import BrewBoilerTemperature, Display
+
+logging.disable()
+
+
+class TestRegistry(TestCase):
+    '''
+    Test rocket.registry module.
+    '''
+
+    def test_registry(self):
+        '''
+        Test the precomputed setting infos.
+        '''
+        self.assertEqual(REGISTRY['brew_boiler_temperature'].cls, BrewBoilerTemperature)
+        self.assertEqual(REGISTRY['display'][2:], (0xB007, 64, 'read-only'))
+        self.assertEqual(REGISTRY['date_time'].kind, 'write-only')
+        self.assertEqual(REGISTRY['language'].kind, 'read-write')
+
+    def test_lazy_settings(self):
+        '''
+        Test if the settings are instantiated on first access only.
+        '''
+        machine = Machine()
+
+        self.assertEqual(machine.settings.instances, {})
+        self.assertIn('display', machine.settings)
+        self.assertEqual(len(machine.settings), len(REGISTRY))
+        self.assertEqual(list(machine.settings), list(REGISTRY))
+        self.assertIsInstance(machine.settings['display'], Display)
+        self.assertIs(machine.settings['display'], machine.settings['display'])
+        self.assertEqual(list(machine.settings.instances), ['display'])
+
+    def test_properties(self):
+        '''
+        Test the generated setting properties.
+        '''
+        self.assertIsInstance(Machine.__dict__['language'], SettingProperty)
+        self.assertEqual(Machine.language.__doc__, REGISTRY['language'].cls.__doc__)
+
+        with self.assertRaises(AttributeError):
+            Machine().display = 'Hello'
+
+
+if __name__ == '__main__':
+    main()
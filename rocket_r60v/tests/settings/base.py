@@ -37,7 +37,7 @@ class TestSetting(TestCase):
             mock_socket.return_value.recv.return_value = response_message.encode()
             return_value = instance.get() if value is None else instance.set(value)
 
-            mock_socket.return_value.send.assert_called_with(expected_request_message.encode())
+            mock_socket.return_value.sendall.assert_called_with(expected_request_message.encode())
 
             self.assertEqual(return_value, expected_return_value,
                              'Missmatch of return value via direct settings instance method')
@@ -49,7 +49,7 @@ class TestSetting(TestCase):
             else:
                 setattr(machine, self.machine_property, value)
 
-            mock_socket.return_value.send.assert_called_with(expected_request_message.encode())
+            mock_socket.return_value.sendall.assert_called_with(expected_request_message.encode())
 
     def test_basic_validation(self):
         '''
@@ -45,6 +45,29 @@ class TestDisplay(TestSetting):
             )
         )
 
+    def test_state(self):
+        '''
+        Test parsing of the display state.
+        '''
+        rows  = Display.split_rows(b'BREW BOIL. 105*C' + b' ' * 48)
+        state = Display.parse_state(rows)
+        self.assertEqual(len(state.rows), 4)
+        self.assertEqual(state.rows[1], ' ' * 16)
+        self.assertEqual((state.brew_time, state.screen), (None, 'boilers'))
+
+        state = Display.parse_state(['           25.3"', 'PRESSURE PROF. A'])
+        self.assertEqual((state.brew_time, state.screen), (25.3, 'brewing'))
+
+        self.assertEqual(Display.parse_state([' ' * 16] * 4).screen, 'blank')
+        self.assertEqual(Display.parse_state(['H2O Tank Run out']).screen, 'unknown')
+        self.assertIsNone(Display.parse_brew_time('     --.-"'))
+
+    def test_latin_1(self):
+        '''
+        Test decoding of non-ASCII characters.
+        '''
+        self.assertEqual(Display(None).decode([0xB0] + [0x20] * 31), '\xb0' + ' ' * 15 + '\n' + ' ' * 16)
+
 
 if __name__ == '__main__':
     main()
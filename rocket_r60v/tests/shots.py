@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+'''
+Unit test cases for the Rocket shot detection module.
+'''
+
+__all__ = (
+    'TestShotDetector',
+)
+
+import logging
+from unittest import TestCase, main
+
+from rocket_r60v.machine import Machine
+from rocket_r60v.shots import Shot, ShotDetector, ShotStart, detect_shots
+from rocket_r60v.simulator import Simulator
+from rocket_r60v.telemetry import Sample
+
+logging.disable()
+
+SAMPLES = [
+    Sample(0.0, 105, 123, None),
+    Sample(1.0, 104, 123, 1.0),
+    Sample(2.0, 102, 123, 2.0),
+    Sample(3.0, 103, 123, 3.0),
+    Sample(4.0, 105, 123, None),
+    Sample(5.0, 105, 123, None),
+]
+
+
+class TestShotDetector(TestCase):
+    '''
+    Test rocket.shots.ShotDetector class and its methods.
+    '''
+
+    def test_detect_shots(self):
+        '''
+        Test if a shot is detected and summarised.
+        '''
+        self.assertEqual(list(detect_shots(SAMPLES)), [
+            ShotStart(1.0, None),
+            Shot(1.0, 3.0, 3.0, 104, 103.0, None, None),
+        ])
+
+    def test_grace(self):
+        '''
+        Test if a shot survives single samples without brew time.
+        '''
+        samples = SAMPLES[:3] + [Sample(2.5, 103, 123, None)] + SAMPLES[3:]
+        events  = list(detect_shots(samples, grace=2))
+
+        self.assertEqual(len(events), 2)
+        self.assertEqual(events[1].duration, 3.0)
+
+    def test_unfinished(self):
+        '''
+        Test if an unfinished shot is kept in progress.
+        '''
+        detector = ShotDetector()
+
+        for sample in SAMPLES[:3]:
+            detector.update(sample)
+
+        self.assertTrue(detector.brewing)
+
+    def test_context(self):
+        '''
+        Test if the active profile & coffee count are read from the machine.
+        '''
+        with Simulator(port=0) as simulator:
+            machine = Machine(address=simulator.address, port=simulator.port, timeout=1.0)
+            machine.connect()
+            self.addCleanup(machine.disconnect)
+
+            detector = ShotDetector(machine)
+            events   = []
+
+            for sample in SAMPLES:
+                if sample.timestamp == 3.0:
+                    simulator.write(0x4D, bytes([141]))
+                events += detector.update(sample)
+
+            self.assertEqual(events[0].active_profile, 'A')
+            self.assertEqual(events[1].active_profile, 'A')
+            self.assertEqual(events[1].coffee_count, 1)
+            self.assertEqual(len(simulator.requests), 2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# pylint: disable=no-self-use,unused-argument
+'''
+Unit test cases for the Rocket simulator module.
+'''
+
+__all__ = (
+    'TestSimulator',
+)
+
+import logging
+import socket
+from unittest import TestCase, main
+from unittest.mock import patch
+
+from rocket_r60v.machine import Machine
+from rocket_r60v.message import Message
+from rocket_r60v.simulator import Simulator, LoopbackPool
+from rocket_r60v.exceptions import ValidationError
+
+logging.disable()
+
+
+class TestSimulator(TestCase):
+    '''
+    Test rocket_r60v.simulator.Simulator class end-to-end with a machine.
+    '''
+
+    def _machine(self, simulator, timeout=1.0):
+        '''
+        Create a machine which is connected to the simulator.
+        '''
+        machine = Machine(address=simulator.address, port=simulator.port, timeout=timeout)
+        machine.connect()
+        self.addCleanup(machine.disconnect)
+        return machine
+
+    def test_read_and_write(self):
+        '''
+        Test reading & writing settings.
+        '''
+        with Simulator(port=0) as simulator:
+            machine = self._machine(simulator)
+            self.assertEqual(machine.language, 'English')
+            self.assertEqual(machine.profile_a, '6:4 18:9 6:5 0:0 0:0')
+            machine.language  = 'Italian'
+            machine.profile_b = '1:2 3:4'
+            self.assertEqual(machine.language, 'Italian')
+            self.assertEqual(machine.profile_b, '1:2 3:4 0:0 0:0 0:0')
+            self.assertEqual(simulator.read(0x01, 1), bytes([3]))
+            self.assertEqual(simulator.requests[0], 'r00010001F4')
+
+    def test_request_log(self):
+        '''
+        Test if only the last requests are kept, while all are counted.
+        '''
+        with patch.object(Simulator, 'max_requests', 2):
+            simulator = Simulator()
+
+        for address in range(3):
+            simulator.handle_request(str(Message.read_request(address, 1)))
+
+        self.assertEqual(list(simulator.requests), ['r00010001F4', 'r00020001F5'])
+        self.assertEqual(simulator.request_count, 3)
+
+    def test_display(self):
+        '''
+        Test the display region.
+        '''
+        with Simulator(port=0) as simulator:
+            simulator.write_display('           25.3"', 'PRESSURE PROF. A')
+            machine = self._machine(simulator)
+            self.assertEqual(machine.current_brew_time, 25.3)
+            self.assertEqual(machine.display.split('\n')[1], 'PRESSURE PROF. A')
+
+    def test_display_rows(self):
+        '''
+        Test reading only some rows of the display.
+        '''
+        with Simulator(port=0) as simulator:
+            simulator.write_display('           25.3"', 'PRESSURE PROF. A')
+            machine = self._machine(simulator)
+            display = machine.settings['display']
+            self.assertEqual(display.read_rows(1, 2), ['PRESSURE PROF. A'])
+            self.assertTrue(simulator.requests[-1].startswith('rB0170010'))
+            state = display.get_state(rows=1)
+            self.assertEqual(state.rows, ('           25.3"',))
+            self.assertEqual((state.brew_time, state.screen), (25.3, 'brewing'))
+
+    def test_script(self):
+        '''
+        Test scripted values.
+        '''
+        def script(simulator, elapsed):
+            simulator.write(0xB000, bytes([simulator.read(0xB000, 1)[0] + 1]))
+
+        with Simulator(port=0, script=script) as simulator:
+            machine = self._machine(simulator)
+            self.assertEqual(machine.current_brew_boiler_temperature, 106)
+            self.assertEqual(machine.current_brew_boiler_temperature, 107)
+
+    def test_cache(self):
+        '''
+        Test if cached settings aren't read again until they're invalidated.
+        '''
+        with Simulator(port=0) as simulator:
+            machine = Machine(address=simulator.address, port=simulator.port, timeout=1.0, cache=True)
+            machine.connect()
+            self.addCleanup(machine.disconnect)
+
+            self.assertEqual(machine.language, 'English')
+            self.assertEqual(machine.language, 'English')
+            self.assertEqual(len(simulator.requests), 1)
+
+            machine.language = 'Italian'
+            self.assertEqual(machine.language, 'Italian')
+            self.assertEqual(len(simulator.requests), 3)
+
+            simulator.write(0x01, bytes([2]))
+            self.assertEqual(machine.language, 'Italian')
+            machine.refresh(['language'])
+            self.assertEqual(machine.language, 'French')
+
+            machine.read_many(['temperature_unit', 'language'])
+            self.assertEqual(machine.read_many(['temperature_unit', 'language']),
+                             {'temperature_unit': 'Celsius', 'language': 'French'})
+            self.assertEqual(len(simulator.requests), 5)
+
+            machine.refresh()
+            self.assertEqual(machine.cache_stats, {'hits': 5, 'misses': 4, 'entries': 0})
+
+    def test_short_reads(self):
+        '''
+        Test responses which are sent in several chunks.
+        '''
+        with Simulator(port=0, short_reads=True, seed=1) as simulator:
+            machine  = self._machine(simulator)
+            snapshot = machine.snapshot()
+            self.assertEqual(snapshot['display'].split('\n')[0], 'BREW BOIL. 105*C')
+
+    def test_latency(self):
+        '''
+        Test responses with latency & jitter.
+        '''
+        with Simulator(port=0, latency=0.01, jitter=0.01) as simulator:
+            machine = self._machine(simulator)
+            self.assertEqual(machine.total_coffee_count, 140)
+
+    def test_dropped_frames(self):
+        '''
+        Test if dropped responses are retried and eventually time out.
+        '''
+        with Simulator(port=0, drop_rate=1.0) as simulator:
+            machine = self._machine(simulator, timeout=0.05)
+            with self.assertRaises(socket.timeout):
+                machine.language  # pylint: disable=pointless-statement
+            self.assertEqual(len(simulator.requests), machine.retries)
+
+    def test_bad_checksums(self):
+        '''
+        Test if responses with invalid checksums are detected.
+        '''
+        with Simulator(port=0, corrupt_rate=1.0) as simulator:
+            machine = self._machine(simulator)
+            with self.assertRaises(ValidationError):
+                machine.language  # pylint: disable=pointless-statement
+
+    def test_loopback(self):
+        '''
+        Test the in-memory transport, which doesn't need a running simulator.
+        '''
+        simulator = Simulator(short_reads=True, seed=1)
+        machine   = Machine(timeout=0.05, pool=LoopbackPool(simulator))
+        machine.connect()
+
+        self.assertEqual(machine.language, 'English')
+        machine.language = 'Italian'
+        self.assertEqual(simulator.read(0x01, 1), bytes([3]))
+        self.assertEqual(machine.snapshot()['display'].split('\n')[0], 'BREW BOIL. 105*C')
+
+        simulator.drop_rate = 1.0
+        with self.assertRaises(socket.timeout):
+            machine.language  # pylint: disable=pointless-statement
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python
+# pylint: disable=no-self-use,unused-argument
+'''
+Unit test cases for the Rocket single-flight module.
+'''
+
+__all__ = (
+    'TestSingleFlight',
+    'TestAsyncSingleFlight',
+)
+
+import asyncio
+import logging
+import threading
+from time import sleep
+from unittest import TestCase, main
+
+from rocket_r60v.machine import Machine
+from rocket_r60v.simulator import Simulator, LoopbackPool
+from rocket_r60v.singleflight import SingleFlight, AsyncSingleFlight
+from rocket_r60v.timing import Deadline
+from rocket_r60v.exceptions import DeadlineExceededError
+
+logging.disable()
+
+
+class TestSingleFlight(TestCase):
+    '''
+    Test rocket.singleflight.SingleFlight class and its methods.
+    '''
+
+    def _call_concurrently(self, flight, function, count=4):
+        '''
+        Call a function concurrently, while the first call is blocked until
+        the other calls are made.
+        '''
+        started = threading.Event()
+        release = threading.Event()
+        results = []
+
+        def leader():
+            started.set()
+            release.wait()
+            return function()
+
+        def run(target):
+            try:
+                results.append(flight.call('key', target))
+            except ZeroDivisionError as ex:
+                results.append(ex)
+
+        threads = [threading.Thread(target=run, args=(leader,))]
+        threads[0].start()
+        started.wait()
+
+        threads += [threading.Thread(target=run, args=(function,)) for _ in range(count - 1)]
+        for thread in threads[1:]:
+            thread.start()
+
+        sleep(0.05)
+        release.set()
+
+        for thread in threads:
+            thread.join()
+
+        return results
+
+    def test_call(self):
+        '''
+        Test if concurrent identical calls are collapsed.
+        '''
+        flight = SingleFlight()
+        calls  = []
+
+        results = self._call_concurrently(flight, lambda: calls.append(1) or len(calls))
+
+        self.assertEqual(results, [1] * 4)
+        self.assertEqual(calls, [1])
+        self.assertEqual(len(flight), 0)
+        self.assertEqual(flight.call('key', lambda: 2), 2)
+
+    def test_exception(self):
+        '''
+        Test if the exception of a call is raised for all callers.
+        '''
+        flight  = SingleFlight()
+        results = self._call_concurrently(flight, lambda: 1 / 0)
+
+        self.assertEqual(len(results), 4)
+        self.assertTrue(all(isinstance(x, ZeroDivisionError) for x in results))
+        self.assertEqual(len(flight), 0)
+
+    def test_deadline(self):
+        '''
+        Test if the wait for a call in flight is limited by the deadline.
+        '''
+        flight  = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def leader():
+            started.set()
+            release.wait()
+            return 1
+
+        thread = threading.Thread(target=flight.call, args=('key', leader))
+        thread.start()
+        started.wait()
+
+        try:
+            with self.assertRaises(DeadlineExceededError):
+                flight.call('key', lambda: 2, deadline=Deadline(0.05))
+        finally:
+            release.set()
+            thread.join()
+
+        self.assertEqual(len(flight), 0)
+
+    def test_machine(self):
+        '''
+        Test if concurrent identical reads of a machine are collapsed.
+        '''
+        simulator = Simulator(latency=0.05)
+        machine   = Machine(timeout=1.0, pool=LoopbackPool(simulator))
+        machine.connect()
+        self.addCleanup(machine.pool.close_all)
+
+        barrier = threading.Barrier(8)
+        values  = []
+
+        def run():
+            barrier.wait()
+            values.append(machine.total_coffee_count)
+
+        threads = [threading.Thread(target=run) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(values, [140] * 8)
+        self.assertLess(len(simulator.requests), 8)
+
+
+class TestAsyncSingleFlight(TestCase):
+    '''
+    Test rocket.singleflight.AsyncSingleFlight class and its methods.
+    '''
+
+    def test_call(self):
+        '''
+        Test if concurrent identical calls are collapsed.
+        '''
+        flight = AsyncSingleFlight()
+        calls  = []
+
+        async def function(value):
+            calls.append(value)
+            await asyncio.sleep(0.01)
+            if value is None:
+                raise ZeroDivisionError()
+            return value
+
+        async def run():
+            self.assertEqual(await asyncio.gather(*(flight.call('a', function, 1) for _ in range(4))), [1] * 4)
+            self.assertEqual(await flight.call('a', function, 2), 2)
+
+            results = await asyncio.gather(*(flight.call('b', function, None) for _ in range(2)),
+                                           return_exceptions=True)
+            self.assertTrue(all(isinstance(x, ZeroDivisionError) for x in results))
+
+        asyncio.run(run())
+
+        self.assertEqual(calls, [1, 2, None])
+        self.assertEqual(len(flight), 0)
+
+    def test_cancel_leader(self):
+        '''
+        Test if the call is re-issued when the leader is cancelled.
+        '''
+        flight = AsyncSingleFlight()
+        calls  = []
+
+        async def function(value):
+            calls.append(value)
+            await asyncio.sleep(0.05)
+            return value
+
+        async def run():
+            leader    = asyncio.ensure_future(flight.call('a', function, 1))
+            await asyncio.sleep(0)
+            followers = [asyncio.ensure_future(flight.call('a', function, 2)) for _ in range(3)]
+            await asyncio.sleep(0)
+
+            leader.cancel()
+
+            self.assertEqual(await asyncio.gather(*followers), [2] * 3)
+
+            with self.assertRaises(asyncio.CancelledError):
+                await leader
+
+        asyncio.run(run())
+
+        self.assertEqual(calls, [1, 2])
+        self.assertEqual(len(flight), 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+'''
+Unit test cases for the Rocket telemetry module.
+'''
+
+__all__ = (
+    'TestTelemetry',
+)
+
+import asyncio
+import json
+import logging
+from unittest import TestCase, main
+
+from rocket_r60v.async_machine import AsyncMachine
+from rocket_r60v.machine import Machine
+from rocket_r60v.simulator import Simulator
+from rocket_r60v.telemetry import FORMATS, Sample, TelemetrySampler, parse_rate
+
+logging.disable()
+
+
+class TestTelemetry(TestCase):
+    '''
+    Test rocket.telemetry module.
+    '''
+
+    def test_parse_rate(self):
+        '''
+        Test the parsing of sample rates.
+        '''
+        self.assertEqual(parse_rate('10hz'), 10.0)
+        self.assertEqual(parse_rate('2.5Hz'), 2.5)
+        self.assertEqual(parse_rate('4'), 4.0)
+
+        for rate in ('0hz', '-1', 'fast'):
+            with self.assertRaises(ValueError):
+                parse_rate(rate)
+
+    def test_formats(self):
+        '''
+        Test the output formats.
+        '''
+        sample = Sample(1.5, 105, 123, None)
+
+        header, function = FORMATS['csv']
+        self.assertEqual(header, 'timestamp,brew_boiler_temperature,service_boiler_temperature,brew_time')
+        self.assertEqual(function(sample), '1.5,105,123,')
+
+        header, function = FORMATS['jsonl']
+        self.assertIsNone(header)
+        self.assertEqual(json.loads(function(sample))['brew_time'], None)
+
+    def test_samples(self):
+        '''
+        Test if the samples are read with a single message.
+        '''
+        with Simulator(port=0) as simulator:
+            simulator.write_display('           12.5"')
+
+            machine = Machine(address=simulator.address, port=simulator.port, timeout=1.0)
+            machine.connect()
+            self.addCleanup(machine.disconnect)
+
+            sampler = TelemetrySampler(machine, rate=1000)
+            samples = list(sampler.samples(count=3))
+
+            self.assertEqual(len(samples), 3)
+            self.assertEqual(samples[0][1:], (105, 123, 12.5))
+            self.assertEqual(list(simulator.requests), ['rB00000170C'] * 3)
+
+    def test_async_samples(self):
+        '''
+        Test the samples of the asyncio machine.
+        '''
+        async def test(simulator):
+            async with AsyncMachine(address=simulator.address, port=simulator.port, timeout=1.0) as machine:
+                sampler = TelemetrySampler(machine, rate=1000)
+                return [sample async for sample in sampler.async_samples(count=2)]
+
+        with Simulator(port=0) as simulator:
+            samples = asyncio.run(test(simulator))
+            self.assertEqual([x[1:] for x in samples], [(105, 123, None)] * 2)
+
+    def test_schedule(self):
+        '''
+        Test if the schedule doesn't drift and skips missed samples.
+        '''
+        now = [0.0]
+
+        sampler  = TelemetrySampler(Machine(), rate=10, clock=lambda: now[0])
+        schedule = sampler.schedule()
+
+        self.assertEqual(next(schedule), 0.0)
+        now[0] = 0.03
+        self.assertAlmostEqual(next(schedule), 0.07)
+        now[0] = 0.15
+        self.assertAlmostEqual(next(schedule), 0.05)
+        now[0] = 0.42
+        self.assertEqual(next(schedule), 0.0)
+        now[0] = 0.45
+        self.assertAlmostEqual(next(schedule), 0.05)
+        self.assertEqual(sampler.skipped, 1)
+
+
+if __name__ == '__main__':
+    main()
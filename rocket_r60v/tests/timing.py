@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+# pylint: disable=no-self-use,unused-argument
+'''
+Unit test cases for the Rocket timing module.
+'''
+
+__all__ = (
+    'TestTiming',
+    'TestMachineTiming',
+)
+
+import logging
+import socket
+import threading
+from concurrent.futures import Future
+from time import monotonic
+from unittest import TestCase, main
+
+from rocket_r60v.machine import Machine
+from rocket_r60v.simulator import Simulator, LoopbackPool
+from rocket_r60v.timing import RTTEstimator, RetryBudget, Deadline, backoff
+from rocket_r60v.exceptions import DeadlineExceededError
+
+logging.disable()
+
+
+class TestTiming(TestCase):
+    '''
+    Test rocket.timing classes and functions.
+    '''
+
+    def test_backoff(self):
+        '''
+        Test the jittered exponential backoff.
+        '''
+        self.assertEqual(backoff(1, base=0.1, maximum=1.0, rand=lambda: 1.0), 0.1)
+        self.assertEqual(backoff(3, base=0.1, maximum=1.0, rand=lambda: 1.0), 0.4)
+        self.assertEqual(backoff(10, base=0.1, maximum=1.0, rand=lambda: 1.0), 1.0)
+        self.assertEqual(backoff(10, base=0.1, maximum=1.0, rand=lambda: 0.5), 0.5)
+        self.assertTrue(all(0 <= backoff(2) <= 0.1 for _ in range(100)))
+
+    def test_rtt_estimator(self):
+        '''
+        Test if the timeout converges to the round-trip times.
+        '''
+        rtt = RTTEstimator(max_timeout=3.0, min_timeout=0.01)
+        self.assertEqual(rtt.timeout, 3.0)
+
+        rtt.add_sample(0.1)
+        self.assertAlmostEqual(rtt.timeout, 0.3)
+
+        for _ in range(50):
+            rtt.add_sample(0.1)
+        self.assertLess(rtt.timeout, 0.11)
+        self.assertGreaterEqual(rtt.timeout, 0.1)
+
+        rtt.add_timeout()
+        self.assertGreater(rtt.timeout, 0.2)
+
+        for _ in range(10):
+            rtt.add_timeout()
+        self.assertEqual(rtt.timeout, 3.0)
+
+        rtt = RTTEstimator(max_timeout=3.0, min_timeout=0.05)
+        rtt.add_sample(0.001)
+        self.assertEqual(rtt.timeout, 0.05)
+
+    def test_retry_budget(self):
+        '''
+        Test if retries are limited to a fraction of the successful requests.
+        '''
+        budget = RetryBudget(ratio=0.5, capacity=2)
+        self.assertTrue(budget.withdraw())
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+
+        budget.deposit()
+        self.assertFalse(budget.withdraw())
+        budget.deposit()
+        self.assertTrue(budget.withdraw())
+
+        for _ in range(10):
+            budget.deposit()
+        self.assertEqual(budget.tokens, 2)
+
+    def test_deadline(self):
+        '''
+        Test if timeouts are limited by the deadline.
+        '''
+        now      = [10.0]
+        deadline = Deadline(1.0, clock=lambda: now[0])
+
+        self.assertEqual(deadline.timeout(3.0), 1.0)
+        self.assertEqual(deadline.timeout(0.5), 0.5)
+
+        now[0] = 11.0
+        with self.assertRaises(DeadlineExceededError):
+            deadline.timeout(3.0)
+
+    def test_deadline_waits(self):
+        '''
+        Test if the waits for locks & futures are limited by the deadline.
+        '''
+        lock   = threading.Lock()
+        future = Future()
+
+        deadline = Deadline(0.05)
+        deadline.acquire(lock)
+
+        with self.assertRaises(DeadlineExceededError):
+            deadline.acquire(lock)
+        with self.assertRaises(DeadlineExceededError):
+            deadline.result(future)
+
+        future.set_result(1)
+        self.assertEqual(deadline.result(future), 1)
+
+
+class TestMachineTiming(TestCase):
+    '''
+    Test the timeouts, retries & deadlines of rocket.machine.Machine.
+    '''
+
+    def _machine(self, simulator, **kwargs):
+        '''
+        Create a machine which is connected to an in-memory simulator.
+        '''
+        machine = Machine(pool=LoopbackPool(simulator), **kwargs)
+        machine.retry_backoff = 0.001
+        machine.connect()
+        self.addCleanup(machine.pool.close_all)
+        return machine
+
+    def test_adaptive_timeout(self):
+        '''
+        Test if the timeout adapts to the round-trip times.
+        '''
+        machine = self._machine(Simulator(latency=0.002), timeout=3.0)
+
+        for _ in range(10):
+            machine.total_coffee_count  # pylint: disable=pointless-statement
+
+        self.assertLess(machine.connection.rtt.timeout, 1.0)
+
+    def test_retry_budget(self):
+        '''
+        Test if retries stop when the retry budget is exhausted.
+        '''
+        simulator = Simulator(drop_rate=1.0)
+        machine   = self._machine(simulator, timeout=0.05)
+
+        machine.connection.budget.tokens = 3
+
+        for _ in range(3):
+            with self.assertRaises(socket.timeout):
+                machine.language  # pylint: disable=pointless-statement
+
+        self.assertEqual(len(simulator.requests), 3 + 3)
+
+    def test_deadline(self):
+        '''
+        Test if a deadline limits a batch operation and not its rollback.
+        '''
+        simulator = Simulator()
+        machine   = self._machine(simulator, timeout=0.05)
+
+        with machine.deadline(0.0):
+            with self.assertRaises(DeadlineExceededError):
+                machine.snapshot()
+
+        with machine.deadline(10.0):
+            with machine.deadline(0.0):
+                with self.assertRaises(DeadlineExceededError):
+                    machine.language  # pylint: disable=pointless-statement
+            with machine.deadline(None):
+                self.assertEqual(machine.language, 'English')
+            self.assertEqual(machine.language, 'English')
+
+        self.assertEqual(len(simulator.requests), 2)
+
+    def test_deadline_lock(self):
+        '''
+        Test if the wait for the connection lock, which is held by another
+        thread, is limited by the deadline.
+        '''
+        machine  = self._machine(Simulator(), timeout=3.0)
+        acquired = threading.Event()
+        release  = threading.Event()
+
+        def hold():
+            with machine.connection.lock:
+                acquired.set()
+                release.wait()
+
+        thread = threading.Thread(target=hold)
+        thread.start()
+        acquired.wait()
+
+        try:
+            start = monotonic()
+            with machine.deadline(0.2):
+                with self.assertRaises(DeadlineExceededError):
+                    machine.language  # pylint: disable=pointless-statement
+            self.assertLess(monotonic() - start, 1.0)
+        finally:
+            release.set()
+            thread.join()
+
+        self.assertEqual(machine.language, 'English')
+
+    def test_late_response(self):
+        '''
+        Test if the late response of a timed out message is dropped instead
+        of being returned for the next message.
+        '''
+        with Simulator(port=0, latency=0.5) as simulator:
+            machine = Machine(address=simulator.address, port=simulator.port, timeout=0.3)
+            machine.retries = 1
+            machine.connect()
+            self.addCleanup(machine.disconnect)
+
+            with self.assertRaises(socket.timeout):
+                machine.brew_boiler_temperature  # pylint: disable=pointless-statement
+
+            simulator.latency = 0.0
+
+            self.assertEqual(machine.total_coffee_count, 140)
+            self.assertFalse(machine.connection.protocol.pending)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# pylint: disable=no-self-use,unused-argument
+'''
+Unit test cases for the Rocket I/O worker module.
+'''
+
+__all__ = (
+    'TestIOWorker',
+    'TestThreadedMachine',
+)
+
+import logging
+import threading
+from unittest import TestCase, main
+
+from rocket_r60v.machine import Machine
+from rocket_r60v.simulator import Simulator, LoopbackPool
+from rocket_r60v.worker import IOWorker, PRIORITY_WRITE, PRIORITY_READ, PRIORITY_POLL
+
+logging.disable()
+
+
+class TestIOWorker(TestCase):
+    '''
+    Test rocket.worker.IOWorker class and its methods.
+    '''
+
+    def setUp(self):
+        '''
+        Create a worker.
+        '''
+        self.worker = IOWorker()
+        self.addCleanup(self.worker.stop)
+
+    def test_submit(self):
+        '''
+        Test if the results & exceptions of jobs are returned as futures.
+        '''
+        self.assertEqual(self.worker.submit(PRIORITY_READ, sum, [1, 2]).result(), 3)
+        self.assertTrue(self.worker.submit(PRIORITY_READ, lambda: self.worker.is_current).result())
+        self.assertFalse(self.worker.is_current)
+
+        with self.assertRaises(ZeroDivisionError):
+            self.worker.submit(PRIORITY_READ, lambda: 1 / 0).result()
+
+    def test_priority(self):
+        '''
+        Test if queued jobs are executed by priority, then in order.
+        '''
+        executed = []
+        blocker  = threading.Event()
+
+        self.worker.submit(PRIORITY_READ, blocker.wait)
+
+        futures = [
+            self.worker.submit(PRIORITY_POLL, executed.append, 'poll'),
+            self.worker.submit(PRIORITY_READ, executed.append, 'read 1'),
+            self.worker.submit(PRIORITY_WRITE, executed.append, 'write'),
+            self.worker.submit(PRIORITY_READ, executed.append, 'read 2'),
+        ]
+
+        blocker.set()
+
+        for future in futures:
+            future.result()
+
+        self.assertEqual(executed, ['write', 'read 1', 'read 2', 'poll'])
+
+    def test_stop(self):
+        '''
+        Test if queued jobs are executed before the worker stops.
+        '''
+        future = self.worker.submit(PRIORITY_POLL, sum, [1])
+        self.worker.stop()
+
+        self.assertEqual(future.result(timeout=0), 1)
+        self.assertIsNone(self.worker.thread)
+        self.assertEqual(self.worker.submit(PRIORITY_READ, sum, [2]).result(), 2)
+
+
+class TestThreadedMachine(TestCase):
+    '''
+    Test rocket.machine.Machine class with the I/O worker.
+    '''
+
+    def test_threads(self):
+        '''
+        Test if multiple threads can share a single connection.
+        '''
+        simulator = Simulator()
+        machine   = Machine(timeout=0.5, pool=LoopbackPool(simulator), threaded=True)
+        machine.connect()
+        self.addCleanup(machine.pool.close_all)
+
+        errors = []
+
+        def run(index):
+            try:
+                for _ in range(20):
+                    if index % 2:
+                        machine.language = 'Italian'
+                    else:
+                        with machine.priority(PRIORITY_POLL):
+                            self.assertEqual(machine.read_many(['temperature_unit']), {'temperature_unit': 'Celsius'})
+                    self.assertEqual(machine.total_coffee_count, 140)
+            except Exception as ex:  # pylint: disable=broad-except
+                errors.append(ex)
+
+        threads = [threading.Thread(target=run, args=(x,)) for x in range(8)]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(machine.language, 'Italian')
+        self.assertIsNotNone(machine.connection.worker.thread)
+
+
+if __name__ == '__main__':
+    main()
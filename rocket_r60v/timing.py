@@ -0,0 +1,222 @@
+'''
+Rocket timing module.
+'''
+
+__all__ = (
+    'RTTEstimator',
+    'RetryBudget',
+    'Deadline',
+    'backoff',
+)
+
+import logging
+import random
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from time import monotonic
+
+from .exceptions import DeadlineExceededError
+
+LOGGER = logging.getLogger(__name__)
+
+
+def backoff(attempt, base=0.05, maximum=2.0, rand=random.random):
+    '''
+    Get the jittered exponential backoff delay of a retry.
+
+    The delay is drawn uniformly between zero and the exponential delay
+    ("full jitter"), so that retries of multiple clients don't synchronise.
+
+    :param int attempt: The number of the failed attempt (starting at ``1``)
+    :param float base: The delay of the first retry in seconds
+    :param float maximum: The max. delay in seconds
+    :param callable rand: Returns a random number in ``[0, 1)``
+
+    :return: The delay in seconds
+    :rtype: float
+    '''
+    return rand() * min(maximum, base * 2 ** (attempt - 1))
+
+
+class RTTEstimator:
+    '''
+    Estimates the round-trip time of a connection and derives the timeout of
+    the responses from it (see RFC 6298).
+
+    The timeout starts with the max. timeout, and then converges to the
+    smoothed RTT plus four times its variation. Timeouts double the timeout
+    until the next RTT sample is added.
+    '''
+    alpha = 1 / 8
+    beta  = 1 / 4
+
+    def __init__(self, max_timeout, min_timeout=0.05):
+        '''
+        Constructor.
+
+        :param float max_timeout: The max. (and initial) timeout in seconds
+        :param float min_timeout: The min. timeout in seconds
+        '''
+        self.max_timeout = max_timeout
+        self.min_timeout = min(min_timeout, max_timeout)
+        self.srtt        = None
+        self.rttvar      = None
+        self.timeout     = max_timeout
+        self.lock        = threading.Lock()
+
+    def add_sample(self, rtt):
+        '''
+        Add a measured round-trip time.
+
+        Only round-trips of messages which weren't retried must be added, as
+        the response of a retried message can't be assigned to an attempt.
+
+        :param float rtt: The round-trip time in seconds
+        '''
+        with self.lock:
+            if self.srtt is None:
+                self.srtt   = rtt
+                self.rttvar = rtt / 2
+            else:
+                self.rttvar = (1 - self.beta) * self.rttvar + self.beta * abs(self.srtt - rtt)
+                self.srtt   = (1 - self.alpha) * self.srtt + self.alpha * rtt
+
+            self.timeout = max(self.min_timeout, min(self.max_timeout, self.srtt + 4 * self.rttvar))
+
+    def add_timeout(self):
+        '''
+        Back off the timeout after a response timed out.
+        '''
+        with self.lock:
+            self.timeout = min(self.max_timeout, self.timeout * 2)
+
+        LOGGER.debug('Response timeout backed off to %.3fs', self.timeout)
+
+
+class RetryBudget:
+    '''
+    A token bucket which limits the retries of a machine to a fraction of its
+    successful requests, so that a flaky machine isn't hammered with retries.
+
+    Each successful request deposits ``ratio`` tokens, each retry withdraws a
+    whole token. The bucket starts full.
+    '''
+
+    def __init__(self, ratio=0.2, capacity=10.0):
+        '''
+        Constructor.
+
+        :param float ratio: The tokens deposited per successful request
+        :param float capacity: The max. number of tokens
+        '''
+        self.ratio    = ratio
+        self.capacity = capacity
+        self.tokens   = capacity
+        self.lock     = threading.Lock()
+
+    def deposit(self):
+        '''
+        Deposit the tokens of a successful request.
+        '''
+        with self.lock:
+            self.tokens = min(self.capacity, self.tokens + self.ratio)
+
+    def withdraw(self):
+        '''
+        Withdraw the token of a retry.
+
+        :return: ``True`` if the retry is allowed
+        :rtype: bool
+        '''
+        with self.lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+class Deadline:
+    '''
+    The absolute deadline of a call, which limits the timeouts and backoffs
+    of all messages sent during the call, as well as the waits for locks and
+    the results of other threads.
+    '''
+    __slots__ = ('expires', 'clock')
+
+    def __init__(self, seconds, clock=monotonic):
+        '''
+        Constructor.
+
+        :param float seconds: The seconds until the deadline
+        :param callable clock: The clock which returns the current time in seconds
+        '''
+        self.clock   = clock
+        self.expires = clock() + seconds
+
+    def remaining(self):
+        '''
+        The seconds until the deadline.
+
+        :return: The seconds (negative if the deadline is exceeded)
+        :rtype: float
+        '''
+        return self.expires - self.clock()
+
+    def timeout(self, timeout):
+        '''
+        Limit a timeout to the deadline.
+
+        :param float timeout: The timeout in seconds
+
+        :return: The limited timeout in seconds
+        :rtype: float
+
+        :raises rocket.exceptions.DeadlineExceededError: When the deadline is exceeded
+        '''
+        remaining = self.remaining()
+
+        if remaining <= 0:
+            self.raise_exceeded()
+
+        return min(timeout, remaining)
+
+    def raise_exceeded(self):
+        '''
+        Raise that the deadline is exceeded.
+
+        :raises rocket.exceptions.DeadlineExceededError: Always
+        '''
+        exceeded = max(-self.remaining(), 0.0)
+        error    = 'Deadline exceeded by %.3fs'
+        LOGGER.error(error, exceeded)
+        raise DeadlineExceededError(error % exceeded)
+
+    def acquire(self, lock):
+        '''
+        Acquire a lock before the deadline.
+
+        :param lock: The lock
+        :type lock: threading.Lock or threading.RLock
+
+        :raises rocket.exceptions.DeadlineExceededError: When the deadline is exceeded
+        '''
+        if not lock.acquire(timeout=max(self.remaining(), 0.0)):
+            self.raise_exceeded()
+
+    def result(self, future):
+        '''
+        Wait for the result of a future before the deadline.
+
+        :param concurrent.futures.Future future: The future
+
+        :return: The result of the future
+        :rtype: mixed
+
+        :raises rocket.exceptions.DeadlineExceededError: When the deadline is exceeded
+        '''
+        try:
+            return future.result(timeout=max(self.remaining(), 0.0))
+        except FutureTimeoutError:
+            if future.done():
+                raise
+            self.raise_exceeded()
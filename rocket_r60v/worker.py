@@ -0,0 +1,131 @@
+'''
+Rocket I/O worker module.
+'''
+
+__all__ = (
+    'PRIORITY_WRITE',
+    'PRIORITY_READ',
+    'PRIORITY_POLL',
+    'IOWorker',
+)
+
+import itertools
+import logging
+import queue
+import sys
+import threading
+from concurrent.futures import Future
+
+LOGGER = logging.getLogger(__name__)
+
+PRIORITY_WRITE = 0
+PRIORITY_READ  = 1
+PRIORITY_POLL  = 2
+
+
+class IOWorker:
+    '''
+    A worker thread, which executes all I/O jobs of a connection one after
+    another, so that multiple threads can safely share a single connection.
+
+    The jobs are queued by priority (lower values first) and then in the
+    order of their submission. Thus interactive writes are executed before
+    user reads, which are executed before background polling.
+    '''
+
+    def __init__(self, name='rocket-io'):
+        '''
+        Constructor.
+
+        :param str name: The name of the thread
+        '''
+        self.name    = name
+        self.queue   = queue.PriorityQueue()
+        self.counter = itertools.count()
+        self.lock    = threading.Lock()
+        self.local   = threading.local()
+        self.thread  = None
+
+    def __len__(self):
+        '''
+        The number of queued jobs.
+
+        :return: The number of jobs
+        :rtype: int
+        '''
+        return self.queue.qsize()
+
+    @property
+    def is_current(self):
+        '''
+        Flag if the current thread is the worker thread.
+
+        :return: The flag
+        :rtype: bool
+        '''
+        return getattr(self.local, 'current', False)
+
+    def start(self):
+        '''
+        Start the worker thread, if it's not running yet.
+        '''
+        with self.lock:
+            if self.thread is None:
+                LOGGER.debug('Starting I/O worker "%s"…', self.name)
+                self.thread = threading.Thread(target=self.run, name=self.name, daemon=True)
+                self.thread.start()
+
+    def stop(self):
+        '''
+        Stop the worker thread after all queued jobs are executed.
+        '''
+        with self.lock:
+            thread, self.thread = self.thread, None
+
+            if thread is None:
+                return
+
+            LOGGER.debug('Stopping I/O worker "%s"…', self.name)
+            self.queue.put((sys.maxsize, next(self.counter), None, None, (), {}))
+
+        if thread is not threading.current_thread():
+            thread.join()
+
+    def submit(self, priority, function, *args, **kwargs):
+        '''
+        Submit a job to the worker.
+
+        :param int priority: The priority (e.g. :py:data:`PRIORITY_READ`)
+        :param callable function: The function to execute
+        :param args: The positional arguments of the function
+        :param kwargs: The keyword arguments of the function
+
+        :return: The future of the function's result
+        :rtype: concurrent.futures.Future
+        '''
+        future = Future()
+
+        self.start()
+        self.queue.put((priority, next(self.counter), future, function, args, kwargs))
+
+        return future
+
+    def run(self):
+        '''
+        Execute the queued jobs until the worker is stopped.
+        '''
+        self.local.current = True
+
+        while True:
+            _, _, future, function, args, kwargs = self.queue.get()
+
+            if future is None:
+                break
+
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                future.set_result(function(*args, **kwargs))
+            except BaseException as ex:  # pylint: disable=broad-except
+                future.set_exception(ex)
@@ -16,7 +16,7 @@ setup(
     description='Python API for the Rocket R 60V',
     long_description=open('README.rst').read(),
     url='https://github.com/confirm/Rocket-R60V',
-    packages=find_packages(exclude=['tests']),
+    packages=find_packages(exclude=['tests', 'benchmarks']),
     scripts=[
         'rocket-r60v',
     ],